@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# SHOUT / WHISPER throughput and latency between two Clients on one host
+#
+#   $ python benchmarks/bench_client.py
+#   $ python benchmarks/bench_client.py --sizes 16,65536 --count 5000 --curve
+#
+# the nodes find each other over gossip on ipc:// endpoints, no multicast or network interface is needed.
+# every message carries the send time in its first frame, the receiver records the delta so latency includes
+# both actor hops and the zyre transport.
+
+from __future__ import print_function
+
+import json
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+
+import zmq
+
+# the checkout's czmq and pyzyre, not whatever is installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from czmq import Zcert
+from pyzyre.client import Client, DefaultHandler
+
+SIZES = [16, 256, 4096, 65536, 1048576, 4194304]
+COUNT = 10000
+BUDGET = 256 * 1024 * 1024  # cap the bytes moved per size so large payloads finish in reasonable time
+GROUP = 'BENCH'
+STAMP = struct.Struct('>d')
+
+
+class Receiver(DefaultHandler):
+
+    def __init__(self):
+        self.latencies = []
+        self.expected = 0
+        self.done = threading.Event()
+
+    def _record(self, event):
+        self.latencies.append(time.time() - STAMP.unpack(event.frames[event.offset].bytes)[0])
+        if len(self.latencies) >= self.expected:
+            self.done.set()
+
+    def on_shout(self, client, event):
+        self._record(event)
+
+    def on_whisper(self, client, event):
+        self._record(event)
+
+    def reset(self, expected):
+        self.latencies = []
+        self.expected = expected
+        self.done.clear()
+
+
+def _percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def _receive(client, stop):
+    while not stop.is_set():
+        if client.actor.poll(100):
+            client.handle_messages(client.actor, zmq.POLLIN)
+
+
+def _wait_for(client, name, timeout=10):
+    # drain the sender's events until it has seen the receiver join the benchmark group
+    end = time.time() + timeout
+    while time.time() < end:
+        if client.actor.poll(100):
+            client.handle_messages(client.actor, zmq.POLLIN)
+
+        if any(p.name == name for p in client.peers_in(GROUP)):
+            return
+
+    raise RuntimeError('peers did not discover each other')
+
+
+def run(mode, sender, receiver, handler, size, count):
+    payload = os.urandom(size)
+    handler.reset(count)
+
+    start = time.time()
+    for _ in range(count):
+        frames = [STAMP.pack(time.time()), payload]
+        if mode == 'SHOUT':
+            sender.shout(GROUP, frames)
+        else:
+            sender.whisper(frames, receiver.name)
+
+    if not handler.done.wait(max(30, count * size / float(50 * 1024 * 1024))):
+        print('{} {}: only {}/{} messages arrived'.format(mode, size, len(handler.latencies), count),
+              file=sys.stderr)
+
+    elapsed = time.time() - start
+    received = len(handler.latencies)
+
+    return {
+        'mode': mode,
+        'size': size,
+        'sent': count,
+        'received': received,
+        'msgs_per_sec': received / elapsed,
+        'mb_per_sec': received * size / elapsed / (1024 * 1024),
+        'p50_ms': _percentile(handler.latencies, 0.50) * 1000 if received else float('nan'),
+        'p99_ms': _percentile(handler.latencies, 0.99) * 1000 if received else float('nan'),
+    }
+
+
+def main():
+    p = ArgumentParser(description='pyzyre Client micro-benchmarks', prog='bench_client')
+    p.add_argument('--sizes', help='comma separated payload sizes in bytes [default %(default)s]',
+                   default=','.join(str(s) for s in SIZES))
+    p.add_argument('--count', help='messages per size [default %(default)s]', type=int, default=COUNT)
+    p.add_argument('--modes', help='SHOUT,WHISPER [default %(default)s]', default='SHOUT,WHISPER')
+    p.add_argument('--curve', help='enable CURVE between the nodes', action='store_true')
+    p.add_argument('--json', help='print results as json lines', action='store_true')
+
+    args = p.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix='pyzyre-bench-')
+    gossip = 'ipc://%s/gossip.ipc' % tmp
+
+    rx_args = {'group': GROUP, 'name': 'bench-rx', 'gossip_bind': gossip, 'endpoint': 'ipc://%s/rx.ipc' % tmp}
+    tx_args = {'group': GROUP, 'name': 'bench-tx', 'gossip_connect': gossip, 'endpoint': 'ipc://%s/tx.ipc' % tmp}
+
+    auth = None
+    if args.curve:
+        from zmq.auth.thread import ThreadAuthenticator
+        auth = ThreadAuthenticator(zmq.Context.instance())
+        auth.start()
+        auth.configure_curve(domain='*', location=zmq.auth.CURVE_ALLOW_ANY)
+
+        rx_args['cert'] = Zcert()
+        tx_args['cert'] = Zcert()
+        tx_args['gossip_publickey'] = rx_args['cert'].public_txt()
+
+    handler = Receiver()
+    receiver = Client(handler=handler, **rx_args)
+    receiver.start_zyre()
+
+    sender = Client(**tx_args)
+    sender.start_zyre()
+
+    _wait_for(sender, receiver.name)
+
+    stop = threading.Event()
+    t = threading.Thread(target=_receive, args=(receiver, stop))
+    t.daemon = True
+    t.start()
+
+    if not args.json:
+        print('{:<8} {:>9} {:>7} {:>12} {:>10} {:>9} {:>9}'.format('mode', 'size', 'count', 'msgs/s', 'MB/s',
+                                                                  'p50 ms', 'p99 ms'))
+
+    try:
+        for size in [int(s) for s in args.sizes.split(',')]:
+            count = max(10, min(args.count, BUDGET // size))
+            for mode in args.modes.upper().split(','):
+                r = run(mode, sender, receiver, handler, size, count)
+                r['curve'] = args.curve
+
+                if args.json:
+                    print(json.dumps(r))
+                    continue
+
+                print('{mode:<8} {size:>9} {received:>7} {msgs_per_sec:>12.0f} {mb_per_sec:>10.2f} '
+                      '{p50_ms:>9.3f} {p99_ms:>9.3f}'.format(**r))
+
+    finally:
+        stop.set()
+        t.join()
+
+        sender.stop_zyre()
+        receiver.stop_zyre()
+
+        if auth:
+            auth.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -7,12 +7,10 @@ from __future__ import print_function
 import os, sys
 from ctypes import *
 from ctypes.util import find_library
+from . import _library  # kept out of czmq's namespace, zyre imports it as czmq._library
 
 # load libc to access free, etc.
-libcpath = find_library("c")
-if not libcpath:
-    raise ImportError("Unable to find libc")
-libc = cdll.LoadLibrary(libcpath)
+libc = _library.load_libc()
 libc.free.argtypes = [c_void_p]
 libc.free.restype = None
 
@@ -22,38 +20,22 @@ def return_fresh_string(char_p):
     return s
 
 # czmq
-lib = None
-# check to see if the shared object was embedded locally, attempt to load it
-# if not, try to load it using the default system paths...
-# we need to use os.chdir instead of trying to modify $LD_LIBRARY_PATH and reloading the interpreter
-t = os.getcwd()
-p = os.path.join(os.path.dirname(__file__), '..')  # find the path to our $project_ctypes.py
-os.chdir(p)  # change directories briefly
-
-try:
-    from czmq import libczmq                        # attempt to import the shared lib if it exists
-    lib = CDLL(libczmq.__file__)             # if it exists try to load the shared lib
-except ImportError:
-    pass
-finally:
-    os.chdir(t)  # switch back to orig dir
-
-if not lib:
-    try:
-        # If LD_LIBRARY_PATH or your OSs equivalent is set, this is the only way to
-        # load the library.  If we use find_library below, we get the wrong result.
-        if os.name == 'posix':
-            if sys.platform == 'darwin':
-                lib = cdll.LoadLibrary('libczmq.4.dylib')
-            else:
-                lib = cdll.LoadLibrary("libczmq.so.4")
-        elif os.name == 'nt':
-            lib = cdll.LoadLibrary('libczmq.dll')
-    except OSError:
-        libpath = find_library("czmq")
-        if not libpath:
-            raise ImportError("Unable to find libczmq")
-        lib = cdll.LoadLibrary(libpath)
+# use the shared object embedded next to this file if there is one, else the system library. the loader
+# never changes directory and caches the resolved path in $PYZYRE_LIBCZMQ, see _library.py
+if os.name == 'posix':
+    if sys.platform == 'darwin':
+        _soname = 'libczmq.4.dylib'
+    else:
+        _soname = 'libczmq.so.4'
+else:
+    _soname = 'libczmq.dll'
+
+_here = os.path.dirname(os.path.abspath(__file__))
+lib = _library.load_library('czmq', _soname, 'PYZYRE_LIBCZMQ', _here,
+                            depends=[_library.embedded(_here, 'zmq')])
+
+# resolve function prototypes on first use, see _library.py
+lib = _library.LazyLibrary(lib)
 
 class zsock_t(Structure):
     pass # Empty - only for type checking
@@ -238,24 +220,15 @@ def coerce_py_file(obj):
 # zactor
 zactor_fn = CFUNCTYPE(None, zsock_p, c_void_p)
 zactor_destructor_fn = CFUNCTYPE(None, zactor_p)
-lib.zactor_new.restype = zactor_p
-lib.zactor_new.argtypes = [zactor_fn, c_void_p]
-lib.zactor_destroy.restype = None
-lib.zactor_destroy.argtypes = [POINTER(zactor_p)]
-lib.zactor_send.restype = c_int
-lib.zactor_send.argtypes = [zactor_p, POINTER(zmsg_p)]
-lib.zactor_recv.restype = zmsg_p
-lib.zactor_recv.argtypes = [zactor_p]
-lib.zactor_is.restype = c_bool
-lib.zactor_is.argtypes = [c_void_p]
-lib.zactor_resolve.restype = c_void_p
-lib.zactor_resolve.argtypes = [c_void_p]
-lib.zactor_sock.restype = zsock_p
-lib.zactor_sock.argtypes = [zactor_p]
-lib.zactor_set_destructor.restype = None
-lib.zactor_set_destructor.argtypes = [zactor_p, zactor_destructor_fn]
-lib.zactor_test.restype = None
-lib.zactor_test.argtypes = [c_bool]
+lib.prototype('zactor_new', zactor_p, [zactor_fn, c_void_p])
+lib.prototype('zactor_destroy', None, [POINTER(zactor_p)])
+lib.prototype('zactor_send', c_int, [zactor_p, POINTER(zmsg_p)])
+lib.prototype('zactor_recv', zmsg_p, [zactor_p])
+lib.prototype('zactor_is', c_bool, [c_void_p])
+lib.prototype('zactor_resolve', c_void_p, [c_void_p])
+lib.prototype('zactor_sock', zsock_p, [zactor_p])
+lib.prototype('zactor_set_destructor', None, [zactor_p, zactor_destructor_fn])
+lib.prototype('zactor_test', None, [c_bool])
 
 class Zactor(object):
     """
@@ -358,36 +331,21 @@ to work with the zsock instance rather than the actor.
 
 
 # zargs
-lib.zargs_new.restype = zargs_p
-lib.zargs_new.argtypes = [c_int, POINTER(c_char_p)]
-lib.zargs_destroy.restype = None
-lib.zargs_destroy.argtypes = [POINTER(zargs_p)]
-lib.zargs_progname.restype = c_char_p
-lib.zargs_progname.argtypes = [zargs_p]
-lib.zargs_arguments.restype = c_size_t
-lib.zargs_arguments.argtypes = [zargs_p]
-lib.zargs_first.restype = c_char_p
-lib.zargs_first.argtypes = [zargs_p]
-lib.zargs_next.restype = c_char_p
-lib.zargs_next.argtypes = [zargs_p]
-lib.zargs_param_first.restype = c_char_p
-lib.zargs_param_first.argtypes = [zargs_p]
-lib.zargs_param_next.restype = c_char_p
-lib.zargs_param_next.argtypes = [zargs_p]
-lib.zargs_param_name.restype = c_char_p
-lib.zargs_param_name.argtypes = [zargs_p]
-lib.zargs_get.restype = c_char_p
-lib.zargs_get.argtypes = [zargs_p, c_char_p]
-lib.zargs_getx.restype = c_char_p
-lib.zargs_getx.argtypes = [zargs_p, c_char_p]
-lib.zargs_has.restype = c_bool
-lib.zargs_has.argtypes = [zargs_p, c_char_p]
-lib.zargs_hasx.restype = c_bool
-lib.zargs_hasx.argtypes = [zargs_p, c_char_p]
-lib.zargs_print.restype = None
-lib.zargs_print.argtypes = [zargs_p]
-lib.zargs_test.restype = None
-lib.zargs_test.argtypes = [c_bool]
+lib.prototype('zargs_new', zargs_p, [c_int, POINTER(c_char_p)])
+lib.prototype('zargs_destroy', None, [POINTER(zargs_p)])
+lib.prototype('zargs_progname', c_char_p, [zargs_p])
+lib.prototype('zargs_arguments', c_size_t, [zargs_p])
+lib.prototype('zargs_first', c_char_p, [zargs_p])
+lib.prototype('zargs_next', c_char_p, [zargs_p])
+lib.prototype('zargs_param_first', c_char_p, [zargs_p])
+lib.prototype('zargs_param_next', c_char_p, [zargs_p])
+lib.prototype('zargs_param_name', c_char_p, [zargs_p])
+lib.prototype('zargs_get', c_char_p, [zargs_p, c_char_p])
+lib.prototype('zargs_getx', c_char_p, [zargs_p, c_char_p])
+lib.prototype('zargs_has', c_bool, [zargs_p, c_char_p])
+lib.prototype('zargs_hasx', c_bool, [zargs_p, c_char_p])
+lib.prototype('zargs_print', None, [zargs_p])
+lib.prototype('zargs_test', None, [c_bool])
 
 class Zargs(object):
     """
@@ -541,40 +499,23 @@ parameters, or value for which zargs_param_empty (arg) returns true.
 
 
 # zarmour
-lib.zarmour_new.restype = zarmour_p
-lib.zarmour_new.argtypes = []
-lib.zarmour_destroy.restype = None
-lib.zarmour_destroy.argtypes = [POINTER(zarmour_p)]
-lib.zarmour_encode.restype = POINTER(c_char)
-lib.zarmour_encode.argtypes = [zarmour_p, c_void_p, c_size_t]
-lib.zarmour_decode.restype = zchunk_p
-lib.zarmour_decode.argtypes = [zarmour_p, c_char_p]
-lib.zarmour_mode.restype = c_int
-lib.zarmour_mode.argtypes = [zarmour_p]
-lib.zarmour_mode_str.restype = c_char_p
-lib.zarmour_mode_str.argtypes = [zarmour_p]
-lib.zarmour_set_mode.restype = None
-lib.zarmour_set_mode.argtypes = [zarmour_p, c_int]
-lib.zarmour_pad.restype = c_bool
-lib.zarmour_pad.argtypes = [zarmour_p]
-lib.zarmour_set_pad.restype = None
-lib.zarmour_set_pad.argtypes = [zarmour_p, c_bool]
-lib.zarmour_pad_char.restype = char_p
-lib.zarmour_pad_char.argtypes = [zarmour_p]
-lib.zarmour_set_pad_char.restype = None
-lib.zarmour_set_pad_char.argtypes = [zarmour_p, char_p]
-lib.zarmour_line_breaks.restype = c_bool
-lib.zarmour_line_breaks.argtypes = [zarmour_p]
-lib.zarmour_set_line_breaks.restype = None
-lib.zarmour_set_line_breaks.argtypes = [zarmour_p, c_bool]
-lib.zarmour_line_length.restype = c_size_t
-lib.zarmour_line_length.argtypes = [zarmour_p]
-lib.zarmour_set_line_length.restype = None
-lib.zarmour_set_line_length.argtypes = [zarmour_p, c_size_t]
-lib.zarmour_print.restype = None
-lib.zarmour_print.argtypes = [zarmour_p]
-lib.zarmour_test.restype = None
-lib.zarmour_test.argtypes = [c_bool]
+lib.prototype('zarmour_new', zarmour_p, [])
+lib.prototype('zarmour_destroy', None, [POINTER(zarmour_p)])
+lib.prototype('zarmour_encode', POINTER(c_char), [zarmour_p, c_void_p, c_size_t])
+lib.prototype('zarmour_decode', zchunk_p, [zarmour_p, c_char_p])
+lib.prototype('zarmour_mode', c_int, [zarmour_p])
+lib.prototype('zarmour_mode_str', c_char_p, [zarmour_p])
+lib.prototype('zarmour_set_mode', None, [zarmour_p, c_int])
+lib.prototype('zarmour_pad', c_bool, [zarmour_p])
+lib.prototype('zarmour_set_pad', None, [zarmour_p, c_bool])
+lib.prototype('zarmour_pad_char', char_p, [zarmour_p])
+lib.prototype('zarmour_set_pad_char', None, [zarmour_p, char_p])
+lib.prototype('zarmour_line_breaks', c_bool, [zarmour_p])
+lib.prototype('zarmour_set_line_breaks', None, [zarmour_p, c_bool])
+lib.prototype('zarmour_line_length', c_size_t, [zarmour_p])
+lib.prototype('zarmour_set_line_length', None, [zarmour_p, c_size_t])
+lib.prototype('zarmour_print', None, [zarmour_p])
+lib.prototype('zarmour_test', None, [c_bool])
 
 class Zarmour(object):
     """
@@ -727,48 +668,27 @@ it was prior to encoding.
 
 
 # zcert
-lib.zcert_new.restype = zcert_p
-lib.zcert_new.argtypes = []
-lib.zcert_destroy.restype = None
-lib.zcert_destroy.argtypes = [POINTER(zcert_p)]
-lib.zcert_new_from.restype = zcert_p
-lib.zcert_new_from.argtypes = [c_void_p, c_void_p]
-lib.zcert_new_from_txt.restype = zcert_p
-lib.zcert_new_from_txt.argtypes = [c_char_p, c_char_p]
-lib.zcert_load.restype = zcert_p
-lib.zcert_load.argtypes = [c_char_p]
-lib.zcert_public_key.restype = c_void_p
-lib.zcert_public_key.argtypes = [zcert_p]
-lib.zcert_secret_key.restype = c_void_p
-lib.zcert_secret_key.argtypes = [zcert_p]
-lib.zcert_public_txt.restype = c_char_p
-lib.zcert_public_txt.argtypes = [zcert_p]
-lib.zcert_secret_txt.restype = c_char_p
-lib.zcert_secret_txt.argtypes = [zcert_p]
-lib.zcert_set_meta.restype = None
-lib.zcert_set_meta.argtypes = [zcert_p, c_char_p, c_char_p]
-lib.zcert_unset_meta.restype = None
-lib.zcert_unset_meta.argtypes = [zcert_p, c_char_p]
-lib.zcert_meta.restype = c_char_p
-lib.zcert_meta.argtypes = [zcert_p, c_char_p]
-lib.zcert_meta_keys.restype = zlist_p
-lib.zcert_meta_keys.argtypes = [zcert_p]
-lib.zcert_save.restype = c_int
-lib.zcert_save.argtypes = [zcert_p, c_char_p]
-lib.zcert_save_public.restype = c_int
-lib.zcert_save_public.argtypes = [zcert_p, c_char_p]
-lib.zcert_save_secret.restype = c_int
-lib.zcert_save_secret.argtypes = [zcert_p, c_char_p]
-lib.zcert_apply.restype = None
-lib.zcert_apply.argtypes = [zcert_p, c_void_p]
-lib.zcert_dup.restype = zcert_p
-lib.zcert_dup.argtypes = [zcert_p]
-lib.zcert_eq.restype = c_bool
-lib.zcert_eq.argtypes = [zcert_p, zcert_p]
-lib.zcert_print.restype = None
-lib.zcert_print.argtypes = [zcert_p]
-lib.zcert_test.restype = None
-lib.zcert_test.argtypes = [c_bool]
+lib.prototype('zcert_new', zcert_p, [])
+lib.prototype('zcert_destroy', None, [POINTER(zcert_p)])
+lib.prototype('zcert_new_from', zcert_p, [c_void_p, c_void_p])
+lib.prototype('zcert_new_from_txt', zcert_p, [c_char_p, c_char_p])
+lib.prototype('zcert_load', zcert_p, [c_char_p])
+lib.prototype('zcert_public_key', c_void_p, [zcert_p])
+lib.prototype('zcert_secret_key', c_void_p, [zcert_p])
+lib.prototype('zcert_public_txt', c_char_p, [zcert_p])
+lib.prototype('zcert_secret_txt', c_char_p, [zcert_p])
+lib.prototype('zcert_set_meta', None, [zcert_p, c_char_p, c_char_p])
+lib.prototype('zcert_unset_meta', None, [zcert_p, c_char_p])
+lib.prototype('zcert_meta', c_char_p, [zcert_p, c_char_p])
+lib.prototype('zcert_meta_keys', zlist_p, [zcert_p])
+lib.prototype('zcert_save', c_int, [zcert_p, c_char_p])
+lib.prototype('zcert_save_public', c_int, [zcert_p, c_char_p])
+lib.prototype('zcert_save_secret', c_int, [zcert_p, c_char_p])
+lib.prototype('zcert_apply', None, [zcert_p, c_void_p])
+lib.prototype('zcert_dup', zcert_p, [zcert_p])
+lib.prototype('zcert_eq', c_bool, [zcert_p, zcert_p])
+lib.prototype('zcert_print', None, [zcert_p])
+lib.prototype('zcert_test', None, [c_bool])
 
 class Zcert(object):
     """
@@ -946,24 +866,15 @@ heap memory, returns NULL.
 # zcertstore
 zcertstore_loader = CFUNCTYPE(None, zcertstore_p)
 zcertstore_destructor = CFUNCTYPE(None, c_void_p)
-lib.zcertstore_new.restype = zcertstore_p
-lib.zcertstore_new.argtypes = [c_char_p]
-lib.zcertstore_destroy.restype = None
-lib.zcertstore_destroy.argtypes = [POINTER(zcertstore_p)]
-lib.zcertstore_set_loader.restype = None
-lib.zcertstore_set_loader.argtypes = [zcertstore_p, zcertstore_loader, zcertstore_destructor, c_void_p]
-lib.zcertstore_lookup.restype = zcert_p
-lib.zcertstore_lookup.argtypes = [zcertstore_p, c_char_p]
-lib.zcertstore_insert.restype = None
-lib.zcertstore_insert.argtypes = [zcertstore_p, POINTER(zcert_p)]
-lib.zcertstore_empty.restype = None
-lib.zcertstore_empty.argtypes = [zcertstore_p]
-lib.zcertstore_print.restype = None
-lib.zcertstore_print.argtypes = [zcertstore_p]
-lib.zcertstore_certs.restype = zlistx_p
-lib.zcertstore_certs.argtypes = [zcertstore_p]
-lib.zcertstore_test.restype = None
-lib.zcertstore_test.argtypes = [c_bool]
+lib.prototype('zcertstore_new', zcertstore_p, [c_char_p])
+lib.prototype('zcertstore_destroy', None, [POINTER(zcertstore_p)])
+lib.prototype('zcertstore_set_loader', None, [zcertstore_p, zcertstore_loader, zcertstore_destructor, c_void_p])
+lib.prototype('zcertstore_lookup', zcert_p, [zcertstore_p, c_char_p])
+lib.prototype('zcertstore_insert', None, [zcertstore_p, POINTER(zcert_p)])
+lib.prototype('zcertstore_empty', None, [zcertstore_p])
+lib.prototype('zcertstore_print', None, [zcertstore_p])
+lib.prototype('zcertstore_certs', zlistx_p, [zcertstore_p])
+lib.prototype('zcertstore_test', None, [c_bool])
 
 class Zcertstore(object):
     """
@@ -1071,58 +982,32 @@ objects.
 
 
 # zchunk
-lib.zchunk_new.restype = zchunk_p
-lib.zchunk_new.argtypes = [c_void_p, c_size_t]
-lib.zchunk_destroy.restype = None
-lib.zchunk_destroy.argtypes = [POINTER(zchunk_p)]
-lib.zchunk_resize.restype = None
-lib.zchunk_resize.argtypes = [zchunk_p, c_size_t]
-lib.zchunk_size.restype = c_size_t
-lib.zchunk_size.argtypes = [zchunk_p]
-lib.zchunk_max_size.restype = c_size_t
-lib.zchunk_max_size.argtypes = [zchunk_p]
-lib.zchunk_data.restype = c_void_p
-lib.zchunk_data.argtypes = [zchunk_p]
-lib.zchunk_set.restype = c_size_t
-lib.zchunk_set.argtypes = [zchunk_p, c_void_p, c_size_t]
-lib.zchunk_fill.restype = c_size_t
-lib.zchunk_fill.argtypes = [zchunk_p, c_ubyte, c_size_t]
-lib.zchunk_append.restype = c_size_t
-lib.zchunk_append.argtypes = [zchunk_p, c_void_p, c_size_t]
-lib.zchunk_extend.restype = c_size_t
-lib.zchunk_extend.argtypes = [zchunk_p, c_void_p, c_size_t]
-lib.zchunk_consume.restype = c_size_t
-lib.zchunk_consume.argtypes = [zchunk_p, zchunk_p]
-lib.zchunk_exhausted.restype = c_bool
-lib.zchunk_exhausted.argtypes = [zchunk_p]
-lib.zchunk_read.restype = zchunk_p
-lib.zchunk_read.argtypes = [FILE_p, c_size_t]
-lib.zchunk_write.restype = c_int
-lib.zchunk_write.argtypes = [zchunk_p, FILE_p]
-lib.zchunk_slurp.restype = zchunk_p
-lib.zchunk_slurp.argtypes = [c_char_p, c_size_t]
-lib.zchunk_dup.restype = zchunk_p
-lib.zchunk_dup.argtypes = [zchunk_p]
-lib.zchunk_strhex.restype = POINTER(c_char)
-lib.zchunk_strhex.argtypes = [zchunk_p]
-lib.zchunk_strdup.restype = POINTER(c_char)
-lib.zchunk_strdup.argtypes = [zchunk_p]
-lib.zchunk_streq.restype = c_bool
-lib.zchunk_streq.argtypes = [zchunk_p, c_char_p]
-lib.zchunk_pack.restype = zframe_p
-lib.zchunk_pack.argtypes = [zchunk_p]
-lib.zchunk_unpack.restype = zchunk_p
-lib.zchunk_unpack.argtypes = [zframe_p]
-lib.zchunk_digest.restype = c_char_p
-lib.zchunk_digest.argtypes = [zchunk_p]
-lib.zchunk_fprint.restype = None
-lib.zchunk_fprint.argtypes = [zchunk_p, FILE_p]
-lib.zchunk_print.restype = None
-lib.zchunk_print.argtypes = [zchunk_p]
-lib.zchunk_is.restype = c_bool
-lib.zchunk_is.argtypes = [c_void_p]
-lib.zchunk_test.restype = None
-lib.zchunk_test.argtypes = [c_bool]
+lib.prototype('zchunk_new', zchunk_p, [c_void_p, c_size_t])
+lib.prototype('zchunk_destroy', None, [POINTER(zchunk_p)])
+lib.prototype('zchunk_resize', None, [zchunk_p, c_size_t])
+lib.prototype('zchunk_size', c_size_t, [zchunk_p])
+lib.prototype('zchunk_max_size', c_size_t, [zchunk_p])
+lib.prototype('zchunk_data', c_void_p, [zchunk_p])
+lib.prototype('zchunk_set', c_size_t, [zchunk_p, c_void_p, c_size_t])
+lib.prototype('zchunk_fill', c_size_t, [zchunk_p, c_ubyte, c_size_t])
+lib.prototype('zchunk_append', c_size_t, [zchunk_p, c_void_p, c_size_t])
+lib.prototype('zchunk_extend', c_size_t, [zchunk_p, c_void_p, c_size_t])
+lib.prototype('zchunk_consume', c_size_t, [zchunk_p, zchunk_p])
+lib.prototype('zchunk_exhausted', c_bool, [zchunk_p])
+lib.prototype('zchunk_read', zchunk_p, [FILE_p, c_size_t])
+lib.prototype('zchunk_write', c_int, [zchunk_p, FILE_p])
+lib.prototype('zchunk_slurp', zchunk_p, [c_char_p, c_size_t])
+lib.prototype('zchunk_dup', zchunk_p, [zchunk_p])
+lib.prototype('zchunk_strhex', POINTER(c_char), [zchunk_p])
+lib.prototype('zchunk_strdup', POINTER(c_char), [zchunk_p])
+lib.prototype('zchunk_streq', c_bool, [zchunk_p, c_char_p])
+lib.prototype('zchunk_pack', zframe_p, [zchunk_p])
+lib.prototype('zchunk_unpack', zchunk_p, [zframe_p])
+lib.prototype('zchunk_digest', c_char_p, [zchunk_p])
+lib.prototype('zchunk_fprint', None, [zchunk_p, FILE_p])
+lib.prototype('zchunk_print', None, [zchunk_p])
+lib.prototype('zchunk_is', c_bool, [c_void_p])
+lib.prototype('zchunk_test', None, [c_bool])
 
 class Zchunk(object):
     """
@@ -1341,18 +1226,12 @@ See zchunk_fprint for details
 
 
 # zclock
-lib.zclock_sleep.restype = None
-lib.zclock_sleep.argtypes = [c_int]
-lib.zclock_time.restype = msecs_p
-lib.zclock_time.argtypes = []
-lib.zclock_mono.restype = msecs_p
-lib.zclock_mono.argtypes = []
-lib.zclock_usecs.restype = msecs_p
-lib.zclock_usecs.argtypes = []
-lib.zclock_timestr.restype = POINTER(c_char)
-lib.zclock_timestr.argtypes = []
-lib.zclock_test.restype = None
-lib.zclock_test.argtypes = [c_bool]
+lib.prototype('zclock_sleep', None, [c_int])
+lib.prototype('zclock_time', msecs_p, [])
+lib.prototype('zclock_mono', msecs_p, [])
+lib.prototype('zclock_usecs', msecs_p, [])
+lib.prototype('zclock_timestr', POINTER(c_char), [])
+lib.prototype('zclock_test', None, [c_bool])
 
 class Zclock(object):
     """
@@ -1431,72 +1310,39 @@ so will never be reset backwards, unlike a system clock.
 
 # zconfig
 zconfig_fct = CFUNCTYPE(c_int, zconfig_p, c_void_p, c_int)
-lib.zconfig_new.restype = zconfig_p
-lib.zconfig_new.argtypes = [c_char_p, zconfig_p]
-lib.zconfig_destroy.restype = None
-lib.zconfig_destroy.argtypes = [POINTER(zconfig_p)]
-lib.zconfig_load.restype = zconfig_p
-lib.zconfig_load.argtypes = [c_char_p]
-lib.zconfig_loadf.restype = zconfig_p
-lib.zconfig_loadf.argtypes = [c_char_p]
-lib.zconfig_dup.restype = zconfig_p
-lib.zconfig_dup.argtypes = [zconfig_p]
-lib.zconfig_name.restype = c_char_p
-lib.zconfig_name.argtypes = [zconfig_p]
-lib.zconfig_value.restype = c_char_p
-lib.zconfig_value.argtypes = [zconfig_p]
-lib.zconfig_put.restype = None
-lib.zconfig_put.argtypes = [zconfig_p, c_char_p, c_char_p]
-lib.zconfig_putf.restype = None
-lib.zconfig_putf.argtypes = [zconfig_p, c_char_p, c_char_p]
-lib.zconfig_get.restype = c_char_p
-lib.zconfig_get.argtypes = [zconfig_p, c_char_p, c_char_p]
-lib.zconfig_set_name.restype = None
-lib.zconfig_set_name.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_set_value.restype = None
-lib.zconfig_set_value.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_child.restype = zconfig_p
-lib.zconfig_child.argtypes = [zconfig_p]
-lib.zconfig_next.restype = zconfig_p
-lib.zconfig_next.argtypes = [zconfig_p]
-lib.zconfig_locate.restype = zconfig_p
-lib.zconfig_locate.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_at_depth.restype = zconfig_p
-lib.zconfig_at_depth.argtypes = [zconfig_p, c_int]
-lib.zconfig_execute.restype = c_int
-lib.zconfig_execute.argtypes = [zconfig_p, zconfig_fct, c_void_p]
-lib.zconfig_set_comment.restype = None
-lib.zconfig_set_comment.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_comments.restype = zlist_p
-lib.zconfig_comments.argtypes = [zconfig_p]
-lib.zconfig_save.restype = c_int
-lib.zconfig_save.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_savef.restype = c_int
-lib.zconfig_savef.argtypes = [zconfig_p, c_char_p]
-lib.zconfig_filename.restype = c_char_p
-lib.zconfig_filename.argtypes = [zconfig_p]
-lib.zconfig_reload.restype = c_int
-lib.zconfig_reload.argtypes = [POINTER(zconfig_p)]
-lib.zconfig_chunk_load.restype = zconfig_p
-lib.zconfig_chunk_load.argtypes = [zchunk_p]
-lib.zconfig_chunk_save.restype = zchunk_p
-lib.zconfig_chunk_save.argtypes = [zconfig_p]
-lib.zconfig_str_load.restype = zconfig_p
-lib.zconfig_str_load.argtypes = [c_char_p]
-lib.zconfig_str_save.restype = POINTER(c_char)
-lib.zconfig_str_save.argtypes = [zconfig_p]
-lib.zconfig_has_changed.restype = c_bool
-lib.zconfig_has_changed.argtypes = [zconfig_p]
-lib.zconfig_remove_subtree.restype = None
-lib.zconfig_remove_subtree.argtypes = [zconfig_p]
-lib.zconfig_remove.restype = None
-lib.zconfig_remove.argtypes = [POINTER(zconfig_p)]
-lib.zconfig_fprint.restype = None
-lib.zconfig_fprint.argtypes = [zconfig_p, FILE_p]
-lib.zconfig_print.restype = None
-lib.zconfig_print.argtypes = [zconfig_p]
-lib.zconfig_test.restype = None
-lib.zconfig_test.argtypes = [c_bool]
+lib.prototype('zconfig_new', zconfig_p, [c_char_p, zconfig_p])
+lib.prototype('zconfig_destroy', None, [POINTER(zconfig_p)])
+lib.prototype('zconfig_load', zconfig_p, [c_char_p])
+lib.prototype('zconfig_loadf', zconfig_p, [c_char_p])
+lib.prototype('zconfig_dup', zconfig_p, [zconfig_p])
+lib.prototype('zconfig_name', c_char_p, [zconfig_p])
+lib.prototype('zconfig_value', c_char_p, [zconfig_p])
+lib.prototype('zconfig_put', None, [zconfig_p, c_char_p, c_char_p])
+lib.prototype('zconfig_putf', None, [zconfig_p, c_char_p, c_char_p])
+lib.prototype('zconfig_get', c_char_p, [zconfig_p, c_char_p, c_char_p])
+lib.prototype('zconfig_set_name', None, [zconfig_p, c_char_p])
+lib.prototype('zconfig_set_value', None, [zconfig_p, c_char_p])
+lib.prototype('zconfig_child', zconfig_p, [zconfig_p])
+lib.prototype('zconfig_next', zconfig_p, [zconfig_p])
+lib.prototype('zconfig_locate', zconfig_p, [zconfig_p, c_char_p])
+lib.prototype('zconfig_at_depth', zconfig_p, [zconfig_p, c_int])
+lib.prototype('zconfig_execute', c_int, [zconfig_p, zconfig_fct, c_void_p])
+lib.prototype('zconfig_set_comment', None, [zconfig_p, c_char_p])
+lib.prototype('zconfig_comments', zlist_p, [zconfig_p])
+lib.prototype('zconfig_save', c_int, [zconfig_p, c_char_p])
+lib.prototype('zconfig_savef', c_int, [zconfig_p, c_char_p])
+lib.prototype('zconfig_filename', c_char_p, [zconfig_p])
+lib.prototype('zconfig_reload', c_int, [POINTER(zconfig_p)])
+lib.prototype('zconfig_chunk_load', zconfig_p, [zchunk_p])
+lib.prototype('zconfig_chunk_save', zchunk_p, [zconfig_p])
+lib.prototype('zconfig_str_load', zconfig_p, [c_char_p])
+lib.prototype('zconfig_str_save', POINTER(c_char), [zconfig_p])
+lib.prototype('zconfig_has_changed', c_bool, [zconfig_p])
+lib.prototype('zconfig_remove_subtree', None, [zconfig_p])
+lib.prototype('zconfig_remove', None, [POINTER(zconfig_p)])
+lib.prototype('zconfig_fprint', None, [zconfig_p, FILE_p])
+lib.prototype('zconfig_print', None, [zconfig_p])
+lib.prototype('zconfig_test', None, [c_bool])
 
 class Zconfig(object):
     """
@@ -1759,20 +1605,13 @@ file has changed in since the tree was loaded.
 
 
 # zdigest
-lib.zdigest_new.restype = zdigest_p
-lib.zdigest_new.argtypes = []
-lib.zdigest_destroy.restype = None
-lib.zdigest_destroy.argtypes = [POINTER(zdigest_p)]
-lib.zdigest_update.restype = None
-lib.zdigest_update.argtypes = [zdigest_p, c_void_p, c_size_t]
-lib.zdigest_data.restype = c_void_p
-lib.zdigest_data.argtypes = [zdigest_p]
-lib.zdigest_size.restype = c_size_t
-lib.zdigest_size.argtypes = [zdigest_p]
-lib.zdigest_string.restype = c_char_p
-lib.zdigest_string.argtypes = [zdigest_p]
-lib.zdigest_test.restype = None
-lib.zdigest_test.argtypes = [c_bool]
+lib.prototype('zdigest_new', zdigest_p, [])
+lib.prototype('zdigest_destroy', None, [POINTER(zdigest_p)])
+lib.prototype('zdigest_update', None, [zdigest_p, c_void_p, c_size_t])
+lib.prototype('zdigest_data', c_void_p, [zdigest_p])
+lib.prototype('zdigest_size', c_size_t, [zdigest_p])
+lib.prototype('zdigest_string', c_char_p, [zdigest_p])
+lib.prototype('zdigest_test', None, [c_bool])
 
 class Zdigest(object):
     """
@@ -1859,36 +1698,21 @@ on the same digest. If built without crypto support, returns NULL.
 
 
 # zdir
-lib.zdir_new.restype = zdir_p
-lib.zdir_new.argtypes = [c_char_p, c_char_p]
-lib.zdir_destroy.restype = None
-lib.zdir_destroy.argtypes = [POINTER(zdir_p)]
-lib.zdir_path.restype = c_char_p
-lib.zdir_path.argtypes = [zdir_p]
-lib.zdir_modified.restype = c_int
-lib.zdir_modified.argtypes = [zdir_p]
-lib.zdir_cursize.restype = c_int
-lib.zdir_cursize.argtypes = [zdir_p]
-lib.zdir_count.restype = c_size_t
-lib.zdir_count.argtypes = [zdir_p]
-lib.zdir_list.restype = zlist_p
-lib.zdir_list.argtypes = [zdir_p]
-lib.zdir_remove.restype = None
-lib.zdir_remove.argtypes = [zdir_p, c_bool]
-lib.zdir_diff.restype = zlist_p
-lib.zdir_diff.argtypes = [zdir_p, zdir_p, c_char_p]
-lib.zdir_resync.restype = zlist_p
-lib.zdir_resync.argtypes = [zdir_p, c_char_p]
-lib.zdir_cache.restype = zhash_p
-lib.zdir_cache.argtypes = [zdir_p]
-lib.zdir_fprint.restype = None
-lib.zdir_fprint.argtypes = [zdir_p, FILE_p, c_int]
-lib.zdir_print.restype = None
-lib.zdir_print.argtypes = [zdir_p, c_int]
-lib.zdir_watch.restype = None
-lib.zdir_watch.argtypes = [zsock_p, c_void_p]
-lib.zdir_test.restype = None
-lib.zdir_test.argtypes = [c_bool]
+lib.prototype('zdir_new', zdir_p, [c_char_p, c_char_p])
+lib.prototype('zdir_destroy', None, [POINTER(zdir_p)])
+lib.prototype('zdir_path', c_char_p, [zdir_p])
+lib.prototype('zdir_modified', c_int, [zdir_p])
+lib.prototype('zdir_cursize', c_int, [zdir_p])
+lib.prototype('zdir_count', c_size_t, [zdir_p])
+lib.prototype('zdir_list', zlist_p, [zdir_p])
+lib.prototype('zdir_remove', None, [zdir_p, c_bool])
+lib.prototype('zdir_diff', zlist_p, [zdir_p, zdir_p, c_char_p])
+lib.prototype('zdir_resync', zlist_p, [zdir_p, c_char_p])
+lib.prototype('zdir_cache', zhash_p, [zdir_p])
+lib.prototype('zdir_fprint', None, [zdir_p, FILE_p, c_int])
+lib.prototype('zdir_print', None, [zdir_p, c_int])
+lib.prototype('zdir_watch', None, [zsock_p, c_void_p])
+lib.prototype('zdir_test', None, [c_bool])
 
 class Zdir(object):
     """
@@ -2057,26 +1881,16 @@ Receive directory changes:
 
 
 # zdir_patch
-lib.zdir_patch_new.restype = zdir_patch_p
-lib.zdir_patch_new.argtypes = [c_char_p, zfile_p, c_int, c_char_p]
-lib.zdir_patch_destroy.restype = None
-lib.zdir_patch_destroy.argtypes = [POINTER(zdir_patch_p)]
-lib.zdir_patch_dup.restype = zdir_patch_p
-lib.zdir_patch_dup.argtypes = [zdir_patch_p]
-lib.zdir_patch_path.restype = c_char_p
-lib.zdir_patch_path.argtypes = [zdir_patch_p]
-lib.zdir_patch_file.restype = zfile_p
-lib.zdir_patch_file.argtypes = [zdir_patch_p]
-lib.zdir_patch_op.restype = c_int
-lib.zdir_patch_op.argtypes = [zdir_patch_p]
-lib.zdir_patch_vpath.restype = c_char_p
-lib.zdir_patch_vpath.argtypes = [zdir_patch_p]
-lib.zdir_patch_digest_set.restype = None
-lib.zdir_patch_digest_set.argtypes = [zdir_patch_p]
-lib.zdir_patch_digest.restype = c_char_p
-lib.zdir_patch_digest.argtypes = [zdir_patch_p]
-lib.zdir_patch_test.restype = None
-lib.zdir_patch_test.argtypes = [c_bool]
+lib.prototype('zdir_patch_new', zdir_patch_p, [c_char_p, zfile_p, c_int, c_char_p])
+lib.prototype('zdir_patch_destroy', None, [POINTER(zdir_patch_p)])
+lib.prototype('zdir_patch_dup', zdir_patch_p, [zdir_patch_p])
+lib.prototype('zdir_patch_path', c_char_p, [zdir_patch_p])
+lib.prototype('zdir_patch_file', zfile_p, [zdir_patch_p])
+lib.prototype('zdir_patch_op', c_int, [zdir_patch_p])
+lib.prototype('zdir_patch_vpath', c_char_p, [zdir_patch_p])
+lib.prototype('zdir_patch_digest_set', None, [zdir_patch_p])
+lib.prototype('zdir_patch_digest', c_char_p, [zdir_patch_p])
+lib.prototype('zdir_patch_test', None, [c_bool])
 
 class ZdirPatch(object):
     """
@@ -2180,56 +1994,31 @@ returns null.
 
 
 # zfile
-lib.zfile_new.restype = zfile_p
-lib.zfile_new.argtypes = [c_char_p, c_char_p]
-lib.zfile_destroy.restype = None
-lib.zfile_destroy.argtypes = [POINTER(zfile_p)]
-lib.zfile_tmp.restype = zfile_p
-lib.zfile_tmp.argtypes = []
-lib.zfile_dup.restype = zfile_p
-lib.zfile_dup.argtypes = [zfile_p]
-lib.zfile_filename.restype = c_char_p
-lib.zfile_filename.argtypes = [zfile_p, c_char_p]
-lib.zfile_restat.restype = None
-lib.zfile_restat.argtypes = [zfile_p]
-lib.zfile_modified.restype = c_int
-lib.zfile_modified.argtypes = [zfile_p]
-lib.zfile_cursize.restype = c_int
-lib.zfile_cursize.argtypes = [zfile_p]
-lib.zfile_is_directory.restype = c_bool
-lib.zfile_is_directory.argtypes = [zfile_p]
-lib.zfile_is_regular.restype = c_bool
-lib.zfile_is_regular.argtypes = [zfile_p]
-lib.zfile_is_readable.restype = c_bool
-lib.zfile_is_readable.argtypes = [zfile_p]
-lib.zfile_is_writeable.restype = c_bool
-lib.zfile_is_writeable.argtypes = [zfile_p]
-lib.zfile_is_stable.restype = c_bool
-lib.zfile_is_stable.argtypes = [zfile_p]
-lib.zfile_has_changed.restype = c_bool
-lib.zfile_has_changed.argtypes = [zfile_p]
-lib.zfile_remove.restype = None
-lib.zfile_remove.argtypes = [zfile_p]
-lib.zfile_input.restype = c_int
-lib.zfile_input.argtypes = [zfile_p]
-lib.zfile_output.restype = c_int
-lib.zfile_output.argtypes = [zfile_p]
-lib.zfile_read.restype = zchunk_p
-lib.zfile_read.argtypes = [zfile_p, c_size_t, c_int]
-lib.zfile_eof.restype = c_bool
-lib.zfile_eof.argtypes = [zfile_p]
-lib.zfile_write.restype = c_int
-lib.zfile_write.argtypes = [zfile_p, zchunk_p, c_int]
-lib.zfile_readln.restype = c_char_p
-lib.zfile_readln.argtypes = [zfile_p]
-lib.zfile_close.restype = None
-lib.zfile_close.argtypes = [zfile_p]
-lib.zfile_handle.restype = FILE_p
-lib.zfile_handle.argtypes = [zfile_p]
-lib.zfile_digest.restype = c_char_p
-lib.zfile_digest.argtypes = [zfile_p]
-lib.zfile_test.restype = None
-lib.zfile_test.argtypes = [c_bool]
+lib.prototype('zfile_new', zfile_p, [c_char_p, c_char_p])
+lib.prototype('zfile_destroy', None, [POINTER(zfile_p)])
+lib.prototype('zfile_tmp', zfile_p, [])
+lib.prototype('zfile_dup', zfile_p, [zfile_p])
+lib.prototype('zfile_filename', c_char_p, [zfile_p, c_char_p])
+lib.prototype('zfile_restat', None, [zfile_p])
+lib.prototype('zfile_modified', c_int, [zfile_p])
+lib.prototype('zfile_cursize', c_int, [zfile_p])
+lib.prototype('zfile_is_directory', c_bool, [zfile_p])
+lib.prototype('zfile_is_regular', c_bool, [zfile_p])
+lib.prototype('zfile_is_readable', c_bool, [zfile_p])
+lib.prototype('zfile_is_writeable', c_bool, [zfile_p])
+lib.prototype('zfile_is_stable', c_bool, [zfile_p])
+lib.prototype('zfile_has_changed', c_bool, [zfile_p])
+lib.prototype('zfile_remove', None, [zfile_p])
+lib.prototype('zfile_input', c_int, [zfile_p])
+lib.prototype('zfile_output', c_int, [zfile_p])
+lib.prototype('zfile_read', zchunk_p, [zfile_p, c_size_t, c_int])
+lib.prototype('zfile_eof', c_bool, [zfile_p])
+lib.prototype('zfile_write', c_int, [zfile_p, zchunk_p, c_int])
+lib.prototype('zfile_readln', c_char_p, [zfile_p])
+lib.prototype('zfile_close', None, [zfile_p])
+lib.prototype('zfile_handle', FILE_p, [zfile_p])
+lib.prototype('zfile_digest', c_char_p, [zfile_p])
+lib.prototype('zfile_test', None, [c_bool])
 
 class Zfile(object):
     """
@@ -2445,54 +2234,30 @@ or NULL if there was nothing more to read from the file.
 
 
 # zframe
-lib.zframe_new.restype = zframe_p
-lib.zframe_new.argtypes = [c_void_p, c_size_t]
-lib.zframe_destroy.restype = None
-lib.zframe_destroy.argtypes = [POINTER(zframe_p)]
-lib.zframe_new_empty.restype = zframe_p
-lib.zframe_new_empty.argtypes = []
-lib.zframe_from.restype = zframe_p
-lib.zframe_from.argtypes = [c_char_p]
-lib.zframe_recv.restype = zframe_p
-lib.zframe_recv.argtypes = [c_void_p]
-lib.zframe_send.restype = c_int
-lib.zframe_send.argtypes = [POINTER(zframe_p), c_void_p, c_int]
-lib.zframe_size.restype = c_size_t
-lib.zframe_size.argtypes = [zframe_p]
-lib.zframe_data.restype = c_void_p
-lib.zframe_data.argtypes = [zframe_p]
-lib.zframe_meta.restype = c_char_p
-lib.zframe_meta.argtypes = [zframe_p, c_char_p]
-lib.zframe_dup.restype = zframe_p
-lib.zframe_dup.argtypes = [zframe_p]
-lib.zframe_strhex.restype = POINTER(c_char)
-lib.zframe_strhex.argtypes = [zframe_p]
-lib.zframe_strdup.restype = POINTER(c_char)
-lib.zframe_strdup.argtypes = [zframe_p]
-lib.zframe_streq.restype = c_bool
-lib.zframe_streq.argtypes = [zframe_p, c_char_p]
-lib.zframe_more.restype = c_int
-lib.zframe_more.argtypes = [zframe_p]
-lib.zframe_set_more.restype = None
-lib.zframe_set_more.argtypes = [zframe_p, c_int]
-lib.zframe_routing_id.restype = c_int
-lib.zframe_routing_id.argtypes = [zframe_p]
-lib.zframe_set_routing_id.restype = None
-lib.zframe_set_routing_id.argtypes = [zframe_p, c_int]
-lib.zframe_group.restype = c_char_p
-lib.zframe_group.argtypes = [zframe_p]
-lib.zframe_set_group.restype = c_int
-lib.zframe_set_group.argtypes = [zframe_p, c_char_p]
-lib.zframe_eq.restype = c_bool
-lib.zframe_eq.argtypes = [zframe_p, zframe_p]
-lib.zframe_reset.restype = None
-lib.zframe_reset.argtypes = [zframe_p, c_void_p, c_size_t]
-lib.zframe_print.restype = None
-lib.zframe_print.argtypes = [zframe_p, c_char_p]
-lib.zframe_is.restype = c_bool
-lib.zframe_is.argtypes = [c_void_p]
-lib.zframe_test.restype = None
-lib.zframe_test.argtypes = [c_bool]
+lib.prototype('zframe_new', zframe_p, [c_void_p, c_size_t])
+lib.prototype('zframe_destroy', None, [POINTER(zframe_p)])
+lib.prototype('zframe_new_empty', zframe_p, [])
+lib.prototype('zframe_from', zframe_p, [c_char_p])
+lib.prototype('zframe_recv', zframe_p, [c_void_p])
+lib.prototype('zframe_send', c_int, [POINTER(zframe_p), c_void_p, c_int])
+lib.prototype('zframe_size', c_size_t, [zframe_p])
+lib.prototype('zframe_data', c_void_p, [zframe_p])
+lib.prototype('zframe_meta', c_char_p, [zframe_p, c_char_p])
+lib.prototype('zframe_dup', zframe_p, [zframe_p])
+lib.prototype('zframe_strhex', POINTER(c_char), [zframe_p])
+lib.prototype('zframe_strdup', POINTER(c_char), [zframe_p])
+lib.prototype('zframe_streq', c_bool, [zframe_p, c_char_p])
+lib.prototype('zframe_more', c_int, [zframe_p])
+lib.prototype('zframe_set_more', None, [zframe_p, c_int])
+lib.prototype('zframe_routing_id', c_int, [zframe_p])
+lib.prototype('zframe_set_routing_id', None, [zframe_p, c_int])
+lib.prototype('zframe_group', c_char_p, [zframe_p])
+lib.prototype('zframe_set_group', c_int, [zframe_p, c_char_p])
+lib.prototype('zframe_eq', c_bool, [zframe_p, zframe_p])
+lib.prototype('zframe_reset', None, [zframe_p, c_void_p, c_size_t])
+lib.prototype('zframe_print', None, [zframe_p, c_char_p])
+lib.prototype('zframe_is', c_bool, [c_void_p])
+lib.prototype('zframe_test', None, [c_bool])
 
 class Zframe(object):
     """
@@ -2704,50 +2469,28 @@ configured by zsys_set_logstream). Prefix shows before frame, if not null.
 
 # zhash
 zhash_free_fn = CFUNCTYPE(None, c_void_p)
-lib.zhash_new.restype = zhash_p
-lib.zhash_new.argtypes = []
-lib.zhash_destroy.restype = None
-lib.zhash_destroy.argtypes = [POINTER(zhash_p)]
-lib.zhash_unpack.restype = zhash_p
-lib.zhash_unpack.argtypes = [zframe_p]
-lib.zhash_insert.restype = c_int
-lib.zhash_insert.argtypes = [zhash_p, c_char_p, c_void_p]
-lib.zhash_update.restype = None
-lib.zhash_update.argtypes = [zhash_p, c_char_p, c_void_p]
-lib.zhash_delete.restype = None
-lib.zhash_delete.argtypes = [zhash_p, c_char_p]
-lib.zhash_lookup.restype = c_void_p
-lib.zhash_lookup.argtypes = [zhash_p, c_char_p]
-lib.zhash_rename.restype = c_int
-lib.zhash_rename.argtypes = [zhash_p, c_char_p, c_char_p]
-lib.zhash_freefn.restype = c_void_p
-lib.zhash_freefn.argtypes = [zhash_p, c_char_p, zhash_free_fn]
-lib.zhash_size.restype = c_size_t
-lib.zhash_size.argtypes = [zhash_p]
-lib.zhash_dup.restype = zhash_p
-lib.zhash_dup.argtypes = [zhash_p]
-lib.zhash_keys.restype = zlist_p
-lib.zhash_keys.argtypes = [zhash_p]
-lib.zhash_first.restype = c_void_p
-lib.zhash_first.argtypes = [zhash_p]
-lib.zhash_next.restype = c_void_p
-lib.zhash_next.argtypes = [zhash_p]
-lib.zhash_cursor.restype = c_char_p
-lib.zhash_cursor.argtypes = [zhash_p]
-lib.zhash_comment.restype = None
-lib.zhash_comment.argtypes = [zhash_p, c_char_p]
-lib.zhash_pack.restype = zframe_p
-lib.zhash_pack.argtypes = [zhash_p]
-lib.zhash_save.restype = c_int
-lib.zhash_save.argtypes = [zhash_p, c_char_p]
-lib.zhash_load.restype = c_int
-lib.zhash_load.argtypes = [zhash_p, c_char_p]
-lib.zhash_refresh.restype = c_int
-lib.zhash_refresh.argtypes = [zhash_p]
-lib.zhash_autofree.restype = None
-lib.zhash_autofree.argtypes = [zhash_p]
-lib.zhash_test.restype = None
-lib.zhash_test.argtypes = [c_bool]
+lib.prototype('zhash_new', zhash_p, [])
+lib.prototype('zhash_destroy', None, [POINTER(zhash_p)])
+lib.prototype('zhash_unpack', zhash_p, [zframe_p])
+lib.prototype('zhash_insert', c_int, [zhash_p, c_char_p, c_void_p])
+lib.prototype('zhash_update', None, [zhash_p, c_char_p, c_void_p])
+lib.prototype('zhash_delete', None, [zhash_p, c_char_p])
+lib.prototype('zhash_lookup', c_void_p, [zhash_p, c_char_p])
+lib.prototype('zhash_rename', c_int, [zhash_p, c_char_p, c_char_p])
+lib.prototype('zhash_freefn', c_void_p, [zhash_p, c_char_p, zhash_free_fn])
+lib.prototype('zhash_size', c_size_t, [zhash_p])
+lib.prototype('zhash_dup', zhash_p, [zhash_p])
+lib.prototype('zhash_keys', zlist_p, [zhash_p])
+lib.prototype('zhash_first', c_void_p, [zhash_p])
+lib.prototype('zhash_next', c_void_p, [zhash_p])
+lib.prototype('zhash_cursor', c_char_p, [zhash_p])
+lib.prototype('zhash_comment', None, [zhash_p, c_char_p])
+lib.prototype('zhash_pack', zframe_p, [zhash_p])
+lib.prototype('zhash_save', c_int, [zhash_p, c_char_p])
+lib.prototype('zhash_load', c_int, [zhash_p, c_char_p])
+lib.prototype('zhash_refresh', c_int, [zhash_p])
+lib.prototype('zhash_autofree', None, [zhash_p])
+lib.prototype('zhash_test', None, [c_bool])
 
 class Zhash(object):
     """
@@ -2983,70 +2726,38 @@ zhashx_free_fn = CFUNCTYPE(None, c_void_p)
 zhashx_hash_fn = CFUNCTYPE(c_size_t, c_void_p)
 zhashx_serializer_fn = CFUNCTYPE(POINTER(c_char), c_void_p)
 zhashx_deserializer_fn = CFUNCTYPE(c_void_p, c_char_p)
-lib.zhashx_new.restype = zhashx_p
-lib.zhashx_new.argtypes = []
-lib.zhashx_destroy.restype = None
-lib.zhashx_destroy.argtypes = [POINTER(zhashx_p)]
-lib.zhashx_unpack.restype = zhashx_p
-lib.zhashx_unpack.argtypes = [zframe_p]
-lib.zhashx_unpack_own.restype = zhashx_p
-lib.zhashx_unpack_own.argtypes = [zframe_p, zhashx_deserializer_fn]
-lib.zhashx_insert.restype = c_int
-lib.zhashx_insert.argtypes = [zhashx_p, c_void_p, c_void_p]
-lib.zhashx_update.restype = None
-lib.zhashx_update.argtypes = [zhashx_p, c_void_p, c_void_p]
-lib.zhashx_delete.restype = None
-lib.zhashx_delete.argtypes = [zhashx_p, c_void_p]
-lib.zhashx_purge.restype = None
-lib.zhashx_purge.argtypes = [zhashx_p]
-lib.zhashx_lookup.restype = c_void_p
-lib.zhashx_lookup.argtypes = [zhashx_p, c_void_p]
-lib.zhashx_rename.restype = c_int
-lib.zhashx_rename.argtypes = [zhashx_p, c_void_p, c_void_p]
-lib.zhashx_freefn.restype = c_void_p
-lib.zhashx_freefn.argtypes = [zhashx_p, c_void_p, zhashx_free_fn]
-lib.zhashx_size.restype = c_size_t
-lib.zhashx_size.argtypes = [zhashx_p]
-lib.zhashx_keys.restype = zlistx_p
-lib.zhashx_keys.argtypes = [zhashx_p]
-lib.zhashx_values.restype = zlistx_p
-lib.zhashx_values.argtypes = [zhashx_p]
-lib.zhashx_first.restype = c_void_p
-lib.zhashx_first.argtypes = [zhashx_p]
-lib.zhashx_next.restype = c_void_p
-lib.zhashx_next.argtypes = [zhashx_p]
-lib.zhashx_cursor.restype = c_void_p
-lib.zhashx_cursor.argtypes = [zhashx_p]
-lib.zhashx_comment.restype = None
-lib.zhashx_comment.argtypes = [zhashx_p, c_char_p]
-lib.zhashx_save.restype = c_int
-lib.zhashx_save.argtypes = [zhashx_p, c_char_p]
-lib.zhashx_load.restype = c_int
-lib.zhashx_load.argtypes = [zhashx_p, c_char_p]
-lib.zhashx_refresh.restype = c_int
-lib.zhashx_refresh.argtypes = [zhashx_p]
-lib.zhashx_pack.restype = zframe_p
-lib.zhashx_pack.argtypes = [zhashx_p]
-lib.zhashx_pack_own.restype = zframe_p
-lib.zhashx_pack_own.argtypes = [zhashx_p, zhashx_serializer_fn]
-lib.zhashx_dup.restype = zhashx_p
-lib.zhashx_dup.argtypes = [zhashx_p]
-lib.zhashx_set_destructor.restype = None
-lib.zhashx_set_destructor.argtypes = [zhashx_p, zhashx_destructor_fn]
-lib.zhashx_set_duplicator.restype = None
-lib.zhashx_set_duplicator.argtypes = [zhashx_p, zhashx_duplicator_fn]
-lib.zhashx_set_key_destructor.restype = None
-lib.zhashx_set_key_destructor.argtypes = [zhashx_p, zhashx_destructor_fn]
-lib.zhashx_set_key_duplicator.restype = None
-lib.zhashx_set_key_duplicator.argtypes = [zhashx_p, zhashx_duplicator_fn]
-lib.zhashx_set_key_comparator.restype = None
-lib.zhashx_set_key_comparator.argtypes = [zhashx_p, zhashx_comparator_fn]
-lib.zhashx_set_key_hasher.restype = None
-lib.zhashx_set_key_hasher.argtypes = [zhashx_p, zhashx_hash_fn]
-lib.zhashx_dup_v2.restype = zhashx_p
-lib.zhashx_dup_v2.argtypes = [zhashx_p]
-lib.zhashx_test.restype = None
-lib.zhashx_test.argtypes = [c_bool]
+lib.prototype('zhashx_new', zhashx_p, [])
+lib.prototype('zhashx_destroy', None, [POINTER(zhashx_p)])
+lib.prototype('zhashx_unpack', zhashx_p, [zframe_p])
+lib.prototype('zhashx_unpack_own', zhashx_p, [zframe_p, zhashx_deserializer_fn])
+lib.prototype('zhashx_insert', c_int, [zhashx_p, c_void_p, c_void_p])
+lib.prototype('zhashx_update', None, [zhashx_p, c_void_p, c_void_p])
+lib.prototype('zhashx_delete', None, [zhashx_p, c_void_p])
+lib.prototype('zhashx_purge', None, [zhashx_p])
+lib.prototype('zhashx_lookup', c_void_p, [zhashx_p, c_void_p])
+lib.prototype('zhashx_rename', c_int, [zhashx_p, c_void_p, c_void_p])
+lib.prototype('zhashx_freefn', c_void_p, [zhashx_p, c_void_p, zhashx_free_fn])
+lib.prototype('zhashx_size', c_size_t, [zhashx_p])
+lib.prototype('zhashx_keys', zlistx_p, [zhashx_p])
+lib.prototype('zhashx_values', zlistx_p, [zhashx_p])
+lib.prototype('zhashx_first', c_void_p, [zhashx_p])
+lib.prototype('zhashx_next', c_void_p, [zhashx_p])
+lib.prototype('zhashx_cursor', c_void_p, [zhashx_p])
+lib.prototype('zhashx_comment', None, [zhashx_p, c_char_p])
+lib.prototype('zhashx_save', c_int, [zhashx_p, c_char_p])
+lib.prototype('zhashx_load', c_int, [zhashx_p, c_char_p])
+lib.prototype('zhashx_refresh', c_int, [zhashx_p])
+lib.prototype('zhashx_pack', zframe_p, [zhashx_p])
+lib.prototype('zhashx_pack_own', zframe_p, [zhashx_p, zhashx_serializer_fn])
+lib.prototype('zhashx_dup', zhashx_p, [zhashx_p])
+lib.prototype('zhashx_set_destructor', None, [zhashx_p, zhashx_destructor_fn])
+lib.prototype('zhashx_set_duplicator', None, [zhashx_p, zhashx_duplicator_fn])
+lib.prototype('zhashx_set_key_destructor', None, [zhashx_p, zhashx_destructor_fn])
+lib.prototype('zhashx_set_key_duplicator', None, [zhashx_p, zhashx_duplicator_fn])
+lib.prototype('zhashx_set_key_comparator', None, [zhashx_p, zhashx_comparator_fn])
+lib.prototype('zhashx_set_key_hasher', None, [zhashx_p, zhashx_hash_fn])
+lib.prototype('zhashx_dup_v2', zhashx_p, [zhashx_p])
+lib.prototype('zhashx_test', None, [c_bool])
 
 class Zhashx(object):
     """
@@ -3357,34 +3068,20 @@ since there's no other way to know how to duplicate the item value.
 
 
 # ziflist
-lib.ziflist_new.restype = ziflist_p
-lib.ziflist_new.argtypes = []
-lib.ziflist_destroy.restype = None
-lib.ziflist_destroy.argtypes = [POINTER(ziflist_p)]
-lib.ziflist_reload.restype = None
-lib.ziflist_reload.argtypes = [ziflist_p]
-lib.ziflist_size.restype = c_size_t
-lib.ziflist_size.argtypes = [ziflist_p]
-lib.ziflist_first.restype = c_char_p
-lib.ziflist_first.argtypes = [ziflist_p]
-lib.ziflist_next.restype = c_char_p
-lib.ziflist_next.argtypes = [ziflist_p]
-lib.ziflist_address.restype = c_char_p
-lib.ziflist_address.argtypes = [ziflist_p]
-lib.ziflist_broadcast.restype = c_char_p
-lib.ziflist_broadcast.argtypes = [ziflist_p]
-lib.ziflist_netmask.restype = c_char_p
-lib.ziflist_netmask.argtypes = [ziflist_p]
-lib.ziflist_print.restype = None
-lib.ziflist_print.argtypes = [ziflist_p]
-lib.ziflist_new_ipv6.restype = ziflist_p
-lib.ziflist_new_ipv6.argtypes = []
-lib.ziflist_reload_ipv6.restype = None
-lib.ziflist_reload_ipv6.argtypes = [ziflist_p]
-lib.ziflist_is_ipv6.restype = c_bool
-lib.ziflist_is_ipv6.argtypes = [ziflist_p]
-lib.ziflist_test.restype = None
-lib.ziflist_test.argtypes = [c_bool]
+lib.prototype('ziflist_new', ziflist_p, [])
+lib.prototype('ziflist_destroy', None, [POINTER(ziflist_p)])
+lib.prototype('ziflist_reload', None, [ziflist_p])
+lib.prototype('ziflist_size', c_size_t, [ziflist_p])
+lib.prototype('ziflist_first', c_char_p, [ziflist_p])
+lib.prototype('ziflist_next', c_char_p, [ziflist_p])
+lib.prototype('ziflist_address', c_char_p, [ziflist_p])
+lib.prototype('ziflist_broadcast', c_char_p, [ziflist_p])
+lib.prototype('ziflist_netmask', c_char_p, [ziflist_p])
+lib.prototype('ziflist_print', None, [ziflist_p])
+lib.prototype('ziflist_new_ipv6', ziflist_p, [])
+lib.prototype('ziflist_reload_ipv6', None, [ziflist_p])
+lib.prototype('ziflist_is_ipv6', c_bool, [ziflist_p])
+lib.prototype('ziflist_test', None, [c_bool])
 
 class Ziflist(object):
     """
@@ -3513,48 +3210,27 @@ Includes IPv6 interfaces
 # zlist
 zlist_compare_fn = CFUNCTYPE(c_int, c_void_p, c_void_p)
 zlist_free_fn = CFUNCTYPE(None, c_void_p)
-lib.zlist_new.restype = zlist_p
-lib.zlist_new.argtypes = []
-lib.zlist_destroy.restype = None
-lib.zlist_destroy.argtypes = [POINTER(zlist_p)]
-lib.zlist_first.restype = c_void_p
-lib.zlist_first.argtypes = [zlist_p]
-lib.zlist_next.restype = c_void_p
-lib.zlist_next.argtypes = [zlist_p]
-lib.zlist_last.restype = c_void_p
-lib.zlist_last.argtypes = [zlist_p]
-lib.zlist_head.restype = c_void_p
-lib.zlist_head.argtypes = [zlist_p]
-lib.zlist_tail.restype = c_void_p
-lib.zlist_tail.argtypes = [zlist_p]
-lib.zlist_item.restype = c_void_p
-lib.zlist_item.argtypes = [zlist_p]
-lib.zlist_append.restype = c_int
-lib.zlist_append.argtypes = [zlist_p, c_void_p]
-lib.zlist_push.restype = c_int
-lib.zlist_push.argtypes = [zlist_p, c_void_p]
-lib.zlist_pop.restype = c_void_p
-lib.zlist_pop.argtypes = [zlist_p]
-lib.zlist_exists.restype = c_bool
-lib.zlist_exists.argtypes = [zlist_p, c_void_p]
-lib.zlist_remove.restype = None
-lib.zlist_remove.argtypes = [zlist_p, c_void_p]
-lib.zlist_dup.restype = zlist_p
-lib.zlist_dup.argtypes = [zlist_p]
-lib.zlist_purge.restype = None
-lib.zlist_purge.argtypes = [zlist_p]
-lib.zlist_size.restype = c_size_t
-lib.zlist_size.argtypes = [zlist_p]
-lib.zlist_sort.restype = None
-lib.zlist_sort.argtypes = [zlist_p, zlist_compare_fn]
-lib.zlist_autofree.restype = None
-lib.zlist_autofree.argtypes = [zlist_p]
-lib.zlist_comparefn.restype = None
-lib.zlist_comparefn.argtypes = [zlist_p, zlist_compare_fn]
-lib.zlist_freefn.restype = c_void_p
-lib.zlist_freefn.argtypes = [zlist_p, c_void_p, zlist_free_fn, c_bool]
-lib.zlist_test.restype = None
-lib.zlist_test.argtypes = [c_bool]
+lib.prototype('zlist_new', zlist_p, [])
+lib.prototype('zlist_destroy', None, [POINTER(zlist_p)])
+lib.prototype('zlist_first', c_void_p, [zlist_p])
+lib.prototype('zlist_next', c_void_p, [zlist_p])
+lib.prototype('zlist_last', c_void_p, [zlist_p])
+lib.prototype('zlist_head', c_void_p, [zlist_p])
+lib.prototype('zlist_tail', c_void_p, [zlist_p])
+lib.prototype('zlist_item', c_void_p, [zlist_p])
+lib.prototype('zlist_append', c_int, [zlist_p, c_void_p])
+lib.prototype('zlist_push', c_int, [zlist_p, c_void_p])
+lib.prototype('zlist_pop', c_void_p, [zlist_p])
+lib.prototype('zlist_exists', c_bool, [zlist_p, c_void_p])
+lib.prototype('zlist_remove', None, [zlist_p, c_void_p])
+lib.prototype('zlist_dup', zlist_p, [zlist_p])
+lib.prototype('zlist_purge', None, [zlist_p])
+lib.prototype('zlist_size', c_size_t, [zlist_p])
+lib.prototype('zlist_sort', None, [zlist_p, zlist_compare_fn])
+lib.prototype('zlist_autofree', None, [zlist_p])
+lib.prototype('zlist_comparefn', None, [zlist_p, zlist_compare_fn])
+lib.prototype('zlist_freefn', c_void_p, [zlist_p, c_void_p, zlist_free_fn, c_bool])
+lib.prototype('zlist_test', None, [c_bool])
 
 class Zlist(object):
     """
@@ -3756,64 +3432,35 @@ Returns the item, or NULL if there is no such item.
 zlistx_destructor_fn = CFUNCTYPE(None, POINTER(c_void_p))
 zlistx_duplicator_fn = CFUNCTYPE(c_void_p, c_void_p)
 zlistx_comparator_fn = CFUNCTYPE(c_int, c_void_p, c_void_p)
-lib.zlistx_new.restype = zlistx_p
-lib.zlistx_new.argtypes = []
-lib.zlistx_destroy.restype = None
-lib.zlistx_destroy.argtypes = [POINTER(zlistx_p)]
-lib.zlistx_add_start.restype = c_void_p
-lib.zlistx_add_start.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_add_end.restype = c_void_p
-lib.zlistx_add_end.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_size.restype = c_size_t
-lib.zlistx_size.argtypes = [zlistx_p]
-lib.zlistx_head.restype = c_void_p
-lib.zlistx_head.argtypes = [zlistx_p]
-lib.zlistx_tail.restype = c_void_p
-lib.zlistx_tail.argtypes = [zlistx_p]
-lib.zlistx_first.restype = c_void_p
-lib.zlistx_first.argtypes = [zlistx_p]
-lib.zlistx_next.restype = c_void_p
-lib.zlistx_next.argtypes = [zlistx_p]
-lib.zlistx_prev.restype = c_void_p
-lib.zlistx_prev.argtypes = [zlistx_p]
-lib.zlistx_last.restype = c_void_p
-lib.zlistx_last.argtypes = [zlistx_p]
-lib.zlistx_item.restype = c_void_p
-lib.zlistx_item.argtypes = [zlistx_p]
-lib.zlistx_cursor.restype = c_void_p
-lib.zlistx_cursor.argtypes = [zlistx_p]
-lib.zlistx_handle_item.restype = c_void_p
-lib.zlistx_handle_item.argtypes = [c_void_p]
-lib.zlistx_find.restype = c_void_p
-lib.zlistx_find.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_detach.restype = c_void_p
-lib.zlistx_detach.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_detach_cur.restype = c_void_p
-lib.zlistx_detach_cur.argtypes = [zlistx_p]
-lib.zlistx_delete.restype = c_int
-lib.zlistx_delete.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_move_start.restype = None
-lib.zlistx_move_start.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_move_end.restype = None
-lib.zlistx_move_end.argtypes = [zlistx_p, c_void_p]
-lib.zlistx_purge.restype = None
-lib.zlistx_purge.argtypes = [zlistx_p]
-lib.zlistx_sort.restype = None
-lib.zlistx_sort.argtypes = [zlistx_p]
-lib.zlistx_insert.restype = c_void_p
-lib.zlistx_insert.argtypes = [zlistx_p, c_void_p, c_bool]
-lib.zlistx_reorder.restype = None
-lib.zlistx_reorder.argtypes = [zlistx_p, c_void_p, c_bool]
-lib.zlistx_dup.restype = zlistx_p
-lib.zlistx_dup.argtypes = [zlistx_p]
-lib.zlistx_set_destructor.restype = None
-lib.zlistx_set_destructor.argtypes = [zlistx_p, zlistx_destructor_fn]
-lib.zlistx_set_duplicator.restype = None
-lib.zlistx_set_duplicator.argtypes = [zlistx_p, zlistx_duplicator_fn]
-lib.zlistx_set_comparator.restype = None
-lib.zlistx_set_comparator.argtypes = [zlistx_p, zlistx_comparator_fn]
-lib.zlistx_test.restype = None
-lib.zlistx_test.argtypes = [c_bool]
+lib.prototype('zlistx_new', zlistx_p, [])
+lib.prototype('zlistx_destroy', None, [POINTER(zlistx_p)])
+lib.prototype('zlistx_add_start', c_void_p, [zlistx_p, c_void_p])
+lib.prototype('zlistx_add_end', c_void_p, [zlistx_p, c_void_p])
+lib.prototype('zlistx_size', c_size_t, [zlistx_p])
+lib.prototype('zlistx_head', c_void_p, [zlistx_p])
+lib.prototype('zlistx_tail', c_void_p, [zlistx_p])
+lib.prototype('zlistx_first', c_void_p, [zlistx_p])
+lib.prototype('zlistx_next', c_void_p, [zlistx_p])
+lib.prototype('zlistx_prev', c_void_p, [zlistx_p])
+lib.prototype('zlistx_last', c_void_p, [zlistx_p])
+lib.prototype('zlistx_item', c_void_p, [zlistx_p])
+lib.prototype('zlistx_cursor', c_void_p, [zlistx_p])
+lib.prototype('zlistx_handle_item', c_void_p, [c_void_p])
+lib.prototype('zlistx_find', c_void_p, [zlistx_p, c_void_p])
+lib.prototype('zlistx_detach', c_void_p, [zlistx_p, c_void_p])
+lib.prototype('zlistx_detach_cur', c_void_p, [zlistx_p])
+lib.prototype('zlistx_delete', c_int, [zlistx_p, c_void_p])
+lib.prototype('zlistx_move_start', None, [zlistx_p, c_void_p])
+lib.prototype('zlistx_move_end', None, [zlistx_p, c_void_p])
+lib.prototype('zlistx_purge', None, [zlistx_p])
+lib.prototype('zlistx_sort', None, [zlistx_p])
+lib.prototype('zlistx_insert', c_void_p, [zlistx_p, c_void_p, c_bool])
+lib.prototype('zlistx_reorder', None, [zlistx_p, c_void_p, c_bool])
+lib.prototype('zlistx_dup', zlistx_p, [zlistx_p])
+lib.prototype('zlistx_set_destructor', None, [zlistx_p, zlistx_destructor_fn])
+lib.prototype('zlistx_set_duplicator', None, [zlistx_p, zlistx_duplicator_fn])
+lib.prototype('zlistx_set_comparator', None, [zlistx_p, zlistx_comparator_fn])
+lib.prototype('zlistx_test', None, [c_bool])
 
 class Zlistx(object):
     """
@@ -4076,44 +3723,25 @@ or greater than, item2.
 zloop_reader_fn = CFUNCTYPE(c_int, zloop_p, zsock_p, c_void_p)
 zloop_fn = CFUNCTYPE(c_int, zloop_p, zmq_pollitem_p, c_void_p)
 zloop_timer_fn = CFUNCTYPE(c_int, zloop_p, c_int, c_void_p)
-lib.zloop_new.restype = zloop_p
-lib.zloop_new.argtypes = []
-lib.zloop_destroy.restype = None
-lib.zloop_destroy.argtypes = [POINTER(zloop_p)]
-lib.zloop_reader.restype = c_int
-lib.zloop_reader.argtypes = [zloop_p, zsock_p, zloop_reader_fn, c_void_p]
-lib.zloop_reader_end.restype = None
-lib.zloop_reader_end.argtypes = [zloop_p, zsock_p]
-lib.zloop_reader_set_tolerant.restype = None
-lib.zloop_reader_set_tolerant.argtypes = [zloop_p, zsock_p]
-lib.zloop_poller.restype = c_int
-lib.zloop_poller.argtypes = [zloop_p, zmq_pollitem_p, zloop_fn, c_void_p]
-lib.zloop_poller_end.restype = None
-lib.zloop_poller_end.argtypes = [zloop_p, zmq_pollitem_p]
-lib.zloop_poller_set_tolerant.restype = None
-lib.zloop_poller_set_tolerant.argtypes = [zloop_p, zmq_pollitem_p]
-lib.zloop_timer.restype = c_int
-lib.zloop_timer.argtypes = [zloop_p, c_size_t, c_size_t, zloop_timer_fn, c_void_p]
-lib.zloop_timer_end.restype = c_int
-lib.zloop_timer_end.argtypes = [zloop_p, c_int]
-lib.zloop_ticket.restype = c_void_p
-lib.zloop_ticket.argtypes = [zloop_p, zloop_timer_fn, c_void_p]
-lib.zloop_ticket_reset.restype = None
-lib.zloop_ticket_reset.argtypes = [zloop_p, c_void_p]
-lib.zloop_ticket_delete.restype = None
-lib.zloop_ticket_delete.argtypes = [zloop_p, c_void_p]
-lib.zloop_set_ticket_delay.restype = None
-lib.zloop_set_ticket_delay.argtypes = [zloop_p, c_size_t]
-lib.zloop_set_max_timers.restype = None
-lib.zloop_set_max_timers.argtypes = [zloop_p, c_size_t]
-lib.zloop_set_verbose.restype = None
-lib.zloop_set_verbose.argtypes = [zloop_p, c_bool]
-lib.zloop_set_nonstop.restype = None
-lib.zloop_set_nonstop.argtypes = [zloop_p, c_bool]
-lib.zloop_start.restype = c_int
-lib.zloop_start.argtypes = [zloop_p]
-lib.zloop_test.restype = None
-lib.zloop_test.argtypes = [c_bool]
+lib.prototype('zloop_new', zloop_p, [])
+lib.prototype('zloop_destroy', None, [POINTER(zloop_p)])
+lib.prototype('zloop_reader', c_int, [zloop_p, zsock_p, zloop_reader_fn, c_void_p])
+lib.prototype('zloop_reader_end', None, [zloop_p, zsock_p])
+lib.prototype('zloop_reader_set_tolerant', None, [zloop_p, zsock_p])
+lib.prototype('zloop_poller', c_int, [zloop_p, zmq_pollitem_p, zloop_fn, c_void_p])
+lib.prototype('zloop_poller_end', None, [zloop_p, zmq_pollitem_p])
+lib.prototype('zloop_poller_set_tolerant', None, [zloop_p, zmq_pollitem_p])
+lib.prototype('zloop_timer', c_int, [zloop_p, c_size_t, c_size_t, zloop_timer_fn, c_void_p])
+lib.prototype('zloop_timer_end', c_int, [zloop_p, c_int])
+lib.prototype('zloop_ticket', c_void_p, [zloop_p, zloop_timer_fn, c_void_p])
+lib.prototype('zloop_ticket_reset', None, [zloop_p, c_void_p])
+lib.prototype('zloop_ticket_delete', None, [zloop_p, c_void_p])
+lib.prototype('zloop_set_ticket_delay', None, [zloop_p, c_size_t])
+lib.prototype('zloop_set_max_timers', None, [zloop_p, c_size_t])
+lib.prototype('zloop_set_verbose', None, [zloop_p, c_bool])
+lib.prototype('zloop_set_nonstop', None, [zloop_p, c_bool])
+lib.prototype('zloop_start', c_int, [zloop_p])
+lib.prototype('zloop_test', None, [c_bool])
 
 class Zloop(object):
     """
@@ -4307,78 +3935,42 @@ cancel sockets. Returns 0 if interrupted, -1 if canceled by a handler.
 
 
 # zmsg
-lib.zmsg_new.restype = zmsg_p
-lib.zmsg_new.argtypes = []
-lib.zmsg_destroy.restype = None
-lib.zmsg_destroy.argtypes = [POINTER(zmsg_p)]
-lib.zmsg_recv.restype = zmsg_p
-lib.zmsg_recv.argtypes = [c_void_p]
-lib.zmsg_load.restype = zmsg_p
-lib.zmsg_load.argtypes = [FILE_p]
-lib.zmsg_decode.restype = zmsg_p
-lib.zmsg_decode.argtypes = [zframe_p]
-lib.zmsg_new_signal.restype = zmsg_p
-lib.zmsg_new_signal.argtypes = [c_ubyte]
-lib.zmsg_send.restype = c_int
-lib.zmsg_send.argtypes = [POINTER(zmsg_p), c_void_p]
-lib.zmsg_sendm.restype = c_int
-lib.zmsg_sendm.argtypes = [POINTER(zmsg_p), c_void_p]
-lib.zmsg_size.restype = c_size_t
-lib.zmsg_size.argtypes = [zmsg_p]
-lib.zmsg_content_size.restype = c_size_t
-lib.zmsg_content_size.argtypes = [zmsg_p]
-lib.zmsg_routing_id.restype = c_int
-lib.zmsg_routing_id.argtypes = [zmsg_p]
-lib.zmsg_set_routing_id.restype = None
-lib.zmsg_set_routing_id.argtypes = [zmsg_p, c_int]
-lib.zmsg_prepend.restype = c_int
-lib.zmsg_prepend.argtypes = [zmsg_p, POINTER(zframe_p)]
-lib.zmsg_append.restype = c_int
-lib.zmsg_append.argtypes = [zmsg_p, POINTER(zframe_p)]
-lib.zmsg_pop.restype = zframe_p
-lib.zmsg_pop.argtypes = [zmsg_p]
-lib.zmsg_pushmem.restype = c_int
-lib.zmsg_pushmem.argtypes = [zmsg_p, c_void_p, c_size_t]
-lib.zmsg_addmem.restype = c_int
-lib.zmsg_addmem.argtypes = [zmsg_p, c_void_p, c_size_t]
-lib.zmsg_pushstr.restype = c_int
-lib.zmsg_pushstr.argtypes = [zmsg_p, c_char_p]
-lib.zmsg_addstr.restype = c_int
-lib.zmsg_addstr.argtypes = [zmsg_p, c_char_p]
-lib.zmsg_pushstrf.restype = c_int
-lib.zmsg_pushstrf.argtypes = [zmsg_p, c_char_p]
-lib.zmsg_addstrf.restype = c_int
-lib.zmsg_addstrf.argtypes = [zmsg_p, c_char_p]
-lib.zmsg_popstr.restype = POINTER(c_char)
-lib.zmsg_popstr.argtypes = [zmsg_p]
-lib.zmsg_addmsg.restype = c_int
-lib.zmsg_addmsg.argtypes = [zmsg_p, POINTER(zmsg_p)]
-lib.zmsg_popmsg.restype = zmsg_p
-lib.zmsg_popmsg.argtypes = [zmsg_p]
-lib.zmsg_remove.restype = None
-lib.zmsg_remove.argtypes = [zmsg_p, zframe_p]
-lib.zmsg_first.restype = zframe_p
-lib.zmsg_first.argtypes = [zmsg_p]
-lib.zmsg_next.restype = zframe_p
-lib.zmsg_next.argtypes = [zmsg_p]
-lib.zmsg_last.restype = zframe_p
-lib.zmsg_last.argtypes = [zmsg_p]
-lib.zmsg_save.restype = c_int
-lib.zmsg_save.argtypes = [zmsg_p, FILE_p]
-lib.zmsg_encode.restype = zframe_p
-lib.zmsg_encode.argtypes = [zmsg_p]
-lib.zmsg_dup.restype = zmsg_p
-lib.zmsg_dup.argtypes = [zmsg_p]
-lib.zmsg_print.restype = None
-lib.zmsg_print.argtypes = [zmsg_p]
-lib.zmsg_eq.restype = c_bool
-lib.zmsg_eq.argtypes = [zmsg_p, zmsg_p]
-lib.zmsg_signal.restype = c_int
-lib.zmsg_signal.argtypes = [zmsg_p]
-lib.zmsg_is.restype = c_bool
-lib.zmsg_is.argtypes = [c_void_p]
-lib.zmsg_test.restype = None
-lib.zmsg_test.argtypes = [c_bool]
+lib.prototype('zmsg_new', zmsg_p, [])
+lib.prototype('zmsg_destroy', None, [POINTER(zmsg_p)])
+lib.prototype('zmsg_recv', zmsg_p, [c_void_p])
+lib.prototype('zmsg_load', zmsg_p, [FILE_p])
+lib.prototype('zmsg_decode', zmsg_p, [zframe_p])
+lib.prototype('zmsg_new_signal', zmsg_p, [c_ubyte])
+lib.prototype('zmsg_send', c_int, [POINTER(zmsg_p), c_void_p])
+lib.prototype('zmsg_sendm', c_int, [POINTER(zmsg_p), c_void_p])
+lib.prototype('zmsg_size', c_size_t, [zmsg_p])
+lib.prototype('zmsg_content_size', c_size_t, [zmsg_p])
+lib.prototype('zmsg_routing_id', c_int, [zmsg_p])
+lib.prototype('zmsg_set_routing_id', None, [zmsg_p, c_int])
+lib.prototype('zmsg_prepend', c_int, [zmsg_p, POINTER(zframe_p)])
+lib.prototype('zmsg_append', c_int, [zmsg_p, POINTER(zframe_p)])
+lib.prototype('zmsg_pop', zframe_p, [zmsg_p])
+lib.prototype('zmsg_pushmem', c_int, [zmsg_p, c_void_p, c_size_t])
+lib.prototype('zmsg_addmem', c_int, [zmsg_p, c_void_p, c_size_t])
+lib.prototype('zmsg_pushstr', c_int, [zmsg_p, c_char_p])
+lib.prototype('zmsg_addstr', c_int, [zmsg_p, c_char_p])
+lib.prototype('zmsg_pushstrf', c_int, [zmsg_p, c_char_p])
+lib.prototype('zmsg_addstrf', c_int, [zmsg_p, c_char_p])
+lib.prototype('zmsg_popstr', POINTER(c_char), [zmsg_p])
+lib.prototype('zmsg_addmsg', c_int, [zmsg_p, POINTER(zmsg_p)])
+lib.prototype('zmsg_popmsg', zmsg_p, [zmsg_p])
+lib.prototype('zmsg_remove', None, [zmsg_p, zframe_p])
+lib.prototype('zmsg_first', zframe_p, [zmsg_p])
+lib.prototype('zmsg_next', zframe_p, [zmsg_p])
+lib.prototype('zmsg_last', zframe_p, [zmsg_p])
+lib.prototype('zmsg_save', c_int, [zmsg_p, FILE_p])
+lib.prototype('zmsg_encode', zframe_p, [zmsg_p])
+lib.prototype('zmsg_dup', zmsg_p, [zmsg_p])
+lib.prototype('zmsg_print', None, [zmsg_p])
+lib.prototype('zmsg_eq', c_bool, [zmsg_p, zmsg_p])
+lib.prototype('zmsg_signal', c_int, [zmsg_p])
+lib.prototype('zmsg_is', c_bool, [c_void_p])
+lib.prototype('zmsg_test', None, [c_bool])
 
 class Zmsg(object):
     """
@@ -4690,24 +4282,15 @@ other message. As with zframe_eq, return false if either message is NULL.
 
 
 # zpoller
-lib.zpoller_new.restype = zpoller_p
-lib.zpoller_new.argtypes = [c_void_p]
-lib.zpoller_destroy.restype = None
-lib.zpoller_destroy.argtypes = [POINTER(zpoller_p)]
-lib.zpoller_add.restype = c_int
-lib.zpoller_add.argtypes = [zpoller_p, c_void_p]
-lib.zpoller_remove.restype = c_int
-lib.zpoller_remove.argtypes = [zpoller_p, c_void_p]
-lib.zpoller_set_nonstop.restype = None
-lib.zpoller_set_nonstop.argtypes = [zpoller_p, c_bool]
-lib.zpoller_wait.restype = c_void_p
-lib.zpoller_wait.argtypes = [zpoller_p, c_int]
-lib.zpoller_expired.restype = c_bool
-lib.zpoller_expired.argtypes = [zpoller_p]
-lib.zpoller_terminated.restype = c_bool
-lib.zpoller_terminated.argtypes = [zpoller_p]
-lib.zpoller_test.restype = None
-lib.zpoller_test.argtypes = [c_bool]
+lib.prototype('zpoller_new', zpoller_p, [c_void_p])
+lib.prototype('zpoller_destroy', None, [POINTER(zpoller_p)])
+lib.prototype('zpoller_add', c_int, [zpoller_p, c_void_p])
+lib.prototype('zpoller_remove', c_int, [zpoller_p, c_void_p])
+lib.prototype('zpoller_set_nonstop', None, [zpoller_p, c_bool])
+lib.prototype('zpoller_wait', c_void_p, [zpoller_p, c_int])
+lib.prototype('zpoller_expired', c_bool, [zpoller_p])
+lib.prototype('zpoller_terminated', c_bool, [zpoller_p])
+lib.prototype('zpoller_test', None, [c_bool])
 
 class Zpoller(object):
     """
@@ -4819,50 +4402,28 @@ was interrupted, or the parent context was destroyed.
 
 
 # zproc
-lib.zproc_new.restype = zproc_p
-lib.zproc_new.argtypes = []
-lib.zproc_destroy.restype = None
-lib.zproc_destroy.argtypes = [POINTER(zproc_p)]
-lib.zproc_args.restype = zlist_p
-lib.zproc_args.argtypes = [zproc_p]
-lib.zproc_set_args.restype = None
-lib.zproc_set_args.argtypes = [zproc_p, POINTER(zlist_p)]
-lib.zproc_set_argsx.restype = None
-lib.zproc_set_argsx.argtypes = [zproc_p, c_char_p]
-lib.zproc_set_env.restype = None
-lib.zproc_set_env.argtypes = [zproc_p, POINTER(zhash_p)]
-lib.zproc_set_stdin.restype = None
-lib.zproc_set_stdin.argtypes = [zproc_p, c_void_p]
-lib.zproc_set_stdout.restype = None
-lib.zproc_set_stdout.argtypes = [zproc_p, c_void_p]
-lib.zproc_set_stderr.restype = None
-lib.zproc_set_stderr.argtypes = [zproc_p, c_void_p]
-lib.zproc_stdin.restype = c_void_p
-lib.zproc_stdin.argtypes = [zproc_p]
-lib.zproc_stdout.restype = c_void_p
-lib.zproc_stdout.argtypes = [zproc_p]
-lib.zproc_stderr.restype = c_void_p
-lib.zproc_stderr.argtypes = [zproc_p]
-lib.zproc_run.restype = c_int
-lib.zproc_run.argtypes = [zproc_p]
-lib.zproc_returncode.restype = c_int
-lib.zproc_returncode.argtypes = [zproc_p]
-lib.zproc_pid.restype = c_int
-lib.zproc_pid.argtypes = [zproc_p]
-lib.zproc_running.restype = c_bool
-lib.zproc_running.argtypes = [zproc_p]
-lib.zproc_wait.restype = c_int
-lib.zproc_wait.argtypes = [zproc_p, c_int]
-lib.zproc_shutdown.restype = None
-lib.zproc_shutdown.argtypes = [zproc_p, c_int]
-lib.zproc_actor.restype = c_void_p
-lib.zproc_actor.argtypes = [zproc_p]
-lib.zproc_kill.restype = None
-lib.zproc_kill.argtypes = [zproc_p, c_int]
-lib.zproc_set_verbose.restype = None
-lib.zproc_set_verbose.argtypes = [zproc_p, c_bool]
-lib.zproc_test.restype = None
-lib.zproc_test.argtypes = [c_bool]
+lib.prototype('zproc_new', zproc_p, [])
+lib.prototype('zproc_destroy', None, [POINTER(zproc_p)])
+lib.prototype('zproc_args', zlist_p, [zproc_p])
+lib.prototype('zproc_set_args', None, [zproc_p, POINTER(zlist_p)])
+lib.prototype('zproc_set_argsx', None, [zproc_p, c_char_p])
+lib.prototype('zproc_set_env', None, [zproc_p, POINTER(zhash_p)])
+lib.prototype('zproc_set_stdin', None, [zproc_p, c_void_p])
+lib.prototype('zproc_set_stdout', None, [zproc_p, c_void_p])
+lib.prototype('zproc_set_stderr', None, [zproc_p, c_void_p])
+lib.prototype('zproc_stdin', c_void_p, [zproc_p])
+lib.prototype('zproc_stdout', c_void_p, [zproc_p])
+lib.prototype('zproc_stderr', c_void_p, [zproc_p])
+lib.prototype('zproc_run', c_int, [zproc_p])
+lib.prototype('zproc_returncode', c_int, [zproc_p])
+lib.prototype('zproc_pid', c_int, [zproc_p])
+lib.prototype('zproc_running', c_bool, [zproc_p])
+lib.prototype('zproc_wait', c_int, [zproc_p, c_int])
+lib.prototype('zproc_shutdown', None, [zproc_p, c_int])
+lib.prototype('zproc_actor', c_void_p, [zproc_p])
+lib.prototype('zproc_kill', None, [zproc_p, c_int])
+lib.prototype('zproc_set_verbose', None, [zproc_p, c_bool])
+lib.prototype('zproc_test', None, [c_bool])
 
 class Zproc(object):
     """
@@ -5051,382 +4612,194 @@ eventually send SIGKILL
 
 
 # zsock
-lib.zsock_new.restype = zsock_p
-lib.zsock_new.argtypes = [c_int]
-lib.zsock_destroy.restype = None
-lib.zsock_destroy.argtypes = [POINTER(zsock_p)]
-lib.zsock_new_pub.restype = zsock_p
-lib.zsock_new_pub.argtypes = [c_char_p]
-lib.zsock_new_sub.restype = zsock_p
-lib.zsock_new_sub.argtypes = [c_char_p, c_char_p]
-lib.zsock_new_req.restype = zsock_p
-lib.zsock_new_req.argtypes = [c_char_p]
-lib.zsock_new_rep.restype = zsock_p
-lib.zsock_new_rep.argtypes = [c_char_p]
-lib.zsock_new_dealer.restype = zsock_p
-lib.zsock_new_dealer.argtypes = [c_char_p]
-lib.zsock_new_router.restype = zsock_p
-lib.zsock_new_router.argtypes = [c_char_p]
-lib.zsock_new_push.restype = zsock_p
-lib.zsock_new_push.argtypes = [c_char_p]
-lib.zsock_new_pull.restype = zsock_p
-lib.zsock_new_pull.argtypes = [c_char_p]
-lib.zsock_new_xpub.restype = zsock_p
-lib.zsock_new_xpub.argtypes = [c_char_p]
-lib.zsock_new_xsub.restype = zsock_p
-lib.zsock_new_xsub.argtypes = [c_char_p]
-lib.zsock_new_pair.restype = zsock_p
-lib.zsock_new_pair.argtypes = [c_char_p]
-lib.zsock_new_stream.restype = zsock_p
-lib.zsock_new_stream.argtypes = [c_char_p]
-lib.zsock_new_server.restype = zsock_p
-lib.zsock_new_server.argtypes = [c_char_p]
-lib.zsock_new_client.restype = zsock_p
-lib.zsock_new_client.argtypes = [c_char_p]
-lib.zsock_new_radio.restype = zsock_p
-lib.zsock_new_radio.argtypes = [c_char_p]
-lib.zsock_new_dish.restype = zsock_p
-lib.zsock_new_dish.argtypes = [c_char_p]
-lib.zsock_new_gather.restype = zsock_p
-lib.zsock_new_gather.argtypes = [c_char_p]
-lib.zsock_new_scatter.restype = zsock_p
-lib.zsock_new_scatter.argtypes = [c_char_p]
-lib.zsock_bind.restype = c_int
-lib.zsock_bind.argtypes = [zsock_p, c_char_p]
-lib.zsock_endpoint.restype = c_char_p
-lib.zsock_endpoint.argtypes = [zsock_p]
-lib.zsock_unbind.restype = c_int
-lib.zsock_unbind.argtypes = [zsock_p, c_char_p]
-lib.zsock_connect.restype = c_int
-lib.zsock_connect.argtypes = [zsock_p, c_char_p]
-lib.zsock_disconnect.restype = c_int
-lib.zsock_disconnect.argtypes = [zsock_p, c_char_p]
-lib.zsock_attach.restype = c_int
-lib.zsock_attach.argtypes = [zsock_p, c_char_p, c_bool]
-lib.zsock_type_str.restype = c_char_p
-lib.zsock_type_str.argtypes = [zsock_p]
-lib.zsock_send.restype = c_int
-lib.zsock_send.argtypes = [zsock_p, c_char_p]
-lib.zsock_vsend.restype = c_int
-lib.zsock_vsend.argtypes = [zsock_p, c_char_p, va_list_p]
-lib.zsock_recv.restype = c_int
-lib.zsock_recv.argtypes = [zsock_p, c_char_p]
-lib.zsock_vrecv.restype = c_int
-lib.zsock_vrecv.argtypes = [zsock_p, c_char_p, va_list_p]
-lib.zsock_bsend.restype = c_int
-lib.zsock_bsend.argtypes = [zsock_p, c_char_p]
-lib.zsock_brecv.restype = c_int
-lib.zsock_brecv.argtypes = [zsock_p, c_char_p]
-lib.zsock_routing_id.restype = c_int
-lib.zsock_routing_id.argtypes = [zsock_p]
-lib.zsock_set_routing_id.restype = None
-lib.zsock_set_routing_id.argtypes = [zsock_p, c_int]
-lib.zsock_set_unbounded.restype = None
-lib.zsock_set_unbounded.argtypes = [zsock_p]
-lib.zsock_signal.restype = c_int
-lib.zsock_signal.argtypes = [zsock_p, c_ubyte]
-lib.zsock_wait.restype = c_int
-lib.zsock_wait.argtypes = [zsock_p]
-lib.zsock_flush.restype = None
-lib.zsock_flush.argtypes = [zsock_p]
-lib.zsock_join.restype = c_int
-lib.zsock_join.argtypes = [zsock_p, c_char_p]
-lib.zsock_leave.restype = c_int
-lib.zsock_leave.argtypes = [zsock_p, c_char_p]
-lib.zsock_is.restype = c_bool
-lib.zsock_is.argtypes = [c_void_p]
-lib.zsock_resolve.restype = c_void_p
-lib.zsock_resolve.argtypes = [c_void_p]
-lib.zsock_gssapi_principal_nametype.restype = c_int
-lib.zsock_gssapi_principal_nametype.argtypes = [zsock_p]
-lib.zsock_set_gssapi_principal_nametype.restype = None
-lib.zsock_set_gssapi_principal_nametype.argtypes = [zsock_p, c_int]
-lib.zsock_gssapi_service_principal_nametype.restype = c_int
-lib.zsock_gssapi_service_principal_nametype.argtypes = [zsock_p]
-lib.zsock_set_gssapi_service_principal_nametype.restype = None
-lib.zsock_set_gssapi_service_principal_nametype.argtypes = [zsock_p, c_int]
-lib.zsock_bindtodevice.restype = POINTER(c_char)
-lib.zsock_bindtodevice.argtypes = [zsock_p]
-lib.zsock_set_bindtodevice.restype = None
-lib.zsock_set_bindtodevice.argtypes = [zsock_p, c_char_p]
-lib.zsock_heartbeat_ivl.restype = c_int
-lib.zsock_heartbeat_ivl.argtypes = [zsock_p]
-lib.zsock_set_heartbeat_ivl.restype = None
-lib.zsock_set_heartbeat_ivl.argtypes = [zsock_p, c_int]
-lib.zsock_heartbeat_ttl.restype = c_int
-lib.zsock_heartbeat_ttl.argtypes = [zsock_p]
-lib.zsock_set_heartbeat_ttl.restype = None
-lib.zsock_set_heartbeat_ttl.argtypes = [zsock_p, c_int]
-lib.zsock_heartbeat_timeout.restype = c_int
-lib.zsock_heartbeat_timeout.argtypes = [zsock_p]
-lib.zsock_set_heartbeat_timeout.restype = None
-lib.zsock_set_heartbeat_timeout.argtypes = [zsock_p, c_int]
-lib.zsock_use_fd.restype = c_int
-lib.zsock_use_fd.argtypes = [zsock_p]
-lib.zsock_set_use_fd.restype = None
-lib.zsock_set_use_fd.argtypes = [zsock_p, c_int]
-lib.zsock_set_xpub_manual.restype = None
-lib.zsock_set_xpub_manual.argtypes = [zsock_p, c_int]
-lib.zsock_set_xpub_welcome_msg.restype = None
-lib.zsock_set_xpub_welcome_msg.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_stream_notify.restype = None
-lib.zsock_set_stream_notify.argtypes = [zsock_p, c_int]
-lib.zsock_invert_matching.restype = c_int
-lib.zsock_invert_matching.argtypes = [zsock_p]
-lib.zsock_set_invert_matching.restype = None
-lib.zsock_set_invert_matching.argtypes = [zsock_p, c_int]
-lib.zsock_set_xpub_verboser.restype = None
-lib.zsock_set_xpub_verboser.argtypes = [zsock_p, c_int]
-lib.zsock_connect_timeout.restype = c_int
-lib.zsock_connect_timeout.argtypes = [zsock_p]
-lib.zsock_set_connect_timeout.restype = None
-lib.zsock_set_connect_timeout.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_maxrt.restype = c_int
-lib.zsock_tcp_maxrt.argtypes = [zsock_p]
-lib.zsock_set_tcp_maxrt.restype = None
-lib.zsock_set_tcp_maxrt.argtypes = [zsock_p, c_int]
-lib.zsock_thread_safe.restype = c_int
-lib.zsock_thread_safe.argtypes = [zsock_p]
-lib.zsock_multicast_maxtpdu.restype = c_int
-lib.zsock_multicast_maxtpdu.argtypes = [zsock_p]
-lib.zsock_set_multicast_maxtpdu.restype = None
-lib.zsock_set_multicast_maxtpdu.argtypes = [zsock_p, c_int]
-lib.zsock_vmci_buffer_size.restype = c_int
-lib.zsock_vmci_buffer_size.argtypes = [zsock_p]
-lib.zsock_set_vmci_buffer_size.restype = None
-lib.zsock_set_vmci_buffer_size.argtypes = [zsock_p, c_int]
-lib.zsock_vmci_buffer_min_size.restype = c_int
-lib.zsock_vmci_buffer_min_size.argtypes = [zsock_p]
-lib.zsock_set_vmci_buffer_min_size.restype = None
-lib.zsock_set_vmci_buffer_min_size.argtypes = [zsock_p, c_int]
-lib.zsock_vmci_buffer_max_size.restype = c_int
-lib.zsock_vmci_buffer_max_size.argtypes = [zsock_p]
-lib.zsock_set_vmci_buffer_max_size.restype = None
-lib.zsock_set_vmci_buffer_max_size.argtypes = [zsock_p, c_int]
-lib.zsock_vmci_connect_timeout.restype = c_int
-lib.zsock_vmci_connect_timeout.argtypes = [zsock_p]
-lib.zsock_set_vmci_connect_timeout.restype = None
-lib.zsock_set_vmci_connect_timeout.argtypes = [zsock_p, c_int]
-lib.zsock_tos.restype = c_int
-lib.zsock_tos.argtypes = [zsock_p]
-lib.zsock_set_tos.restype = None
-lib.zsock_set_tos.argtypes = [zsock_p, c_int]
-lib.zsock_set_router_handover.restype = None
-lib.zsock_set_router_handover.argtypes = [zsock_p, c_int]
-lib.zsock_set_connect_rid.restype = None
-lib.zsock_set_connect_rid.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_connect_rid_bin.restype = None
-lib.zsock_set_connect_rid_bin.argtypes = [zsock_p, c_void_p]
-lib.zsock_handshake_ivl.restype = c_int
-lib.zsock_handshake_ivl.argtypes = [zsock_p]
-lib.zsock_set_handshake_ivl.restype = None
-lib.zsock_set_handshake_ivl.argtypes = [zsock_p, c_int]
-lib.zsock_socks_proxy.restype = POINTER(c_char)
-lib.zsock_socks_proxy.argtypes = [zsock_p]
-lib.zsock_set_socks_proxy.restype = None
-lib.zsock_set_socks_proxy.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_xpub_nodrop.restype = None
-lib.zsock_set_xpub_nodrop.argtypes = [zsock_p, c_int]
-lib.zsock_set_router_mandatory.restype = None
-lib.zsock_set_router_mandatory.argtypes = [zsock_p, c_int]
-lib.zsock_set_probe_router.restype = None
-lib.zsock_set_probe_router.argtypes = [zsock_p, c_int]
-lib.zsock_set_req_relaxed.restype = None
-lib.zsock_set_req_relaxed.argtypes = [zsock_p, c_int]
-lib.zsock_set_req_correlate.restype = None
-lib.zsock_set_req_correlate.argtypes = [zsock_p, c_int]
-lib.zsock_set_conflate.restype = None
-lib.zsock_set_conflate.argtypes = [zsock_p, c_int]
-lib.zsock_zap_domain.restype = POINTER(c_char)
-lib.zsock_zap_domain.argtypes = [zsock_p]
-lib.zsock_set_zap_domain.restype = None
-lib.zsock_set_zap_domain.argtypes = [zsock_p, c_char_p]
-lib.zsock_mechanism.restype = c_int
-lib.zsock_mechanism.argtypes = [zsock_p]
-lib.zsock_plain_server.restype = c_int
-lib.zsock_plain_server.argtypes = [zsock_p]
-lib.zsock_set_plain_server.restype = None
-lib.zsock_set_plain_server.argtypes = [zsock_p, c_int]
-lib.zsock_plain_username.restype = POINTER(c_char)
-lib.zsock_plain_username.argtypes = [zsock_p]
-lib.zsock_set_plain_username.restype = None
-lib.zsock_set_plain_username.argtypes = [zsock_p, c_char_p]
-lib.zsock_plain_password.restype = POINTER(c_char)
-lib.zsock_plain_password.argtypes = [zsock_p]
-lib.zsock_set_plain_password.restype = None
-lib.zsock_set_plain_password.argtypes = [zsock_p, c_char_p]
-lib.zsock_curve_server.restype = c_int
-lib.zsock_curve_server.argtypes = [zsock_p]
-lib.zsock_set_curve_server.restype = None
-lib.zsock_set_curve_server.argtypes = [zsock_p, c_int]
-lib.zsock_curve_publickey.restype = POINTER(c_char)
-lib.zsock_curve_publickey.argtypes = [zsock_p]
-lib.zsock_set_curve_publickey.restype = None
-lib.zsock_set_curve_publickey.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_curve_publickey_bin.restype = None
-lib.zsock_set_curve_publickey_bin.argtypes = [zsock_p, c_void_p]
-lib.zsock_curve_secretkey.restype = POINTER(c_char)
-lib.zsock_curve_secretkey.argtypes = [zsock_p]
-lib.zsock_set_curve_secretkey.restype = None
-lib.zsock_set_curve_secretkey.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_curve_secretkey_bin.restype = None
-lib.zsock_set_curve_secretkey_bin.argtypes = [zsock_p, c_void_p]
-lib.zsock_curve_serverkey.restype = POINTER(c_char)
-lib.zsock_curve_serverkey.argtypes = [zsock_p]
-lib.zsock_set_curve_serverkey.restype = None
-lib.zsock_set_curve_serverkey.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_curve_serverkey_bin.restype = None
-lib.zsock_set_curve_serverkey_bin.argtypes = [zsock_p, c_void_p]
-lib.zsock_gssapi_server.restype = c_int
-lib.zsock_gssapi_server.argtypes = [zsock_p]
-lib.zsock_set_gssapi_server.restype = None
-lib.zsock_set_gssapi_server.argtypes = [zsock_p, c_int]
-lib.zsock_gssapi_plaintext.restype = c_int
-lib.zsock_gssapi_plaintext.argtypes = [zsock_p]
-lib.zsock_set_gssapi_plaintext.restype = None
-lib.zsock_set_gssapi_plaintext.argtypes = [zsock_p, c_int]
-lib.zsock_gssapi_principal.restype = POINTER(c_char)
-lib.zsock_gssapi_principal.argtypes = [zsock_p]
-lib.zsock_set_gssapi_principal.restype = None
-lib.zsock_set_gssapi_principal.argtypes = [zsock_p, c_char_p]
-lib.zsock_gssapi_service_principal.restype = POINTER(c_char)
-lib.zsock_gssapi_service_principal.argtypes = [zsock_p]
-lib.zsock_set_gssapi_service_principal.restype = None
-lib.zsock_set_gssapi_service_principal.argtypes = [zsock_p, c_char_p]
-lib.zsock_ipv6.restype = c_int
-lib.zsock_ipv6.argtypes = [zsock_p]
-lib.zsock_set_ipv6.restype = None
-lib.zsock_set_ipv6.argtypes = [zsock_p, c_int]
-lib.zsock_immediate.restype = c_int
-lib.zsock_immediate.argtypes = [zsock_p]
-lib.zsock_set_immediate.restype = None
-lib.zsock_set_immediate.argtypes = [zsock_p, c_int]
-lib.zsock_sndhwm.restype = c_int
-lib.zsock_sndhwm.argtypes = [zsock_p]
-lib.zsock_set_sndhwm.restype = None
-lib.zsock_set_sndhwm.argtypes = [zsock_p, c_int]
-lib.zsock_rcvhwm.restype = c_int
-lib.zsock_rcvhwm.argtypes = [zsock_p]
-lib.zsock_set_rcvhwm.restype = None
-lib.zsock_set_rcvhwm.argtypes = [zsock_p, c_int]
-lib.zsock_maxmsgsize.restype = c_int
-lib.zsock_maxmsgsize.argtypes = [zsock_p]
-lib.zsock_set_maxmsgsize.restype = None
-lib.zsock_set_maxmsgsize.argtypes = [zsock_p, c_int]
-lib.zsock_multicast_hops.restype = c_int
-lib.zsock_multicast_hops.argtypes = [zsock_p]
-lib.zsock_set_multicast_hops.restype = None
-lib.zsock_set_multicast_hops.argtypes = [zsock_p, c_int]
-lib.zsock_set_xpub_verbose.restype = None
-lib.zsock_set_xpub_verbose.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_keepalive.restype = c_int
-lib.zsock_tcp_keepalive.argtypes = [zsock_p]
-lib.zsock_set_tcp_keepalive.restype = None
-lib.zsock_set_tcp_keepalive.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_keepalive_idle.restype = c_int
-lib.zsock_tcp_keepalive_idle.argtypes = [zsock_p]
-lib.zsock_set_tcp_keepalive_idle.restype = None
-lib.zsock_set_tcp_keepalive_idle.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_keepalive_cnt.restype = c_int
-lib.zsock_tcp_keepalive_cnt.argtypes = [zsock_p]
-lib.zsock_set_tcp_keepalive_cnt.restype = None
-lib.zsock_set_tcp_keepalive_cnt.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_keepalive_intvl.restype = c_int
-lib.zsock_tcp_keepalive_intvl.argtypes = [zsock_p]
-lib.zsock_set_tcp_keepalive_intvl.restype = None
-lib.zsock_set_tcp_keepalive_intvl.argtypes = [zsock_p, c_int]
-lib.zsock_tcp_accept_filter.restype = POINTER(c_char)
-lib.zsock_tcp_accept_filter.argtypes = [zsock_p]
-lib.zsock_set_tcp_accept_filter.restype = None
-lib.zsock_set_tcp_accept_filter.argtypes = [zsock_p, c_char_p]
-lib.zsock_last_endpoint.restype = POINTER(c_char)
-lib.zsock_last_endpoint.argtypes = [zsock_p]
-lib.zsock_set_router_raw.restype = None
-lib.zsock_set_router_raw.argtypes = [zsock_p, c_int]
-lib.zsock_ipv4only.restype = c_int
-lib.zsock_ipv4only.argtypes = [zsock_p]
-lib.zsock_set_ipv4only.restype = None
-lib.zsock_set_ipv4only.argtypes = [zsock_p, c_int]
-lib.zsock_set_delay_attach_on_connect.restype = None
-lib.zsock_set_delay_attach_on_connect.argtypes = [zsock_p, c_int]
-lib.zsock_hwm.restype = c_int
-lib.zsock_hwm.argtypes = [zsock_p]
-lib.zsock_set_hwm.restype = None
-lib.zsock_set_hwm.argtypes = [zsock_p, c_int]
-lib.zsock_swap.restype = c_int
-lib.zsock_swap.argtypes = [zsock_p]
-lib.zsock_set_swap.restype = None
-lib.zsock_set_swap.argtypes = [zsock_p, c_int]
-lib.zsock_affinity.restype = c_int
-lib.zsock_affinity.argtypes = [zsock_p]
-lib.zsock_set_affinity.restype = None
-lib.zsock_set_affinity.argtypes = [zsock_p, c_int]
-lib.zsock_identity.restype = POINTER(c_char)
-lib.zsock_identity.argtypes = [zsock_p]
-lib.zsock_set_identity.restype = None
-lib.zsock_set_identity.argtypes = [zsock_p, c_char_p]
-lib.zsock_rate.restype = c_int
-lib.zsock_rate.argtypes = [zsock_p]
-lib.zsock_set_rate.restype = None
-lib.zsock_set_rate.argtypes = [zsock_p, c_int]
-lib.zsock_recovery_ivl.restype = c_int
-lib.zsock_recovery_ivl.argtypes = [zsock_p]
-lib.zsock_set_recovery_ivl.restype = None
-lib.zsock_set_recovery_ivl.argtypes = [zsock_p, c_int]
-lib.zsock_recovery_ivl_msec.restype = c_int
-lib.zsock_recovery_ivl_msec.argtypes = [zsock_p]
-lib.zsock_set_recovery_ivl_msec.restype = None
-lib.zsock_set_recovery_ivl_msec.argtypes = [zsock_p, c_int]
-lib.zsock_mcast_loop.restype = c_int
-lib.zsock_mcast_loop.argtypes = [zsock_p]
-lib.zsock_set_mcast_loop.restype = None
-lib.zsock_set_mcast_loop.argtypes = [zsock_p, c_int]
-lib.zsock_rcvtimeo.restype = c_int
-lib.zsock_rcvtimeo.argtypes = [zsock_p]
-lib.zsock_set_rcvtimeo.restype = None
-lib.zsock_set_rcvtimeo.argtypes = [zsock_p, c_int]
-lib.zsock_sndtimeo.restype = c_int
-lib.zsock_sndtimeo.argtypes = [zsock_p]
-lib.zsock_set_sndtimeo.restype = None
-lib.zsock_set_sndtimeo.argtypes = [zsock_p, c_int]
-lib.zsock_sndbuf.restype = c_int
-lib.zsock_sndbuf.argtypes = [zsock_p]
-lib.zsock_set_sndbuf.restype = None
-lib.zsock_set_sndbuf.argtypes = [zsock_p, c_int]
-lib.zsock_rcvbuf.restype = c_int
-lib.zsock_rcvbuf.argtypes = [zsock_p]
-lib.zsock_set_rcvbuf.restype = None
-lib.zsock_set_rcvbuf.argtypes = [zsock_p, c_int]
-lib.zsock_linger.restype = c_int
-lib.zsock_linger.argtypes = [zsock_p]
-lib.zsock_set_linger.restype = None
-lib.zsock_set_linger.argtypes = [zsock_p, c_int]
-lib.zsock_reconnect_ivl.restype = c_int
-lib.zsock_reconnect_ivl.argtypes = [zsock_p]
-lib.zsock_set_reconnect_ivl.restype = None
-lib.zsock_set_reconnect_ivl.argtypes = [zsock_p, c_int]
-lib.zsock_reconnect_ivl_max.restype = c_int
-lib.zsock_reconnect_ivl_max.argtypes = [zsock_p]
-lib.zsock_set_reconnect_ivl_max.restype = None
-lib.zsock_set_reconnect_ivl_max.argtypes = [zsock_p, c_int]
-lib.zsock_backlog.restype = c_int
-lib.zsock_backlog.argtypes = [zsock_p]
-lib.zsock_set_backlog.restype = None
-lib.zsock_set_backlog.argtypes = [zsock_p, c_int]
-lib.zsock_set_subscribe.restype = None
-lib.zsock_set_subscribe.argtypes = [zsock_p, c_char_p]
-lib.zsock_set_unsubscribe.restype = None
-lib.zsock_set_unsubscribe.argtypes = [zsock_p, c_char_p]
-lib.zsock_type.restype = c_int
-lib.zsock_type.argtypes = [zsock_p]
-lib.zsock_rcvmore.restype = c_int
-lib.zsock_rcvmore.argtypes = [zsock_p]
-lib.zsock_fd.restype = socket_p
-lib.zsock_fd.argtypes = [zsock_p]
-lib.zsock_events.restype = c_int
-lib.zsock_events.argtypes = [zsock_p]
-lib.zsock_test.restype = None
-lib.zsock_test.argtypes = [c_bool]
+lib.prototype('zsock_new', zsock_p, [c_int])
+lib.prototype('zsock_destroy', None, [POINTER(zsock_p)])
+lib.prototype('zsock_new_pub', zsock_p, [c_char_p])
+lib.prototype('zsock_new_sub', zsock_p, [c_char_p, c_char_p])
+lib.prototype('zsock_new_req', zsock_p, [c_char_p])
+lib.prototype('zsock_new_rep', zsock_p, [c_char_p])
+lib.prototype('zsock_new_dealer', zsock_p, [c_char_p])
+lib.prototype('zsock_new_router', zsock_p, [c_char_p])
+lib.prototype('zsock_new_push', zsock_p, [c_char_p])
+lib.prototype('zsock_new_pull', zsock_p, [c_char_p])
+lib.prototype('zsock_new_xpub', zsock_p, [c_char_p])
+lib.prototype('zsock_new_xsub', zsock_p, [c_char_p])
+lib.prototype('zsock_new_pair', zsock_p, [c_char_p])
+lib.prototype('zsock_new_stream', zsock_p, [c_char_p])
+lib.prototype('zsock_new_server', zsock_p, [c_char_p])
+lib.prototype('zsock_new_client', zsock_p, [c_char_p])
+lib.prototype('zsock_new_radio', zsock_p, [c_char_p])
+lib.prototype('zsock_new_dish', zsock_p, [c_char_p])
+lib.prototype('zsock_new_gather', zsock_p, [c_char_p])
+lib.prototype('zsock_new_scatter', zsock_p, [c_char_p])
+lib.prototype('zsock_bind', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_endpoint', c_char_p, [zsock_p])
+lib.prototype('zsock_unbind', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_connect', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_disconnect', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_attach', c_int, [zsock_p, c_char_p, c_bool])
+lib.prototype('zsock_type_str', c_char_p, [zsock_p])
+lib.prototype('zsock_send', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_vsend', c_int, [zsock_p, c_char_p, va_list_p])
+lib.prototype('zsock_recv', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_vrecv', c_int, [zsock_p, c_char_p, va_list_p])
+lib.prototype('zsock_bsend', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_brecv', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_routing_id', c_int, [zsock_p])
+lib.prototype('zsock_set_routing_id', None, [zsock_p, c_int])
+lib.prototype('zsock_set_unbounded', None, [zsock_p])
+lib.prototype('zsock_signal', c_int, [zsock_p, c_ubyte])
+lib.prototype('zsock_wait', c_int, [zsock_p])
+lib.prototype('zsock_flush', None, [zsock_p])
+lib.prototype('zsock_join', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_leave', c_int, [zsock_p, c_char_p])
+lib.prototype('zsock_is', c_bool, [c_void_p])
+lib.prototype('zsock_resolve', c_void_p, [c_void_p])
+lib.prototype('zsock_gssapi_principal_nametype', c_int, [zsock_p])
+lib.prototype('zsock_set_gssapi_principal_nametype', None, [zsock_p, c_int])
+lib.prototype('zsock_gssapi_service_principal_nametype', c_int, [zsock_p])
+lib.prototype('zsock_set_gssapi_service_principal_nametype', None, [zsock_p, c_int])
+lib.prototype('zsock_bindtodevice', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_bindtodevice', None, [zsock_p, c_char_p])
+lib.prototype('zsock_heartbeat_ivl', c_int, [zsock_p])
+lib.prototype('zsock_set_heartbeat_ivl', None, [zsock_p, c_int])
+lib.prototype('zsock_heartbeat_ttl', c_int, [zsock_p])
+lib.prototype('zsock_set_heartbeat_ttl', None, [zsock_p, c_int])
+lib.prototype('zsock_heartbeat_timeout', c_int, [zsock_p])
+lib.prototype('zsock_set_heartbeat_timeout', None, [zsock_p, c_int])
+lib.prototype('zsock_use_fd', c_int, [zsock_p])
+lib.prototype('zsock_set_use_fd', None, [zsock_p, c_int])
+lib.prototype('zsock_set_xpub_manual', None, [zsock_p, c_int])
+lib.prototype('zsock_set_xpub_welcome_msg', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_stream_notify', None, [zsock_p, c_int])
+lib.prototype('zsock_invert_matching', c_int, [zsock_p])
+lib.prototype('zsock_set_invert_matching', None, [zsock_p, c_int])
+lib.prototype('zsock_set_xpub_verboser', None, [zsock_p, c_int])
+lib.prototype('zsock_connect_timeout', c_int, [zsock_p])
+lib.prototype('zsock_set_connect_timeout', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_maxrt', c_int, [zsock_p])
+lib.prototype('zsock_set_tcp_maxrt', None, [zsock_p, c_int])
+lib.prototype('zsock_thread_safe', c_int, [zsock_p])
+lib.prototype('zsock_multicast_maxtpdu', c_int, [zsock_p])
+lib.prototype('zsock_set_multicast_maxtpdu', None, [zsock_p, c_int])
+lib.prototype('zsock_vmci_buffer_size', c_int, [zsock_p])
+lib.prototype('zsock_set_vmci_buffer_size', None, [zsock_p, c_int])
+lib.prototype('zsock_vmci_buffer_min_size', c_int, [zsock_p])
+lib.prototype('zsock_set_vmci_buffer_min_size', None, [zsock_p, c_int])
+lib.prototype('zsock_vmci_buffer_max_size', c_int, [zsock_p])
+lib.prototype('zsock_set_vmci_buffer_max_size', None, [zsock_p, c_int])
+lib.prototype('zsock_vmci_connect_timeout', c_int, [zsock_p])
+lib.prototype('zsock_set_vmci_connect_timeout', None, [zsock_p, c_int])
+lib.prototype('zsock_tos', c_int, [zsock_p])
+lib.prototype('zsock_set_tos', None, [zsock_p, c_int])
+lib.prototype('zsock_set_router_handover', None, [zsock_p, c_int])
+lib.prototype('zsock_set_connect_rid', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_connect_rid_bin', None, [zsock_p, c_void_p])
+lib.prototype('zsock_handshake_ivl', c_int, [zsock_p])
+lib.prototype('zsock_set_handshake_ivl', None, [zsock_p, c_int])
+lib.prototype('zsock_socks_proxy', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_socks_proxy', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_xpub_nodrop', None, [zsock_p, c_int])
+lib.prototype('zsock_set_router_mandatory', None, [zsock_p, c_int])
+lib.prototype('zsock_set_probe_router', None, [zsock_p, c_int])
+lib.prototype('zsock_set_req_relaxed', None, [zsock_p, c_int])
+lib.prototype('zsock_set_req_correlate', None, [zsock_p, c_int])
+lib.prototype('zsock_set_conflate', None, [zsock_p, c_int])
+lib.prototype('zsock_zap_domain', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_zap_domain', None, [zsock_p, c_char_p])
+lib.prototype('zsock_mechanism', c_int, [zsock_p])
+lib.prototype('zsock_plain_server', c_int, [zsock_p])
+lib.prototype('zsock_set_plain_server', None, [zsock_p, c_int])
+lib.prototype('zsock_plain_username', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_plain_username', None, [zsock_p, c_char_p])
+lib.prototype('zsock_plain_password', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_plain_password', None, [zsock_p, c_char_p])
+lib.prototype('zsock_curve_server', c_int, [zsock_p])
+lib.prototype('zsock_set_curve_server', None, [zsock_p, c_int])
+lib.prototype('zsock_curve_publickey', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_curve_publickey', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_curve_publickey_bin', None, [zsock_p, c_void_p])
+lib.prototype('zsock_curve_secretkey', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_curve_secretkey', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_curve_secretkey_bin', None, [zsock_p, c_void_p])
+lib.prototype('zsock_curve_serverkey', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_curve_serverkey', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_curve_serverkey_bin', None, [zsock_p, c_void_p])
+lib.prototype('zsock_gssapi_server', c_int, [zsock_p])
+lib.prototype('zsock_set_gssapi_server', None, [zsock_p, c_int])
+lib.prototype('zsock_gssapi_plaintext', c_int, [zsock_p])
+lib.prototype('zsock_set_gssapi_plaintext', None, [zsock_p, c_int])
+lib.prototype('zsock_gssapi_principal', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_gssapi_principal', None, [zsock_p, c_char_p])
+lib.prototype('zsock_gssapi_service_principal', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_gssapi_service_principal', None, [zsock_p, c_char_p])
+lib.prototype('zsock_ipv6', c_int, [zsock_p])
+lib.prototype('zsock_set_ipv6', None, [zsock_p, c_int])
+lib.prototype('zsock_immediate', c_int, [zsock_p])
+lib.prototype('zsock_set_immediate', None, [zsock_p, c_int])
+lib.prototype('zsock_sndhwm', c_int, [zsock_p])
+lib.prototype('zsock_set_sndhwm', None, [zsock_p, c_int])
+lib.prototype('zsock_rcvhwm', c_int, [zsock_p])
+lib.prototype('zsock_set_rcvhwm', None, [zsock_p, c_int])
+lib.prototype('zsock_maxmsgsize', c_int, [zsock_p])
+lib.prototype('zsock_set_maxmsgsize', None, [zsock_p, c_int])
+lib.prototype('zsock_multicast_hops', c_int, [zsock_p])
+lib.prototype('zsock_set_multicast_hops', None, [zsock_p, c_int])
+lib.prototype('zsock_set_xpub_verbose', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_keepalive', c_int, [zsock_p])
+lib.prototype('zsock_set_tcp_keepalive', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_keepalive_idle', c_int, [zsock_p])
+lib.prototype('zsock_set_tcp_keepalive_idle', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_keepalive_cnt', c_int, [zsock_p])
+lib.prototype('zsock_set_tcp_keepalive_cnt', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_keepalive_intvl', c_int, [zsock_p])
+lib.prototype('zsock_set_tcp_keepalive_intvl', None, [zsock_p, c_int])
+lib.prototype('zsock_tcp_accept_filter', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_tcp_accept_filter', None, [zsock_p, c_char_p])
+lib.prototype('zsock_last_endpoint', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_router_raw', None, [zsock_p, c_int])
+lib.prototype('zsock_ipv4only', c_int, [zsock_p])
+lib.prototype('zsock_set_ipv4only', None, [zsock_p, c_int])
+lib.prototype('zsock_set_delay_attach_on_connect', None, [zsock_p, c_int])
+lib.prototype('zsock_hwm', c_int, [zsock_p])
+lib.prototype('zsock_set_hwm', None, [zsock_p, c_int])
+lib.prototype('zsock_swap', c_int, [zsock_p])
+lib.prototype('zsock_set_swap', None, [zsock_p, c_int])
+lib.prototype('zsock_affinity', c_int, [zsock_p])
+lib.prototype('zsock_set_affinity', None, [zsock_p, c_int])
+lib.prototype('zsock_identity', POINTER(c_char), [zsock_p])
+lib.prototype('zsock_set_identity', None, [zsock_p, c_char_p])
+lib.prototype('zsock_rate', c_int, [zsock_p])
+lib.prototype('zsock_set_rate', None, [zsock_p, c_int])
+lib.prototype('zsock_recovery_ivl', c_int, [zsock_p])
+lib.prototype('zsock_set_recovery_ivl', None, [zsock_p, c_int])
+lib.prototype('zsock_recovery_ivl_msec', c_int, [zsock_p])
+lib.prototype('zsock_set_recovery_ivl_msec', None, [zsock_p, c_int])
+lib.prototype('zsock_mcast_loop', c_int, [zsock_p])
+lib.prototype('zsock_set_mcast_loop', None, [zsock_p, c_int])
+lib.prototype('zsock_rcvtimeo', c_int, [zsock_p])
+lib.prototype('zsock_set_rcvtimeo', None, [zsock_p, c_int])
+lib.prototype('zsock_sndtimeo', c_int, [zsock_p])
+lib.prototype('zsock_set_sndtimeo', None, [zsock_p, c_int])
+lib.prototype('zsock_sndbuf', c_int, [zsock_p])
+lib.prototype('zsock_set_sndbuf', None, [zsock_p, c_int])
+lib.prototype('zsock_rcvbuf', c_int, [zsock_p])
+lib.prototype('zsock_set_rcvbuf', None, [zsock_p, c_int])
+lib.prototype('zsock_linger', c_int, [zsock_p])
+lib.prototype('zsock_set_linger', None, [zsock_p, c_int])
+lib.prototype('zsock_reconnect_ivl', c_int, [zsock_p])
+lib.prototype('zsock_set_reconnect_ivl', None, [zsock_p, c_int])
+lib.prototype('zsock_reconnect_ivl_max', c_int, [zsock_p])
+lib.prototype('zsock_set_reconnect_ivl_max', None, [zsock_p, c_int])
+lib.prototype('zsock_backlog', c_int, [zsock_p])
+lib.prototype('zsock_set_backlog', None, [zsock_p, c_int])
+lib.prototype('zsock_set_subscribe', None, [zsock_p, c_char_p])
+lib.prototype('zsock_set_unsubscribe', None, [zsock_p, c_char_p])
+lib.prototype('zsock_type', c_int, [zsock_p])
+lib.prototype('zsock_rcvmore', c_int, [zsock_p])
+lib.prototype('zsock_fd', socket_p, [zsock_p])
+lib.prototype('zsock_events', c_int, [zsock_p])
+lib.prototype('zsock_test', None, [c_bool])
 
 class Zsock(object):
     """
@@ -6904,32 +6277,19 @@ Available from libzmq 2.0.0.
 
 
 # zstr
-lib.zstr_recv.restype = POINTER(c_char)
-lib.zstr_recv.argtypes = [c_void_p]
-lib.zstr_recvx.restype = c_int
-lib.zstr_recvx.argtypes = [c_void_p, POINTER(c_char_p)]
-lib.zstr_recv_compress.restype = POINTER(c_char)
-lib.zstr_recv_compress.argtypes = [c_void_p]
-lib.zstr_send.restype = c_int
-lib.zstr_send.argtypes = [c_void_p, c_char_p]
-lib.zstr_sendm.restype = c_int
-lib.zstr_sendm.argtypes = [c_void_p, c_char_p]
-lib.zstr_sendf.restype = c_int
-lib.zstr_sendf.argtypes = [c_void_p, c_char_p]
-lib.zstr_sendfm.restype = c_int
-lib.zstr_sendfm.argtypes = [c_void_p, c_char_p]
-lib.zstr_sendx.restype = c_int
-lib.zstr_sendx.argtypes = [c_void_p, c_char_p]
-lib.zstr_send_compress.restype = c_int
-lib.zstr_send_compress.argtypes = [c_void_p, c_char_p]
-lib.zstr_sendm_compress.restype = c_int
-lib.zstr_sendm_compress.argtypes = [c_void_p, c_char_p]
-lib.zstr_str.restype = POINTER(c_char)
-lib.zstr_str.argtypes = [c_void_p]
-lib.zstr_free.restype = None
-lib.zstr_free.argtypes = [POINTER(c_char_p)]
-lib.zstr_test.restype = None
-lib.zstr_test.argtypes = [c_bool]
+lib.prototype('zstr_recv', POINTER(c_char), [c_void_p])
+lib.prototype('zstr_recvx', c_int, [c_void_p, POINTER(c_char_p)])
+lib.prototype('zstr_recv_compress', POINTER(c_char), [c_void_p])
+lib.prototype('zstr_send', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_sendm', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_sendf', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_sendfm', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_sendx', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_send_compress', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_sendm_compress', c_int, [c_void_p, c_char_p])
+lib.prototype('zstr_str', POINTER(c_char), [c_void_p])
+lib.prototype('zstr_free', None, [POINTER(c_char_p)])
+lib.prototype('zstr_test', None, [c_bool])
 
 class Zstr(object):
     """
@@ -7079,152 +6439,79 @@ a null pointer.
 
 # zsys
 zsys_handler_fn = CFUNCTYPE(None, c_int)
-lib.zsys_init.restype = c_void_p
-lib.zsys_init.argtypes = []
-lib.zsys_shutdown.restype = None
-lib.zsys_shutdown.argtypes = []
-lib.zsys_socket.restype = c_void_p
-lib.zsys_socket.argtypes = [c_int, c_char_p, c_size_t]
-lib.zsys_close.restype = c_int
-lib.zsys_close.argtypes = [c_void_p, c_char_p, c_size_t]
-lib.zsys_sockname.restype = c_char_p
-lib.zsys_sockname.argtypes = [c_int]
-lib.zsys_create_pipe.restype = zsock_p
-lib.zsys_create_pipe.argtypes = [POINTER(zsock_p)]
-lib.zsys_handler_set.restype = None
-lib.zsys_handler_set.argtypes = [POINTER(zsys_handler_fn)]
-lib.zsys_handler_reset.restype = None
-lib.zsys_handler_reset.argtypes = []
-lib.zsys_catch_interrupts.restype = None
-lib.zsys_catch_interrupts.argtypes = []
-lib.zsys_is_interrupted.restype = c_bool
-lib.zsys_is_interrupted.argtypes = []
-lib.zsys_set_interrupted.restype = None
-lib.zsys_set_interrupted.argtypes = []
-lib.zsys_file_exists.restype = c_bool
-lib.zsys_file_exists.argtypes = [c_char_p]
-lib.zsys_file_modified.restype = c_int
-lib.zsys_file_modified.argtypes = [c_char_p]
-lib.zsys_file_mode.restype = c_int
-lib.zsys_file_mode.argtypes = [c_char_p]
-lib.zsys_file_delete.restype = c_int
-lib.zsys_file_delete.argtypes = [c_char_p]
-lib.zsys_file_stable.restype = c_bool
-lib.zsys_file_stable.argtypes = [c_char_p]
-lib.zsys_dir_create.restype = c_int
-lib.zsys_dir_create.argtypes = [c_char_p]
-lib.zsys_dir_delete.restype = c_int
-lib.zsys_dir_delete.argtypes = [c_char_p]
-lib.zsys_dir_change.restype = c_int
-lib.zsys_dir_change.argtypes = [c_char_p]
-lib.zsys_file_mode_private.restype = None
-lib.zsys_file_mode_private.argtypes = []
-lib.zsys_file_mode_default.restype = None
-lib.zsys_file_mode_default.argtypes = []
-lib.zsys_version.restype = None
-lib.zsys_version.argtypes = [POINTER(c_int), POINTER(c_int), POINTER(c_int)]
-lib.zsys_sprintf.restype = c_char_p
-lib.zsys_sprintf.argtypes = [c_char_p]
-lib.zsys_vprintf.restype = c_char_p
-lib.zsys_vprintf.argtypes = [c_char_p, va_list_p]
-lib.zsys_udp_new.restype = socket_p
-lib.zsys_udp_new.argtypes = [c_bool]
-lib.zsys_udp_close.restype = c_int
-lib.zsys_udp_close.argtypes = [socket_p]
-lib.zsys_udp_send.restype = c_int
-lib.zsys_udp_send.argtypes = [socket_p, zframe_p, c_void_p, c_int]
-lib.zsys_udp_recv.restype = zframe_p
-lib.zsys_udp_recv.argtypes = [socket_p, c_char_p, c_int]
-lib.zsys_socket_error.restype = None
-lib.zsys_socket_error.argtypes = [c_char_p]
-lib.zsys_hostname.restype = c_char_p
-lib.zsys_hostname.argtypes = []
-lib.zsys_daemonize.restype = c_int
-lib.zsys_daemonize.argtypes = [c_char_p]
-lib.zsys_run_as.restype = c_int
-lib.zsys_run_as.argtypes = [c_char_p, c_char_p, c_char_p]
-lib.zsys_has_curve.restype = c_bool
-lib.zsys_has_curve.argtypes = []
-lib.zsys_set_io_threads.restype = None
-lib.zsys_set_io_threads.argtypes = [c_size_t]
-lib.zsys_set_thread_sched_policy.restype = None
-lib.zsys_set_thread_sched_policy.argtypes = [c_int]
-lib.zsys_set_thread_priority.restype = None
-lib.zsys_set_thread_priority.argtypes = [c_int]
-lib.zsys_set_max_sockets.restype = None
-lib.zsys_set_max_sockets.argtypes = [c_size_t]
-lib.zsys_socket_limit.restype = c_size_t
-lib.zsys_socket_limit.argtypes = []
-lib.zsys_set_max_msgsz.restype = None
-lib.zsys_set_max_msgsz.argtypes = [c_int]
-lib.zsys_max_msgsz.restype = c_int
-lib.zsys_max_msgsz.argtypes = []
-lib.zsys_set_zero_copy_recv.restype = None
-lib.zsys_set_zero_copy_recv.argtypes = [c_int]
-lib.zsys_zero_copy_recv.restype = c_int
-lib.zsys_zero_copy_recv.argtypes = []
-lib.zsys_set_file_stable_age_msec.restype = None
-lib.zsys_set_file_stable_age_msec.argtypes = [msecs_p]
-lib.zsys_file_stable_age_msec.restype = msecs_p
-lib.zsys_file_stable_age_msec.argtypes = []
-lib.zsys_set_linger.restype = None
-lib.zsys_set_linger.argtypes = [c_size_t]
-lib.zsys_set_sndhwm.restype = None
-lib.zsys_set_sndhwm.argtypes = [c_size_t]
-lib.zsys_set_rcvhwm.restype = None
-lib.zsys_set_rcvhwm.argtypes = [c_size_t]
-lib.zsys_set_pipehwm.restype = None
-lib.zsys_set_pipehwm.argtypes = [c_size_t]
-lib.zsys_pipehwm.restype = c_size_t
-lib.zsys_pipehwm.argtypes = []
-lib.zsys_set_ipv6.restype = None
-lib.zsys_set_ipv6.argtypes = [c_int]
-lib.zsys_ipv6.restype = c_int
-lib.zsys_ipv6.argtypes = []
-lib.zsys_set_interface.restype = None
-lib.zsys_set_interface.argtypes = [c_char_p]
-lib.zsys_interface.restype = c_char_p
-lib.zsys_interface.argtypes = []
-lib.zsys_set_ipv6_address.restype = None
-lib.zsys_set_ipv6_address.argtypes = [c_char_p]
-lib.zsys_ipv6_address.restype = c_char_p
-lib.zsys_ipv6_address.argtypes = []
-lib.zsys_set_ipv6_mcast_address.restype = None
-lib.zsys_set_ipv6_mcast_address.argtypes = [c_char_p]
-lib.zsys_ipv6_mcast_address.restype = c_char_p
-lib.zsys_ipv6_mcast_address.argtypes = []
-lib.zsys_set_auto_use_fd.restype = None
-lib.zsys_set_auto_use_fd.argtypes = [c_int]
-lib.zsys_auto_use_fd.restype = c_int
-lib.zsys_auto_use_fd.argtypes = []
-lib.zsys_zprintf.restype = POINTER(c_char)
-lib.zsys_zprintf.argtypes = [c_char_p, zhash_p]
-lib.zsys_zprintf_error.restype = POINTER(c_char)
-lib.zsys_zprintf_error.argtypes = [c_char_p, zhash_p]
-lib.zsys_zplprintf.restype = POINTER(c_char)
-lib.zsys_zplprintf.argtypes = [c_char_p, zconfig_p]
-lib.zsys_zplprintf_error.restype = POINTER(c_char)
-lib.zsys_zplprintf_error.argtypes = [c_char_p, zconfig_p]
-lib.zsys_set_logident.restype = None
-lib.zsys_set_logident.argtypes = [c_char_p]
-lib.zsys_set_logstream.restype = None
-lib.zsys_set_logstream.argtypes = [FILE_p]
-lib.zsys_set_logsender.restype = None
-lib.zsys_set_logsender.argtypes = [c_char_p]
-lib.zsys_set_logsystem.restype = None
-lib.zsys_set_logsystem.argtypes = [c_bool]
-lib.zsys_error.restype = None
-lib.zsys_error.argtypes = [c_char_p]
-lib.zsys_warning.restype = None
-lib.zsys_warning.argtypes = [c_char_p]
-lib.zsys_notice.restype = None
-lib.zsys_notice.argtypes = [c_char_p]
-lib.zsys_info.restype = None
-lib.zsys_info.argtypes = [c_char_p]
-lib.zsys_debug.restype = None
-lib.zsys_debug.argtypes = [c_char_p]
-lib.zsys_test.restype = None
-lib.zsys_test.argtypes = [c_bool]
+lib.prototype('zsys_init', c_void_p, [])
+lib.prototype('zsys_shutdown', None, [])
+lib.prototype('zsys_socket', c_void_p, [c_int, c_char_p, c_size_t])
+lib.prototype('zsys_close', c_int, [c_void_p, c_char_p, c_size_t])
+lib.prototype('zsys_sockname', c_char_p, [c_int])
+lib.prototype('zsys_create_pipe', zsock_p, [POINTER(zsock_p)])
+lib.prototype('zsys_handler_set', None, [POINTER(zsys_handler_fn)])
+lib.prototype('zsys_handler_reset', None, [])
+lib.prototype('zsys_catch_interrupts', None, [])
+lib.prototype('zsys_is_interrupted', c_bool, [])
+lib.prototype('zsys_set_interrupted', None, [])
+lib.prototype('zsys_file_exists', c_bool, [c_char_p])
+lib.prototype('zsys_file_modified', c_int, [c_char_p])
+lib.prototype('zsys_file_mode', c_int, [c_char_p])
+lib.prototype('zsys_file_delete', c_int, [c_char_p])
+lib.prototype('zsys_file_stable', c_bool, [c_char_p])
+lib.prototype('zsys_dir_create', c_int, [c_char_p])
+lib.prototype('zsys_dir_delete', c_int, [c_char_p])
+lib.prototype('zsys_dir_change', c_int, [c_char_p])
+lib.prototype('zsys_file_mode_private', None, [])
+lib.prototype('zsys_file_mode_default', None, [])
+lib.prototype('zsys_version', None, [POINTER(c_int), POINTER(c_int), POINTER(c_int)])
+lib.prototype('zsys_sprintf', c_char_p, [c_char_p])
+lib.prototype('zsys_vprintf', c_char_p, [c_char_p, va_list_p])
+lib.prototype('zsys_udp_new', socket_p, [c_bool])
+lib.prototype('zsys_udp_close', c_int, [socket_p])
+lib.prototype('zsys_udp_send', c_int, [socket_p, zframe_p, c_void_p, c_int])
+lib.prototype('zsys_udp_recv', zframe_p, [socket_p, c_char_p, c_int])
+lib.prototype('zsys_socket_error', None, [c_char_p])
+lib.prototype('zsys_hostname', c_char_p, [])
+lib.prototype('zsys_daemonize', c_int, [c_char_p])
+lib.prototype('zsys_run_as', c_int, [c_char_p, c_char_p, c_char_p])
+lib.prototype('zsys_has_curve', c_bool, [])
+lib.prototype('zsys_set_io_threads', None, [c_size_t])
+lib.prototype('zsys_set_thread_sched_policy', None, [c_int])
+lib.prototype('zsys_set_thread_priority', None, [c_int])
+lib.prototype('zsys_set_max_sockets', None, [c_size_t])
+lib.prototype('zsys_socket_limit', c_size_t, [])
+lib.prototype('zsys_set_max_msgsz', None, [c_int])
+lib.prototype('zsys_max_msgsz', c_int, [])
+lib.prototype('zsys_set_zero_copy_recv', None, [c_int])
+lib.prototype('zsys_zero_copy_recv', c_int, [])
+lib.prototype('zsys_set_file_stable_age_msec', None, [msecs_p])
+lib.prototype('zsys_file_stable_age_msec', msecs_p, [])
+lib.prototype('zsys_set_linger', None, [c_size_t])
+lib.prototype('zsys_set_sndhwm', None, [c_size_t])
+lib.prototype('zsys_set_rcvhwm', None, [c_size_t])
+lib.prototype('zsys_set_pipehwm', None, [c_size_t])
+lib.prototype('zsys_pipehwm', c_size_t, [])
+lib.prototype('zsys_set_ipv6', None, [c_int])
+lib.prototype('zsys_ipv6', c_int, [])
+lib.prototype('zsys_set_interface', None, [c_char_p])
+lib.prototype('zsys_interface', c_char_p, [])
+lib.prototype('zsys_set_ipv6_address', None, [c_char_p])
+lib.prototype('zsys_ipv6_address', c_char_p, [])
+lib.prototype('zsys_set_ipv6_mcast_address', None, [c_char_p])
+lib.prototype('zsys_ipv6_mcast_address', c_char_p, [])
+lib.prototype('zsys_set_auto_use_fd', None, [c_int])
+lib.prototype('zsys_auto_use_fd', c_int, [])
+lib.prototype('zsys_zprintf', POINTER(c_char), [c_char_p, zhash_p])
+lib.prototype('zsys_zprintf_error', POINTER(c_char), [c_char_p, zhash_p])
+lib.prototype('zsys_zplprintf', POINTER(c_char), [c_char_p, zconfig_p])
+lib.prototype('zsys_zplprintf_error', POINTER(c_char), [c_char_p, zconfig_p])
+lib.prototype('zsys_set_logident', None, [c_char_p])
+lib.prototype('zsys_set_logstream', None, [FILE_p])
+lib.prototype('zsys_set_logsender', None, [c_char_p])
+lib.prototype('zsys_set_logsystem', None, [c_bool])
+lib.prototype('zsys_error', None, [c_char_p])
+lib.prototype('zsys_warning', None, [c_char_p])
+lib.prototype('zsys_notice', None, [c_char_p])
+lib.prototype('zsys_info', None, [c_char_p])
+lib.prototype('zsys_debug', None, [c_char_p])
+lib.prototype('zsys_test', None, [c_bool])
 
 class Zsys(object):
     """
@@ -7913,24 +7200,15 @@ event log on Windows). By default this is disabled.
 
 # ztimerset
 ztimerset_fn = CFUNCTYPE(None, c_int, c_void_p)
-lib.ztimerset_new.restype = ztimerset_p
-lib.ztimerset_new.argtypes = []
-lib.ztimerset_destroy.restype = None
-lib.ztimerset_destroy.argtypes = [POINTER(ztimerset_p)]
-lib.ztimerset_add.restype = c_int
-lib.ztimerset_add.argtypes = [ztimerset_p, c_size_t, ztimerset_fn, c_void_p]
-lib.ztimerset_cancel.restype = c_int
-lib.ztimerset_cancel.argtypes = [ztimerset_p, c_int]
-lib.ztimerset_set_interval.restype = c_int
-lib.ztimerset_set_interval.argtypes = [ztimerset_p, c_int, c_size_t]
-lib.ztimerset_reset.restype = c_int
-lib.ztimerset_reset.argtypes = [ztimerset_p, c_int]
-lib.ztimerset_timeout.restype = c_int
-lib.ztimerset_timeout.argtypes = [ztimerset_p]
-lib.ztimerset_execute.restype = c_int
-lib.ztimerset_execute.argtypes = [ztimerset_p]
-lib.ztimerset_test.restype = None
-lib.ztimerset_test.argtypes = [c_bool]
+lib.prototype('ztimerset_new', ztimerset_p, [])
+lib.prototype('ztimerset_destroy', None, [POINTER(ztimerset_p)])
+lib.prototype('ztimerset_add', c_int, [ztimerset_p, c_size_t, ztimerset_fn, c_void_p])
+lib.prototype('ztimerset_cancel', c_int, [ztimerset_p, c_int])
+lib.prototype('ztimerset_set_interval', c_int, [ztimerset_p, c_int, c_size_t])
+lib.prototype('ztimerset_reset', c_int, [ztimerset_p, c_int])
+lib.prototype('ztimerset_timeout', c_int, [ztimerset_p])
+lib.prototype('ztimerset_execute', c_int, [ztimerset_p])
+lib.prototype('ztimerset_test', None, [c_bool])
 
 class Ztimerset(object):
     """
@@ -8032,28 +7310,17 @@ Returns 0 if OK, -1 on failure.
 
 # ztrie
 ztrie_destroy_data_fn = CFUNCTYPE(None, POINTER(c_void_p))
-lib.ztrie_new.restype = ztrie_p
-lib.ztrie_new.argtypes = [char_p]
-lib.ztrie_destroy.restype = None
-lib.ztrie_destroy.argtypes = [POINTER(ztrie_p)]
-lib.ztrie_insert_route.restype = c_int
-lib.ztrie_insert_route.argtypes = [ztrie_p, c_char_p, c_void_p, ztrie_destroy_data_fn]
-lib.ztrie_remove_route.restype = c_int
-lib.ztrie_remove_route.argtypes = [ztrie_p, c_char_p]
-lib.ztrie_matches.restype = c_bool
-lib.ztrie_matches.argtypes = [ztrie_p, c_char_p]
-lib.ztrie_hit_data.restype = c_void_p
-lib.ztrie_hit_data.argtypes = [ztrie_p]
-lib.ztrie_hit_parameter_count.restype = c_size_t
-lib.ztrie_hit_parameter_count.argtypes = [ztrie_p]
-lib.ztrie_hit_parameters.restype = zhashx_p
-lib.ztrie_hit_parameters.argtypes = [ztrie_p]
-lib.ztrie_hit_asterisk_match.restype = c_char_p
-lib.ztrie_hit_asterisk_match.argtypes = [ztrie_p]
-lib.ztrie_print.restype = None
-lib.ztrie_print.argtypes = [ztrie_p]
-lib.ztrie_test.restype = None
-lib.ztrie_test.argtypes = [c_bool]
+lib.prototype('ztrie_new', ztrie_p, [char_p])
+lib.prototype('ztrie_destroy', None, [POINTER(ztrie_p)])
+lib.prototype('ztrie_insert_route', c_int, [ztrie_p, c_char_p, c_void_p, ztrie_destroy_data_fn])
+lib.prototype('ztrie_remove_route', c_int, [ztrie_p, c_char_p])
+lib.prototype('ztrie_matches', c_bool, [ztrie_p, c_char_p])
+lib.prototype('ztrie_hit_data', c_void_p, [ztrie_p])
+lib.prototype('ztrie_hit_parameter_count', c_size_t, [ztrie_p])
+lib.prototype('ztrie_hit_parameters', zhashx_p, [ztrie_p])
+lib.prototype('ztrie_hit_asterisk_match', c_char_p, [ztrie_p])
+lib.prototype('ztrie_print', None, [ztrie_p])
+lib.prototype('ztrie_test', None, [c_bool])
 
 class Ztrie(object):
     """
@@ -8169,34 +7436,20 @@ or no asterisk match, returns NULL.
 
 
 # zuuid
-lib.zuuid_new.restype = zuuid_p
-lib.zuuid_new.argtypes = []
-lib.zuuid_destroy.restype = None
-lib.zuuid_destroy.argtypes = [POINTER(zuuid_p)]
-lib.zuuid_new_from.restype = zuuid_p
-lib.zuuid_new_from.argtypes = [c_void_p]
-lib.zuuid_set.restype = None
-lib.zuuid_set.argtypes = [zuuid_p, c_void_p]
-lib.zuuid_set_str.restype = c_int
-lib.zuuid_set_str.argtypes = [zuuid_p, c_char_p]
-lib.zuuid_data.restype = c_void_p
-lib.zuuid_data.argtypes = [zuuid_p]
-lib.zuuid_size.restype = c_size_t
-lib.zuuid_size.argtypes = [zuuid_p]
-lib.zuuid_str.restype = c_char_p
-lib.zuuid_str.argtypes = [zuuid_p]
-lib.zuuid_str_canonical.restype = c_char_p
-lib.zuuid_str_canonical.argtypes = [zuuid_p]
-lib.zuuid_export.restype = None
-lib.zuuid_export.argtypes = [zuuid_p, c_void_p]
-lib.zuuid_eq.restype = c_bool
-lib.zuuid_eq.argtypes = [zuuid_p, c_void_p]
-lib.zuuid_neq.restype = c_bool
-lib.zuuid_neq.argtypes = [zuuid_p, c_void_p]
-lib.zuuid_dup.restype = zuuid_p
-lib.zuuid_dup.argtypes = [zuuid_p]
-lib.zuuid_test.restype = None
-lib.zuuid_test.argtypes = [c_bool]
+lib.prototype('zuuid_new', zuuid_p, [])
+lib.prototype('zuuid_destroy', None, [POINTER(zuuid_p)])
+lib.prototype('zuuid_new_from', zuuid_p, [c_void_p])
+lib.prototype('zuuid_set', None, [zuuid_p, c_void_p])
+lib.prototype('zuuid_set_str', c_int, [zuuid_p, c_char_p])
+lib.prototype('zuuid_data', c_void_p, [zuuid_p])
+lib.prototype('zuuid_size', c_size_t, [zuuid_p])
+lib.prototype('zuuid_str', c_char_p, [zuuid_p])
+lib.prototype('zuuid_str_canonical', c_char_p, [zuuid_p])
+lib.prototype('zuuid_export', None, [zuuid_p, c_void_p])
+lib.prototype('zuuid_eq', c_bool, [zuuid_p, c_void_p])
+lib.prototype('zuuid_neq', c_bool, [zuuid_p, c_void_p])
+lib.prototype('zuuid_dup', zuuid_p, [zuuid_p])
+lib.prototype('zuuid_test', None, [c_bool])
 
 class Zuuid(object):
     """
@@ -0,0 +1,109 @@
+# hand-written helpers shared by the generated czmq and zyre ctypes bindings
+
+import os
+import sys
+import threading
+from ctypes import CDLL, RTLD_GLOBAL, cdll
+from ctypes.util import find_library
+
+
+class LazyLibrary(object):
+    """
+    Wraps a loaded CDLL. The generated bindings register the prototype of every function with prototype()
+    instead of setting restype/argtypes at import, the symbol is only resolved and configured the first time
+    it's looked up. After that the function lives in the instance __dict__ and __getattr__ is not involved.
+
+    The app and actor threads both resolve symbols on first use. The CDLL hands every caller the same function
+    object, so it's configured under a lock and only published once restype and argtypes are set.
+    """
+
+    def __init__(self, dll):
+        self._lock = threading.Lock()
+        self._dll = dll
+        self._prototypes = {}
+
+    def __getattr__(self, name):
+        with self._lock:
+            # another thread got here first
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+
+            fn = getattr(self._dll, name)
+
+            p = self._prototypes.get(name)
+            if p is not None:
+                fn.restype, fn.argtypes = p
+
+            setattr(self, name, fn)
+            return fn
+
+    def prototype(self, name, restype, argtypes):
+        self._prototypes[name] = (restype, argtypes)
+
+
+if sys.version_info > (3,):
+    from importlib.machinery import EXTENSION_SUFFIXES
+else:
+    import imp
+    EXTENSION_SUFFIXES = [s for s, _, t in imp.get_suffixes() if t == imp.C_EXTENSION]
+
+
+def load_libc():
+    """
+    libc is only needed for free() and friends. On posix those are already in the process image, dlopen(NULL)
+    gets at them without find_library (which forks ldconfig / gcc on linux).
+    """
+    if os.name == 'posix':
+        return CDLL(None)
+
+    path = find_library('c')
+    if not path:
+        raise ImportError("Unable to find libc")
+
+    return cdll.LoadLibrary(path)
+
+
+def embedded(directory, name):
+    """
+    Return the path of a library bundled by build_ext (lib<name> built as a python extension), or None.
+    """
+    for suffix in EXTENSION_SUFFIXES:
+        path = os.path.join(directory, 'lib' + name + suffix)
+        if os.path.exists(path):
+            return path
+
+
+def load_library(name, soname, env, directory, depends=()):
+    """
+    Load lib<name> without touching the cwd and, on the common paths, without forking.
+
+    Tries, in order: the path cached in $env, the copy embedded in directory, the system soname and finally
+    find_library. Embedded libraries in depends are loaded RTLD_GLOBAL first so the relative rpaths the bundled
+    build uses don't need to resolve. The resolved path is stored in $env so child processes skip the search.
+    """
+    for d in depends:
+        if d:
+            CDLL(d, mode=RTLD_GLOBAL)
+
+    candidates = [os.environ.get(env), embedded(directory, name), soname]
+
+    for path in candidates:
+        if not path:
+            continue
+
+        try:
+            lib = CDLL(path)
+        except OSError:
+            continue
+
+        os.environ[env] = path
+        return lib
+
+    path = find_library(name)
+    if not path:
+        raise ImportError("Unable to find lib%s" % name)
+
+    os.environ[env] = path
+    return cdll.LoadLibrary(path)
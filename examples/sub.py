@@ -12,7 +12,7 @@ socket.setsockopt(zmq.SUBSCRIBE, topicfilter)
 
 control = context.socket(zmq.PUSH)
 control.connect("tcp://localhost:%s" % 5002)
-control.send_multipart(["SUB", topicfilter]) #needs to be done periodically
+control.send_multipart(["SUB", topicfilter])  # re-send it within --sub-ttl if the gateway runs with one
 
 while True:
     topic, messagedata = socket.recv_multipart()
@@ -1,7 +1,10 @@
 # this is really only to maintain versions, you should use and have access to czmq.* and zyre.*
 
+from . import profiling
+
 from ._version import get_versions
 __version__ = get_versions()['version']
 del get_versions
 
-from zyre import *
\ No newline at end of file
+with profiling.timed('libraries'):
+    from zyre import *
\ No newline at end of file
@@ -7,22 +7,195 @@ import zmq
 from .client import Client, DefaultHandler
 from zmq.eventloop import ioloop
 from .utils import get_argument_parser, setup_logging, setup_curve
+from . import profiling
 from .constants import NODE_NAME
+from .store import Store, Policy, Compactor, parse_policy
+from .store.retention import DEFAULT as RETENTION, INTERVAL as RETENTION_INTERVAL
+from .queues import Queues, QUEUE, ACK, PREFETCH, ACK_TIMEOUT, MAX_PENDING, SCHEDULERS, SCHEDULER
 from pprint import pprint
 
 CERT_PATH = os.getenv('ZYRE_CERT_PATH', os.path.expanduser('~/.curve'))
 SECRET_KEY_PATH = os.getenv('ZYRE_CERT_PATH', os.path.expanduser('~/.curve/broker.key_secret'))
 
+STORE_PATH = os.getenv('ZYRE_STORE_PATH')  # nothing is stored unless it's set (or --store is given)
+FSYNC_INTERVAL = int(os.getenv('ZYRE_STORE_FSYNC_INTERVAL', 1000))  # ms
+REPLAY_MAX = int(os.getenv('ZYRE_REPLAY_MAX', 10000))
+REPLAY_BATCH = int(os.getenv('ZYRE_REPLAY_BATCH', 100))
+
+# replay protocol, whispered between a peer and the broker:
+#
+#   peer   -> broker  [$$REPLAY, group, LAST, n] or [$$REPLAY, group, FROM, offset]
+#   broker -> peer    [$$REPLAYED, group, offset, payload..] for each stored message (at most REPLAY_MAX)
+#   broker -> peer    [$$REPLAY, group, END, next offset]
+#
+# a peer that wants more than REPLAY_MAX asks again FROM the END offset. messages are sent REPLAY_BATCH per IOLoop
+# callback, a replay to a peer that's out of credit carries on once it has some again (on_flow). END is always
+# sent last unless the peer goes away
+REPLAY = b'$$REPLAY'
+REPLAYED = b'$$REPLAYED'
+
 logger = logging.getLogger(__name__)
 
 
+# what a peer whispers to the broker (usually right after it JOINs the group) to catch up
+def replay_request(group, last=None, offset=None):
+    if not isinstance(group, bytes):
+        group = group.encode('utf-8')
+
+    if offset is not None:
+        return [REPLAY, group, b'FROM', str(offset).encode('utf-8')]
+
+    return [REPLAY, group, b'LAST', str(last or REPLAY_MAX).encode('utf-8')]
+
+
+# a replay in progress, offset is the next one to send
+class Replay(object):
+    __slots__ = ('peer', 'group', 'offset', 'remaining')
+
+    def __init__(self, peer, group, offset, remaining):
+        self.peer = peer
+        self.group = group
+        self.offset = offset
+        self.remaining = remaining
+
+
 class BrokerHandler(DefaultHandler):
-    def on_shout(self, client, group, peer, address, message):
-        logger.info('SHOUT[{}][{}]: {}'.format(group, peer, message))
+    def __init__(self, store=None, queues=None, loop=None):
+        self.store = store
+        self.queues = queues
+        self.loop = loop
+        self.joined = set()
+        self.stalled = {}  # peer -> replays waiting for it to have credit again
+
+    def on_shout(self, client, event):
+        logger.info('SHOUT[{}][{}]: {} bytes'.format(event.group, event.name, event.size))
+
+        if self.store:
+            self.store.append(event.group_bytes, event.payload)
+
+        if self.queues and event.group_bytes in self.queues:
+            self.deliver(client, self.queues.push(event.group_bytes, event.payload_bytes))
+
+    def on_whisper(self, client, event):
+        # anything from a worker that went EVASIVE means it's back
+        if self.queues:
+            self.deliver(client, self.queues.resume(event.uuid))
+
+        f = event.frames[event.offset:]
+        if len(f) < 3:
+            return
+
+        t = f[0].bytes
+        if t == ACK and self.queues:
+            self.deliver(client, self.queues.ack(event.uuid, f[1].bytes, f[2].bytes))
+
+        elif t == REPLAY and self.store and len(f) > 3:
+            try:
+                n = int(f[3].bytes)
+            except ValueError:
+                logger.warn('bad replay request from {}: {}'.format(event.name, f[3].bytes))
+                return
+
+            self.replay(client, event.uuid, f[1].bytes, f[2].bytes, n)
+
+    def on_join(self, client, event):
+        if not self.queues:
+            return
+
+        name, out = self.queues.join(event.uuid, event.group_bytes)
+        if name is None:
+            return
+
+        # producers SHOUT to the queue's name, we have to be in it to hear them
+        if name not in self.joined:
+            logger.info('queue {} has a worker: {}'.format(name, event.name))
+            self.joined.add(name)
+            client.join(name)
+
+        self.deliver(client, out)
+
+    def on_leave(self, client, event):
+        if self.queues:
+            self.deliver(client, self.queues.leave(event.uuid, event.group_bytes))
+
+    def on_exit(self, client, event):
+        self.stalled.pop(event.uuid, None)
+
+        if self.queues:
+            self.deliver(client, self.queues.exit(event.uuid))
+
+    def on_flow(self, client, event):
+        for r in self.stalled.pop(event.uuid, ()):
+            self._schedule(client, r)
+
+    # it usually comes back, but what it has outstanding goes to someone else now. if it acks them later the acks
+    # are ignored
+    def on_evasive(self, client, event):
+        if self.queues:
+            self.deliver(client, self.queues.evade(event.uuid))
+
+    def expire(self, client):
+        self.deliver(client, self.queues.expire())
+
+    def deliver(self, client, deliveries):
+        for worker, frames in deliveries:
+            try:
+                client.whisper(frames, worker)
+
+            # still counts as outstanding, it's redelivered once its ack is overdue
+            except zmq.Again:
+                logger.warn('queue delivery to {} stalled'.format(worker))
+
+    def replay(self, client, peer, group, mode, n):
+        log = self.store.logs.get(group)
+        n = max(min(n, REPLAY_MAX), 0) if mode == b'LAST' else n
+
+        if log is None:
+            r = Replay(peer, group, 0, 0)
+
+        elif mode == b'LAST':
+            r = Replay(peer, group, log.tail(n), n)
+
+        else:
+            r = Replay(peer, group, max(n, 0), REPLAY_MAX)
+
+        logger.debug('replaying {} from {} to {}'.format(group, r.offset, peer))
+        self._replay(client, r)
+
+    def _schedule(self, client, r):
+        (self.loop or ioloop.IOLoop.current()).add_callback(self._replay, client, r)
+
+    # sends the next REPLAY_BATCH messages of r, END once there's nothing left to send
+    def _replay(self, client, r):
+        log = self.store.logs.get(r.group)
+        records = log.read(r.offset, min(r.remaining, REPLAY_BATCH)) if log and r.remaining else []
+
+        try:
+            for offset, ts, frames in records:
+                client.whisper([REPLAYED, r.group, str(offset).encode('utf-8')] + frames, r.peer)
+                r.offset = offset + 1
+                r.remaining -= 1
+
+            if len(records) == REPLAY_BATCH and r.remaining:
+                self._schedule(client, r)
+                return
+
+            # read everything there is, the peer picks up live from here
+            if r.remaining and log:
+                r.offset = log.next
+
+            client.whisper([REPLAY, r.group, b'END', str(r.offset).encode('utf-8')], r.peer)
+
+        # out of credit, it's picked up again from r.offset once the peer has some (on_flow)
+        except zmq.Again:
+            logger.debug('replay of {} to {} stalled at {}'.format(r.group, r.peer, r.offset))
+            self.stalled.setdefault(r.peer, []).append(r)
 
 
 # see examples/pub.py and sub.py
 def main():
+    profiling.mark('imports')
+
     p = get_argument_parser()
     p = ArgumentParser(
         description=textwrap.dedent('''\
@@ -35,6 +208,29 @@ def main():
         parents=[p]
     )
 
+    p.add_argument('--store', help='where SHOUTs are logged for replay, nothing is stored unless it\'s given '
+                                   '[default %(default)s]', default=STORE_PATH)
+    p.add_argument('--fsync-interval', help='ms between fsyncs of the store [default %(default)s]', type=int,
+                   default=FSYNC_INTERVAL)
+    p.add_argument('--max-age', help='seconds messages are kept for, 0 keeps them [default %(default)s]', type=int,
+                   default=RETENTION.max_age or 0)
+    p.add_argument('--max-bytes', help='max bytes kept per group, 0 is unlimited [default %(default)s]', type=int,
+                   default=RETENTION.max_bytes or 0)
+    p.add_argument('--compact-key', help='keep only the latest message for each value of this frame [default '
+                                         '%(default)s]', type=int, default=RETENTION.key)
+    p.add_argument('--retention', help='per group policy, GROUP:max_age=..,max_bytes=..,key=.. (repeatable)',
+                   action='append', default=[])
+    p.add_argument('--retention-interval', help='seconds between retention runs [default %(default)s]', type=int,
+                   default=RETENTION_INTERVAL)
+    p.add_argument('--queue-prefetch', help='messages outstanding per queue worker [default %(default)s]',
+                   type=int, default=PREFETCH)
+    p.add_argument('--queue-ack-timeout', help='seconds a queue worker has to ack before the message is '
+                                               'redelivered [default %(default)s]', type=int, default=ACK_TIMEOUT)
+    p.add_argument('--queue-max-pending', help='messages held per queue while every worker is busy [default '
+                                               '%(default)s]', type=int, default=MAX_PENDING)
+    p.add_argument('--queue-scheduler', help='how queue workers are picked [default %(default)s]',
+                   choices=SCHEDULERS, default=SCHEDULER)
+
     args = p.parse_args()
 
     setup_logging(args)
@@ -56,14 +252,35 @@ def main():
     ioloop.install()
     loop = ioloop.IOLoop.instance()
 
+    store = None
+    compactor = None
+    if args.store:
+        logger.info('storing messages in %s' % args.store)
+        store = Store(args.store)
+        ioloop.PeriodicCallback(store.sync, args.fsync_interval).start()
+
+        default = Policy(args.max_age or None, args.max_bytes or None, args.compact_key)
+        try:
+            policies = dict(parse_policy(r, default) for r in args.retention)
+        except ValueError as e:
+            p.error(str(e))
+
+        compactor = Compactor(store, policies, default, args.retention_interval)
+        compactor.start()
+
+    queues = Queues(prefetch=args.queue_prefetch, ack_timeout=args.queue_ack_timeout,
+                    max_pending=args.queue_max_pending, scheduler=args.queue_scheduler)
+
+    handler = BrokerHandler(store, queues, loop)
     client = Client(
-        handler=BrokerHandler(),
+        handler=handler,
         loop=loop,
         **args.__dict__
     )
 
     client.start_zyre()
-    loop.add_handler(client.actor, client.handle_message, zmq.POLLIN)
+    ioloop.PeriodicCallback(lambda: handler.expire(client), 1000).start()
+    loop.add_handler(client.actor, client.handle_messages, zmq.POLLIN)
 
     terminated = False
     while not terminated:
@@ -83,6 +300,12 @@ def main():
 
     client.stop_zyre()
 
+    if compactor:
+        compactor.stop()
+
+    if store:
+        store.close()
+
 
 if __name__ == '__main__':
     main()
@@ -7,11 +7,14 @@ import zmq
 from pyzyre.client import Client
 from zmq.eventloop import ioloop
 from pyzyre.utils import get_argument_parser, setup_logging, setup_curve
+from pyzyre import profiling
 
 logger = logging.getLogger('pyzyre.chat')
 
 
 def main():
+    profiling.mark('imports')
+
     p = get_argument_parser()
     p = ArgumentParser(
         description=textwrap.dedent('''\
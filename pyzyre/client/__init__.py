@@ -5,19 +5,71 @@ from time import sleep
 import names
 from pprint import pprint
 import re
+import uuid
 
 import zmq
-from czmq import Zactor, zactor_fn, create_string_buffer, lib
+from czmq import Zactor, Zsys, zactor_fn, create_string_buffer, lib
 
 from ._task import task as client_task
-from ..utils import resolve_endpoint
+from .events import EVENTS, Event, Enter, Exit, Evasive, Join, Leave, Shout, Whisper, Stall, Flow
+from .peers import Peer, PeerDirectory
+from .transfer import Transfer, Transfers, XFER
+from .reliable import Reliable
+from .dedup import DedupFilter, message_key
+from .legacy import LegacyHandler, is_legacy
+from ..utils import resolve_endpoint, socket_options, setup_socket
+from .. import profiling
 from pyzyre.constants import GOSSIP_PORT, SERVICE_PORT, ZYRE_GROUP, GOSSIP_CONNECT, ENDPOINT, CURVE_ALLOW_ANY, \
-    NODE_NAME, DefaultHandler
+    NODE_NAME, PYVERSION, BATCH_SIZE, CREDIT_WINDOW, FILES_PATH, FILE_CHUNK_SIZE, FILE_WINDOW, \
+    RELIABLE, RETRANSMIT_BUFFER, DEDUP_WINDOW, DEDUP_BITS, DefaultHandler
 
 ZAUTH_TRACE = os.getenv('ZAUTH_TRACE', False)
 
 logger = logging.getLogger(__name__)
 
+if PYVERSION == 2:
+    text_type = unicode
+else:
+    text_type = str
+
+
+def _frames(message):
+    # a payload may be a single frame or a list of frames, frames are handed to pyzmq as-is so
+    # bytes, buffers and zmq.Frame objects are sent without an intermediate copy
+    if not isinstance(message, (list, tuple)):
+        message = [message]
+
+    return [m.encode('utf-8') if isinstance(m, text_type) else m for m in message]
+
+
+# an int option where 0 means something (usually "off"), only a missing / None option gets the default
+def _int_option(kwargs, name, default):
+    v = kwargs.get(name)
+    return default if v is None else int(v)
+
+
+# what an event the handler doesn't implement goes to, handlers needn't subclass DefaultHandler
+def _ignore(client, event):
+    pass
+
+
+# options that can still be applied to the actor pipe once czmq has created it
+PIPE_OPTIONS = ('sndtimeo', 'rcvtimeo')
+
+
+# raw event type (as sent by the actor) -> handler method
+HANDLERS = {
+    b'SHOUT': 'on_shout',
+    b'WHISPER': 'on_whisper',
+    b'ENTER': 'on_enter',
+    b'EXIT': 'on_exit',
+    b'JOIN': 'on_join',
+    b'LEAVE': 'on_leave',
+    b'EVASIVE': 'on_evasive',
+    b'STALL': 'on_stall',
+    b'FLOW': 'on_flow',
+}
+
 
 class Client(object):
 
@@ -26,6 +78,19 @@ class Client(object):
         # disable CZMQ from capturing SIGINT
         os.environ['ZSYS_SIGHANDLER'] = 'false'
 
+        self.directory = PeerDirectory()
+
+        # sequence numbers on SHOUTs and retransmits of the ones peers missed, see reliable.py
+        self.reliable = None
+        if kwargs.get('reliable', RELIABLE):
+            self.reliable = Reliable(self, int(kwargs.get('retransmit_buffer') or RETRANSMIT_BUFFER))
+
+        # SHOUTs already handled in the last dedup seconds are dropped before they get to the handler, see dedup.py
+        self.dedup = None
+        dedup = _int_option(kwargs, 'dedup', DEDUP_WINDOW)
+        if dedup:
+            self.dedup = DedupFilter(dedup, int(kwargs.get('dedup_bits') or DEDUP_BITS))
+
         self.handler = handler
 
         self.group = kwargs.get('group', ZYRE_GROUP)
@@ -43,6 +108,13 @@ class Client(object):
         self.first_node = None
         self.zauth = kwargs.get('zauth_curve_allow')
         self.advertised_endpoint = kwargs.get('advertised_endpoint')
+        self.batch_size = int(kwargs.get('batch_size') or BATCH_SIZE)
+        self.credit = _int_option(kwargs, 'credit', CREDIT_WINDOW)
+        self._stalled = set()
+        self.socket_options = socket_options(kwargs)
+        self.transfers = Transfers(self, kwargs.get('files_path') or FILES_PATH,
+                                   int(kwargs.get('file_window') or FILE_WINDOW),
+                                   int(kwargs.get('file_chunk_size') or FILE_CHUNK_SIZE))
 
         self.name = kwargs.get('name', NODE_NAME)
         if not self.name:
@@ -67,6 +139,7 @@ class Client(object):
 
         self._init_zyre()
 
+    @profiling.timed('zauth')
     def _zauth(self, allow=CURVE_ALLOW_ANY):
         logger.debug("spinning up zauth..")
 
@@ -89,7 +162,8 @@ class Client(object):
     def _init_gossip_connect(self):
         try:
             logger.debug('resolving gossip-connect: {}'.format(self.gossip_connect))
-            self.gossip_connect = resolve_endpoint(self.gossip_connect, GOSSIP_PORT)
+            with profiling.timed('resolve_endpoint'):
+                self.gossip_connect = resolve_endpoint(self.gossip_connect, GOSSIP_PORT)
 
         except RuntimeError as e:
             logger.error(e)
@@ -97,11 +171,13 @@ class Client(object):
             self.beacon = 1
             self.gossip_connect = None
 
-        self.endpoint = resolve_endpoint(self.endpoint, SERVICE_PORT)
+        with profiling.timed('resolve_endpoint'):
+            self.endpoint = resolve_endpoint(self.endpoint, SERVICE_PORT)
 
     def _init_gossip_bind(self):
-        self.gossip_bind = resolve_endpoint(self.gossip_bind, GOSSIP_PORT)
-        self.endpoint = resolve_endpoint(self.endpoint, SERVICE_PORT)
+        with profiling.timed('resolve_endpoint'):
+            self.gossip_bind = resolve_endpoint(self.gossip_bind, GOSSIP_PORT)
+            self.endpoint = resolve_endpoint(self.endpoint, SERVICE_PORT)
 
     def _init_zyre(self):
         # setup czmq/zyre
@@ -120,6 +196,8 @@ class Client(object):
         actor_args = [
             'group=%s' % self.group,
             'name=%s' % self.name,
+            'batch=%d' % self.batch_size,
+            'credit=%d' % self.credit,
         ]
 
         if self.gossip_bind:
@@ -150,9 +228,26 @@ class Client(object):
         self.actor = None
         self._actor = None
 
+    # czmq creates the actor pipe and zyre's sockets itself, the hwms have to be set as czmq's defaults before they
+    # exist. they're process wide: the pipe (both ends share one hwm, sndhwm wins) and any zyre node started after
+    def _set_hwm(self):
+        o = self.socket_options
+
+        if 'sndhwm' in o:
+            Zsys.set_sndhwm(o['sndhwm'])
+
+        if 'rcvhwm' in o:
+            Zsys.set_rcvhwm(o['rcvhwm'])
+
+        if 'sndhwm' in o or 'rcvhwm' in o:
+            Zsys.set_pipehwm(o.get('sndhwm', o.get('rcvhwm')))
+
+    @profiling.timed('start_zyre')
     def start_zyre(self):
+        self._set_hwm()
         self._actor = Zactor(self.task, self.actor_args)
-        self.actor = zmq.Socket(shadow=self._actor.resolve(self._actor).value)
+        self.actor = setup_socket(zmq.Socket(shadow=self._actor.resolve(self._actor).value), self.socket_options,
+                                  PIPE_OPTIONS)
 
     def stop_zyre(self):
         self.actor.send_multipart(['$$STOP'.encode('utf-8')])
@@ -164,64 +259,233 @@ class Client(object):
             del self.zauth  # destroy old actor
             self.zauth = None  # re-establish attrib
 
+    @property
+    def handler(self):
+        return self._handler
+
+    @handler.setter
+    def handler(self, handler):
+        # handlers still taking the pre-event arguments are called the old way, see legacy.py
+        if not isinstance(handler, LegacyHandler) and is_legacy(handler):
+            logger.warn('{} uses the old handler arguments, wrapping it in LegacyHandler'.format(
+                handler.__class__.__name__))
+            handler = LegacyHandler(handler)
+
+        # bind the event class and handler method for each event type up front so dispatch is one dict lookup
+        self._handler = handler
+        self._events = dict((k, (EVENTS[k], getattr(handler, h, _ignore))) for k, h in HANDLERS.items())
+        # membership events also maintain the local peer directory, whispers carry file transfers
+        for k, f in [(b'ENTER', self._enter), (b'EXIT', self._exit), (b'JOIN', self._join), (b'LEAVE', self._leave),
+                     (b'WHISPER', self._whisper), (b'STALL', self._stall), (b'FLOW', self._flow)]:
+            self._events[k] = (f, self._events[k][1])
+
+        if self.reliable or self.dedup:
+            self._events[b'SHOUT'] = (self._shout, self._events[b'SHOUT'][1])
+
     def join(self, group):
         logger.debug('sending join')
-        self.actor.send_multipart(['JOIN', group])
+        if isinstance(group, text_type):
+            group = group.encode('utf-8')
+
+        return self.actor.send_multipart([b'JOIN', group])
 
     def shout(self, group, message):
-        if isinstance(message, str):
-            message = message.encode('utf-8')
+        if isinstance(group, text_type):
+            group = group.encode('utf-8')
 
-        self.actor.send_multipart(['SHOUT'.encode('utf-8'), group.encode('utf-8'), message])
+        message = _frames(message)
+        if self.reliable:
+            message = self.reliable.stamp(group, message)
 
+        return self.actor.send_multipart(['SHOUT'.encode('utf-8'), group] + message, copy=False)
+
+    # address is a Peer, a peer uuid (str, bytes or uuid.UUID) or a peer name
     def whisper(self, message, address):
         logger.debug('sending whisper to %s' % address)
-        if isinstance(message, str):
-            message = message.decode('utf-8')
-        self.actor.send_multipart(['WHISPER'.encode('utf-8'), address, message])
-        logger.debug('message sent via whisper')
+        if isinstance(address, Peer):
+            address = address.uuid
+
+        elif isinstance(address, uuid.UUID):
+            address = address.hex.upper()
+
+        if isinstance(address, text_type):
+            address = address.encode('utf-8')
+
+        # the actor would only queue it, push back on the application instead
+        if self._stalled and self.directory.resolve(address.decode('utf-8')) in self._stalled:
+            raise zmq.Again('peer %s is out of credit' % address.decode('utf-8'))
+
+        return self.actor.send_multipart(['WHISPER'.encode('utf-8'), address] + _frames(message), copy=False)
+
+    # stream a file to a peer (a Peer, uuid or name), the transfer runs as this client handles messages.
+    # the receiver's handler has to accept_file(client, transfer) it, it gets handler.on_file(client, transfer)
+    # once it's written to its files_path, we get handler.on_file_sent(client, transfer) once it's been received
+    def send_file(self, peer, path, name=None):
+        if isinstance(peer, Peer):
+            peer = peer.uuid
+
+        elif isinstance(peer, uuid.UUID):
+            peer = peer.hex.upper()
+
+        if not isinstance(peer, text_type):
+            peer = peer.decode('utf-8')
+
+        u = self.directory.resolve(peer)
+        if not u:
+            raise ValueError('unknown peer: {}'.format(peer))
+
+        return self.transfers.send(u, path, name)
+
+    # messages the client sends on its own (file transfer, reliable SHOUT retransmits), straight to the actor
+    def _send(self, frames):
+        self.actor.send_multipart(frames, copy=False)
 
     def leave(self, group):
         logger.debug('sending LEAVE for %s' % group)
-        self.actor.send_multipart(['LEAVE', group])
+        if isinstance(group, text_type):
+            group = group.encode('utf-8')
 
-    def handle_message(self, s, e):
-        m = s.recv_multipart()
+        return self.actor.send_multipart([b'LEAVE', group])
 
-        m_type = m.pop(0)
+    def _enter(self, m):
+        e = Enter(m)
 
-        if m_type == 'SHOUT':
-            group, peer, address, message = m
-            self.handler.on_shout(self, group, peer, address, message)
+        # set teh first node name in case we need it later (gossip)
+        if not self.first_node and self.gossip_connect:
+            self.first_node = e.name_bytes
 
-        elif m_type == 'ENTER':
-            # set teh first node name in case we need it later (gossip)
-            if not self.first_node and self.gossip_connect:
-                self.first_node = m[1]
+        self.directory.enter(e.uuid, e.name, e.address, e.headers)
 
-            self.handler.on_enter(self, peer=m)
+        # the first peer we see is where startup ends, both calls are no-ops after that
+        profiling.mark('first ENTER')
+        profiling.report()
 
-        elif m_type == 'WHISPER':
-            peer, message = m
-            self.handler.on_whisper(self, peer, message)
+        return e
 
-        elif m_type == 'EXIT':
-            peer, peers_remining = m
-            self.handler.on_exit(self, peer)
+    def _exit(self, m):
+        e = Exit(m)
+        self.directory.exit(e.uuid)
+        self.transfers.exit(e.uuid)
+        self._stalled.discard(e.uuid)
+        if self.reliable:
+            self.reliable.exit(e.uuid)
+        return e
 
-        elif m_type == 'JOIN':
-            peer, group = m
-            self.handler.on_join(self, peer, group)
+    def _stall(self, m):
+        e = Stall(m)
+        self._stalled.add(e.uuid)
+        return e
 
-        elif m_type == 'LEAVE':
-            peer, group = m
-            self.handler.on_leave(self, peer, group)
+    def _flow(self, m):
+        e = Flow(m)
+        self._stalled.discard(e.uuid)
+        return e
 
-        elif m_type == 'EVASIVE':
-            peer = m
-            self.handler.on_evasive(self, peer)
+    # file transfer messages are handled here and never make it to the handler, neither do reliable SHOUT
+    # messages other than retransmits (which are handed on as a Shout)
+    def _whisper(self, m):
+        if len(m) > 5 and len(m[3]) == len(XFER) and m[3].bytes == XFER:
+            self.transfers.handle(Whisper(m))
+            return
 
-        else:
-            logger.warn("unhandled m_type {} rest of message is {}".format(m_type, m))
+        if self.reliable and len(m) >= 6 and self.reliable.is_command(m[3]):
+            e = self.reliable.handle(m)
+            if e is not None and self.dedup and self.dedup.seen(message_key(m)):
+                return
+
+            return e
+
+        return Whisper(m)
 
+    def _shout(self, m):
+        e = self.reliable.received(m) if self.reliable else Shout(m)
+        if e is not None and self.dedup and self.dedup.seen(message_key(m)):
+            return
 
+        return e
+
+    def _join(self, m):
+        e = Join(m)
+        self.directory.join(e.uuid, e.group)
+        return e
+
+    def _leave(self, m):
+        e = Leave(m)
+        self.directory.leave(e.uuid, e.group)
+        return e
+
+    # peer lookups are served from the directory mirrored from the events this client has received, they
+    # never block on the actor or call into libzyre
+    def peers(self):
+        return list(self.directory)
+
+    def peers_in(self, group):
+        if not isinstance(group, text_type):
+            group = group.decode('utf-8')
+
+        return self.directory.in_group(group)
+
+    def peer(self, uuid):
+        if not isinstance(uuid, text_type):
+            uuid = uuid.decode('utf-8')
+
+        return self.directory.get(uuid.upper())
+
+    def handle_message(self, s, e):
+        m = s.recv_multipart(copy=False)
+        t = m[0].bytes
+
+        try:
+            event, h = self._events[t]
+        except KeyError:
+            logger.warn("unhandled m_type {} rest of message is {}".format(t, m[1:]))
+            return
+
+        e = event(m)
+        if e is None:
+            return
+
+        # a retransmitted SHOUT arrives as a WHISPER
+        if e.type != t:
+            h = self._events[e.type][1]
+
+        h(self, e)
+
+    # drain every message waiting on the actor pipe in a single IOLoop callback. if the handler implements
+    # on_batch(client, events) it gets up to batch_size events per call, otherwise each event is dispatched
+    # to the handler in turn
+    def handle_messages(self, s, e):
+        on_batch = getattr(self.handler, 'on_batch', None)
+        batch = []
+
+        while True:
+            try:
+                m = s.recv_multipart(zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+
+            t = m[0].bytes
+            try:
+                event, h = self._events[t]
+            except KeyError:
+                logger.warn("unhandled m_type {} rest of message is {}".format(t, m[1:]))
+                continue
+
+            e = event(m)
+            if e is None:
+                continue
+
+            if not on_batch:
+                if e.type != t:
+                    h = self._events[e.type][1]
+
+                h(self, e)
+                continue
+
+            batch.append(e)
+            if len(batch) == self.batch_size:
+                on_batch(self, batch)
+                batch = []
+
+        if batch:
+            on_batch(self, batch)
@@ -1,93 +1,242 @@
 import logging
 import os
-import uuid
+from collections import deque
 
-from czmq import Zmsg
+from czmq import Zmsg, string_at
 
 TRACE_EVASIVE = os.getenv('ZYRE_EVASITVE_TRACE')
 TRACE = os.getenv('ZYRE_TRACE')
 
 logger = logging.getLogger('pyzyre.client')
 
+CREDIT = b'$$CREDIT'
+
+
+# per peer credit based flow control for whispers
+#
+# a node started with credit=N grants every peer N whispers when it ENTERs ([$$CREDIT, N] whispered to it) and
+# grants more as it forwards them up the pipe, so a slow application (a full pipe) stops the grants. a node only
+# limits whispers to peers that have granted it credit, peers without flow control are never held back. once a
+# peer's credit runs out its whispers are queued here and the application gets [STALL, uuid, name], they go out
+# as credit comes back followed by [FLOW, uuid, name]. shouts and the grants themselves are never held back.
+class Credit(object):
+
+    def __init__(self, node, pipe, peers, window=0):
+        self.node = node
+        self.pipe = pipe
+        self.peers = peers
+        self.window = window
+
+        self.credit = {}  # peer -> whispers we may still send it
+        self.pending = {}  # peer -> whispers waiting for credit
+        self.stalled = set()
+        self.consumed = {}  # peer -> whispers received since we last granted it credit
+
+    def _notify(self, t, peer):
+        p = self.peers.get(peer)
+        self.pipe.send_multipart([t, peer, p.name if p else b''])
+
+    def _grant(self, peer, n):
+        m = Zmsg()
+        m.addstr(CREDIT)
+        m.addstr(str(n).encode('utf-8'))
+        self.node.whisper(peer, m)
+
+    def send(self, peer, message):
+        c = self.credit.get(peer)
+        if c is None:
+            self.node.whisper(peer, message)
+            return
+
+        if c and peer not in self.pending:
+            self.credit[peer] = c - 1
+            self.node.whisper(peer, message)
+            return
+
+        self.pending.setdefault(peer, deque()).append(message)
+        if peer not in self.stalled:
+            self.stalled.add(peer)
+            self._notify(b'STALL', peer)
+
+    @staticmethod
+    def is_grant(m):
+        return m.size() and m.first().streq(CREDIT)
+
+    def granted(self, peer, m):
+        m.popstr()
+        c = self.credit.get(peer, 0) + int(m.popstr())
+
+        q = self.pending.get(peer)
+        while q and c:
+            self.node.whisper(peer, q.popleft())
+            c -= 1
+
+        self.credit[peer] = c
+
+        if q:
+            return
+
+        self.pending.pop(peer, None)
+        if peer in self.stalled:
+            self.stalled.discard(peer)
+            self._notify(b'FLOW', peer)
+
+    def received(self, peer):
+        if not self.window:
+            return
+
+        n = self.consumed.get(peer, 0) + 1
+        if n < max(1, self.window // 2):
+            self.consumed[peer] = n
+            return
+
+        self.consumed[peer] = 0
+        self._grant(peer, n)
+
+    def enter(self, peer):
+        if self.window:
+            self._grant(peer, self.window)
+
+    def exit(self, peer):
+        self.credit.pop(peer, None)
+        self.pending.pop(peer, None)
+        self.consumed.pop(peer, None)
+        self.stalled.discard(peer)
+
 
 class AppHandler(object):
-    def __init__(self, node, peers):
+    def __init__(self, pipe, node, peers, credit):
+        self.pipe = pipe
         self.node = node
         self.peers = peers
+        self.credit = credit
 
+        assert pipe
         assert node
 
+        # raw message type from the pipe -> handler
+        self.handlers = {
+            b'SHOUT': self.on_shout,
+            b'WHISPER': self.on_whisper,
+            b'JOIN': self.on_join,
+            b'LEAVE': self.on_leave,
+            b'$$ID': self.on_id,
+        }
+
+    def on_id(self, message):
+        self.pipe.send(self.node.uuid())
+
     def on_join(self, message):
-        group = message.popstr().decode('utf-8')
+        group = message.popstr()
         logger.debug('joining %s' % group)
         self.node.join(group)
 
+    # the remaining frames of the pipe message are handed to zyre as-is, zyre takes ownership of the zmsg_t
     def on_whisper(self, message):
-        address = message.popstr().decode('utf-8')
-        msg = message.popstr().decode('utf-8')
-        m = Zmsg()
-        m.addstr(msg)
-        address = self.peers[str(address)]
-        address = uuid.UUID(address).hex.upper()
-        self.node.whisper(address, m)
+        address = message.popstr()
+        peer = self.peers.resolve(address)
+        if not peer:
+            logger.warn('unknown peer: {}'.format(address))
+            return
+
+        self.credit.send(peer, message)
 
     def on_shout(self, message):
         g = message.popstr()
-        msg = message.popstr()
-        logger.debug('shouting[%s]: %s' % (g.decode('utf-8'), msg))
-        self.node.shouts(g, msg)
+        logger.debug('shouting[%s]: %d frames' % (g.decode('utf-8'), message.size()))
+        self.node.shout(g, message)
 
     def on_leave(self, message):
         g = message.popstr()
         logger.debug('leaving: %s' % g)
-        self.node.leave(g.encode('utf-8'))
+        self.node.leave(g)
 
 
 class NetworkHandler(object):
 
-    def __init__(self, pipe, node, args, peers):
+    def __init__(self, pipe, node, args, peers, zpipe, credit):
         self.pipe = pipe
+        self.zpipe = zpipe
         self.node = node
         self.args = args
         self.peers = peers
+        self.credit = credit
         self.peer_first = None
 
         assert pipe
+        assert zpipe
         assert args
         assert node
 
+        # raw zyre event type -> handler
+        self.handlers = {
+            b'ENTER': self.on_enter,
+            b'EXIT': self.on_exit,
+            b'JOIN': self.on_join,
+            b'LEAVE': self.on_leave,
+            b'SHOUT': self.on_shout,
+            b'WHISPER': self.on_whisper,
+            b'EVASIVE': self.on_evasive,
+        }
+
     def on_evasive(self, e):
         if TRACE or TRACE_EVASIVE:
             logger.debug('EVASIVE {}'.format(e.peer_name()))
 
-        self.pipe.send_multipart(['EVASIVE'.encode('utf-8'), e.peer_name()])
+        self.pipe.send_multipart(['EVASIVE'.encode('utf-8'), e.peer_uuid(), e.peer_name()])
 
     def on_enter(self, e):
         logger.debug('ENTER {} - {}'.format(e.peer_name(), e.peer_uuid()))
 
-        self.peers[e.peer_name()] = e.peer_uuid()
+        # headers go up the pipe as key, value frame pairs after the address
+        headers = []
+        h = e.headers()
+        item = h.first() if h else None
+        while item:
+            headers.extend([h.cursor(), string_at(item)])
+            item = h.next()
+
+        address = e.peer_addr() or b''
+        self.peers.enter(e.peer_uuid(), e.peer_name(), address, dict(zip(headers[::2], headers[1::2])))
         if not self.peer_first:
             self.peer_first = e.peer_name()  # this should be the gossip node
 
-        self.pipe.send_multipart(['ENTER'.encode('utf-8'), e.peer_uuid(), e.peer_name()])
+        self.pipe.send_multipart(['ENTER'.encode('utf-8'), e.peer_uuid(), e.peer_name(), address] + headers)
+        self.credit.enter(e.peer_uuid())
 
     def on_join(self, e):
         logger.debug('JOIN [{}] [{}]'.format(e.group(), e.peer_name()))
-        self.pipe.send_multipart(['JOIN'.encode('utf-8'), e.peer_name(), e.group()])
+        self.peers.join(e.peer_uuid(), e.group())
+        self.pipe.send_multipart(['JOIN'.encode('utf-8'), e.peer_uuid(), e.peer_name(), e.group()])
 
     def on_leave(self, e):
         logger.debug('LEAVE [{}] [{}]'.format(e.group(), e.peer_name()))
-        self.pipe.send_multipart(['LEAVE'.encode('utf-8'), e.peer_name(), e.group()])
+        self.peers.leave(e.peer_uuid(), e.group())
+        self.pipe.send_multipart(['LEAVE'.encode('utf-8'), e.peer_uuid(), e.peer_name(), e.group()])
+
+    # every message to the application starts with [TYPE, peer uuid, peer name] (see client/events.py).
+    # the event's zmsg_t is forwarded with the header frames pushed on the front, payload frames are never
+    # copied into python
+    def _forward(self, m, *header):
+        for h in reversed(header):
+            m.pushstr(h)
+
+        Zmsg.send(m, self.zpipe)
 
     def on_shout(self, e):
-        m = e.get_msg().popstr()
-        logger.debug('SHOUT [{}] [{}]: {} - {}'.format(e.group(), e.peer_name(), e.peer_uuid(), m))
-        self.pipe.send_multipart(['SHOUT'.encode('utf-8'), e.group(), e.peer_name(), e.peer_uuid(), m])
+        m = e.get_msg()
+        logger.debug('SHOUT [{}] [{}]: {} - {} frames'.format(e.group(), e.peer_name(), e.peer_uuid(), m.size()))
+        self._forward(m, 'SHOUT'.encode('utf-8'), e.peer_uuid(), e.peer_name(), e.group())
 
     def on_whisper(self, e):
-        m = e.get_msg().popstr()
-        logger.debug('WHISPER [{}]: {}'.format(e.peer_name(), m))
-        self.pipe.send_multipart(['WHISPER'.encode('utf-8'), e.peer_name(), e.peer_uuid(), m])
+        m = e.get_msg()
+        if Credit.is_grant(m):
+            self.credit.granted(e.peer_uuid(), m)
+            return
+
+        logger.debug('WHISPER [{}]: {} frames'.format(e.peer_name(), m.size()))
+        self._forward(m, 'WHISPER'.encode('utf-8'), e.peer_uuid(), e.peer_name())
+        self.credit.received(e.peer_uuid())
 
     def on_exit(self, e):
         logger.debug('EXIT [{}] [{}]'.format(e.group(), e.peer_name()))
@@ -96,8 +245,9 @@ class NetworkHandler(object):
         if e.peer_uuid() != self.node.uuid():
             self.node.gossip_unpublish(e.peer_uuid())
 
-        if e.peer_name() in self.peers:
-            del self.peers[e.peer_name()]
+        self.credit.exit(e.peer_uuid())
+
+        if self.peers.exit(e.peer_uuid()):
             if self.args.get('gossip_connect') and (len(self.peers) == 0 or e.peer_name() == self.peer_first):
                 logger.debug('lost connection to gossip node, reconnecting...')
 
@@ -106,4 +256,5 @@ class NetworkHandler(object):
                 else:
                     self.node.gossip_connect(self.args['gossip_connect'])
 
-        self.pipe.send_multipart(['EXIT'.encode('utf-8'), e.peer_name(), str(len(self.peers)).encode('utf-8')])
+        self.pipe.send_multipart(['EXIT'.encode('utf-8'), e.peer_uuid(), e.peer_name(),
+                                 str(len(self.peers)).encode('utf-8')])
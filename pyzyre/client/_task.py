@@ -3,8 +3,9 @@ import os
 
 import zmq
 from czmq import Zsock, string_at, Zmsg, Zcert
-from pyzyre.constants import ZYRE_GROUP
+from pyzyre.constants import ZYRE_GROUP, BATCH_SIZE, CREDIT_WINDOW
 from zyre import Zyre, ZyreEvent
+from .peers import PeerDirectory
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,8 @@ def task(pipe, arg):
         raise RuntimeError('missing node name')
 
     group = args.get('group', ZYRE_GROUP)
+    batch = int(args.get('batch', BATCH_SIZE))
+    window = int(args.get('credit', CREDIT_WINDOW))
 
     logger.debug('setting up node: %s' % name)
     n = Zyre(name.encode('utf-8'))
@@ -92,65 +95,75 @@ def task(pipe, arg):
     logger.debug('staring node...')
     n.start()
 
-    group = group.split('|')
+    # a gateway worker may start without any groups of its own
+    group = [g for g in group.split('|') if g]
     for g in group:
         logger.debug('joining: %s' % g)
         n.join(g.encode('utf-8'))
 
     pipe_zsock_s.signal(0)  # OK
 
-    peers = {}
+    peers = PeerDirectory()
     terminated = False
     # TODO- catch SIGINT
 
-    from ._actor_handler import NetworkHandler, AppHandler
-    handle = NetworkHandler(pipe_s, n, args, peers)
-    app_handler = AppHandler(n, peers)
+    from ._actor_handler import NetworkHandler, AppHandler, Credit
+    credit = Credit(n, pipe_s, peers, window)
+    handle = NetworkHandler(pipe_s, n, args, peers, pipe, credit)
+    app_handler = AppHandler(pipe_s, n, peers, credit)
 
     while not terminated:
-        items = dict(poller.poll())
+        poller.poll()
 
-        try:
-            # from the application to the network
-            if pipe_s in items and items[pipe_s] == zmq.POLLIN:
-                message = Zmsg.recv(pipe)
+        # drain up to batch events per wakeup, alternating between the two directions so a busy pipe can't
+        # starve the network (or vice versa). ZMQ_EVENTS tells us if a recv would block without another poll
+        for _ in range(batch):
+            busy = False
 
-                if not message:
-                    break  # SIGINT
+            try:
+                # from the application to the network
+                if pipe_s.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                    busy = True
+                    message = Zmsg.recv(pipe)
 
-                msg_type = message.popstr().decode('utf-8').upper()
+                    if not message:
+                        terminated = True  # SIGINT
+                        break
 
-                # message to quit
-                if msg_type == "$$STOP":
-                    for g in group:
-                        n.leave(g.encode('utf-8'))
-                    terminated = True
+                    msg_type = message.popstr()
 
-                elif msg_type == '$$ID':
-                    pipe_s.send_string(n.uuid().decode('utf-8'))
+                    # commands are case insensitive, only a miss pays for the upper()
+                    h = app_handler.handlers.get(msg_type) or app_handler.handlers.get(msg_type.upper())
+                    if h:
+                        h(message)
 
-                elif msg_type in ['WHISPER', 'JOIN', 'SHOUT', 'LEAVE']:
-                    h = getattr(app_handler, 'on_' + msg_type.lower())
-                    h(message)
+                    # message to quit
+                    elif msg_type.upper() == b'$$STOP':
+                        for g in group:
+                            n.leave(g.encode('utf-8'))
+                        terminated = True
+                        break
 
-                else:
-                    logger.warn('unknown message type: {}'.format(msg_type))
+                    else:
+                        logger.warn('unknown message type: {}'.format(msg_type))
 
-            # from network to the application
-            elif ss in items and items[ss] == zmq.POLLIN:
-                e = ZyreEvent(n)
+                # from network to the application
+                if ss.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                    busy = True
+                    e = ZyreEvent(n)
 
-                msg_type = e.type().decode('utf-8').upper()
+                    h = handle.handlers.get(e.type())
+                    if h:
+                        h(e)
 
-                if msg_type in ['ENTER', 'EXIT', 'LEAVE', 'JOIN', 'SHOUT', 'WHISPER', 'EVASIVE']:
-                    h = getattr(handle, 'on_' + msg_type.lower())
-                    h(e)
+                    else:
+                        logger.warn('unknown message type: {}'.format(e.type()))
 
-                else:
-                    logger.warn('unknown message type: {}'.format(msg_type))
+            except Exception as e:
+                logger.exception("Unhandled exception in main io loop")
 
-        except Exception as e:
-            logger.exception("Unhandled exception in main io loop")
+            if not busy:
+                break
 
     logger.debug('shutting down node')
     n.stop()
@@ -0,0 +1,126 @@
+# asyncio flavour of the Client (python 3.6+), import it explicitly:
+#
+#   from pyzyre.client.aio import AsyncClient
+#
+#   client = AsyncClient(group='ZYRE')
+#   client.start_zyre()
+#   await client.shout('ZYRE', b'hello')
+#   async for event in client.events():
+#       ...
+
+import asyncio
+import logging
+
+import zmq
+import zmq.asyncio
+from czmq import Zactor
+
+from . import Client, PIPE_OPTIONS
+from ..utils import setup_socket
+from .. import profiling
+from pyzyre.constants import QUEUE_SIZE, DefaultHandler
+
+logger = logging.getLogger(__name__)
+
+# put on the queue by stop_zyre to end events()
+_STOP = object()
+
+
+class AsyncClient(Client):
+
+    def __init__(self, handler=DefaultHandler(), **kwargs):
+        super(AsyncClient, self).__init__(handler, **kwargs)
+
+        self.queue_size = int(kwargs.get('queue_size') or QUEUE_SIZE)
+        self._queue = None
+        self._reader = None
+        self._stopped = False
+
+    @profiling.timed('start_zyre')
+    def start_zyre(self):
+        self._set_hwm()
+        self._actor = Zactor(self.task, self.actor_args)
+        s = setup_socket(zmq.Socket(shadow=self._actor.resolve(self._actor).value), self.socket_options, PIPE_OPTIONS)
+        self.actor = zmq.asyncio.Socket.from_socket(s)
+        self._stopped = False
+
+    async def stop_zyre(self):
+        if self._reader:
+            self._reader.cancel()
+            self._reader = None
+
+        # wake anything waiting in events(), if the queue is full they'll see _stopped once it's drained
+        self._stopped = True
+        if self._queue is not None and not self._queue.full():
+            self._queue.put_nowait(_STOP)
+
+        await self.actor.send_multipart([b'$$STOP'])
+        await self.actor.recv_multipart()
+        await asyncio.sleep(0.01)
+        del self._actor
+
+        if self.zauth:
+            del self.zauth  # destroy old actor
+            self.zauth = None  # re-establish attrib
+
+    # sends complete once the message is queued on the actor pipe, if the pipe is at its HWM they wait
+    async def join(self, group):
+        await super(AsyncClient, self).join(group)
+
+    async def leave(self, group):
+        await super(AsyncClient, self).leave(group)
+
+    async def shout(self, group, message):
+        await super(AsyncClient, self).shout(group, message)
+
+    async def whisper(self, message, address):
+        await super(AsyncClient, self).whisper(message, address)
+
+    # the client's own messages (file transfer, retransmits) are sent from inside event handling where nothing can
+    # await them, errors are logged instead of being lost with the future
+    def _send(self, frames):
+        self.actor.send_multipart(frames, copy=False).add_done_callback(self._sent)
+
+    @staticmethod
+    def _sent(f):
+        if not f.cancelled() and f.exception():
+            logger.error('send failed: {}'.format(f.exception()))
+
+    # the reader stops pulling from the actor while the queue is full, pushing backpressure back
+    # to the actor (and zyre) instead of buffering without bound
+    async def _read(self):
+        while True:
+            m = await self.actor.recv_multipart(copy=False)
+
+            try:
+                event, h = self._events[m[0].bytes]
+            except KeyError:
+                logger.warn("unhandled m_type {} rest of message is {}".format(m[0].bytes, m[1:]))
+                continue
+
+            e = event(m)
+            if e is not None:
+                await self._queue.put(e)
+
+    async def events(self):
+        if not self._reader and not self._stopped:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._reader = asyncio.ensure_future(self._read())
+
+        if self._queue is None:
+            return
+
+        while not (self._stopped and self._queue.empty()):
+            e = await self._queue.get()
+
+            # pass it on to the next waiter
+            if e is _STOP:
+                self._queue.put_nowait(_STOP)
+                return
+
+            yield e
+
+    # dispatch events to the handler, for callback style apps
+    async def run(self):
+        async for event in self.events():
+            self._events[event.type][1](self, event)
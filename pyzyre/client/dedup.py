@@ -0,0 +1,96 @@
+# drops SHOUTs the client has already handled, see Client(dedup=seconds)
+#
+# duplicates come from reconnects, bridging between gateways and retransmits. a message is known by its gateway id
+# frame when it has one, otherwise by its sender, group and reliable sequence number (see reliable.py), messages
+# with neither are always let through.
+#
+# keys are remembered in a ring of bloom filters, each covering window / slots seconds. a key is looked for in every
+# filter and added to the newest, the oldest is cleared as the ring turns. memory is fixed at slots * bits / 8 bytes
+# however busy it gets, the price is the odd false positive (a new message dropped) once a filter fills up.
+
+import hashlib
+import struct
+import time
+
+from .reliable import SEQ
+from pyzyre.constants import ID_MARK, ID_SIZE, DEDUP_WINDOW, DEDUP_BITS
+
+SLOTS = 6
+HASHES = 4
+
+_hash = struct.Struct('>QQ')
+
+
+# m is a SHOUT [SHOUT, uuid, name, group, ..] or a retransmit [WHISPER, uuid, name, $$RESEND, group, seq, ..]
+def message_key(m):
+    if m[0].bytes == b'WHISPER':
+        group, seq, payload = 4, 5, 6
+
+    elif len(m) > 5 and len(m[4]) == len(SEQ) and m[4].bytes == SEQ:
+        group, seq, payload = 3, 5, 6
+
+    else:
+        group, seq, payload = 3, None, 4
+
+    if len(m) > payload and len(m[payload]) == ID_SIZE:
+        id = m[payload].bytes
+        if id[:4] == ID_MARK:
+            return id
+
+    if seq is None:
+        return
+
+    return m[1].bytes + m[group].bytes + m[seq].bytes
+
+
+class DedupFilter(object):
+
+    def __init__(self, window=DEDUP_WINDOW, bits=DEDUP_BITS, slots=SLOTS, hashes=HASHES):
+        self.span = float(window) / slots
+        self.bits = bits
+        self.hashes = hashes
+        self.ring = [bytearray(bits // 8 + 1) for _ in range(slots)]
+        self.epoch = None
+
+        self.checked = 0
+        self.suppressed = 0
+
+    def _rotate(self, now):
+        epoch = int(now / self.span)
+        if self.epoch is None:
+            self.epoch = epoch
+            return
+
+        if epoch <= self.epoch:
+            return
+
+        # clear every slot we've moved past, all of them if it's been a whole window
+        n = len(self.ring)
+        for e in range(self.epoch + 1, min(epoch, self.epoch + n) + 1):
+            self.ring[e % n] = bytearray(len(self.ring[e % n]))
+
+        self.epoch = epoch
+
+    def _positions(self, key):
+        h1, h2 = _hash.unpack(hashlib.md5(key).digest())
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    # True if key has (probably) been seen within the window, otherwise it's remembered and False
+    def seen(self, key, now=None):
+        if key is None:
+            return False
+
+        self._rotate(time.time() if now is None else now)
+        self.checked += 1
+
+        positions = self._positions(key)
+        for b in self.ring:
+            if all(b[p >> 3] & (1 << (p & 7)) for p in positions):
+                self.suppressed += 1
+                return True
+
+        b = self.ring[self.epoch % len(self.ring)]
+        for p in positions:
+            b[p >> 3] |= 1 << (p & 7)
+
+        return False
@@ -0,0 +1,148 @@
+# events handed to the handlers by Client.handle_message(s)
+#
+# every message from the actor is [TYPE, peer uuid, peer name, ...]. events keep the pyzmq frames they were
+# received as and only copy / decode a field when it's asked for, handlers that only look at the group or the
+# payload size never pay for the rest. text fields (uuid, name, group) are decoded once and cached, the *_bytes
+# variants return the raw frame and payload gives memoryviews of the payload frames without copying them.
+
+
+class Event(object):
+    __slots__ = ('frames', '_text')
+
+    type = None
+
+    def __init__(self, frames):
+        self.frames = frames
+        self._text = None
+
+    def _bytes(self, i):
+        return self.frames[i].bytes
+
+    def _decode(self, i):
+        if self._text is None:
+            self._text = {}
+
+        try:
+            return self._text[i]
+        except KeyError:
+            t = self._text[i] = self.frames[i].bytes.decode('utf-8')
+            return t
+
+    @property
+    def uuid(self):
+        return self._decode(1)
+
+    @property
+    def uuid_bytes(self):
+        return self._bytes(1)
+
+    @property
+    def name(self):
+        return self._decode(2)
+
+    @property
+    def name_bytes(self):
+        return self._bytes(2)
+
+    def __repr__(self):
+        return '<{} {} {}>'.format(self.__class__.__name__, self.name, self.uuid)
+
+
+class Enter(Event):
+    __slots__ = ()
+
+    type = b'ENTER'
+
+    @property
+    def address(self):
+        return self._decode(3)
+
+    # headers follow the address as key, value frame pairs
+    @property
+    def headers(self):
+        h = [f.bytes.decode('utf-8') for f in self.frames[4:]]
+        return dict(zip(h[::2], h[1::2]))
+
+
+class Exit(Event):
+    __slots__ = ()
+
+    type = b'EXIT'
+
+
+class Evasive(Event):
+    __slots__ = ()
+
+    type = b'EVASIVE'
+
+
+class Stall(Event):
+    __slots__ = ()
+
+    type = b'STALL'
+
+
+class Flow(Event):
+    __slots__ = ()
+
+    type = b'FLOW'
+
+
+class _GroupEvent(Event):
+    __slots__ = ()
+
+    @property
+    def group(self):
+        return self._decode(3)
+
+    @property
+    def group_bytes(self):
+        return self._bytes(3)
+
+
+class Join(_GroupEvent):
+    __slots__ = ()
+
+    type = b'JOIN'
+
+
+class Leave(_GroupEvent):
+    __slots__ = ()
+
+    type = b'LEAVE'
+
+
+class _MessageEvent(Event):
+    __slots__ = ()
+
+    # index of the first payload frame
+    offset = None
+
+    @property
+    def payload(self):
+        return [f.buffer for f in self.frames[self.offset:]]
+
+    @property
+    def payload_bytes(self):
+        return [f.bytes for f in self.frames[self.offset:]]
+
+    @property
+    def size(self):
+        return sum(len(f) for f in self.frames[self.offset:])
+
+
+class Shout(_MessageEvent, _GroupEvent):
+    __slots__ = ()
+
+    type = b'SHOUT'
+    offset = 4
+
+
+class Whisper(_MessageEvent):
+    __slots__ = ()
+
+    type = b'WHISPER'
+    offset = 3
+
+
+EVENTS = dict((e.type, e) for e in [Enter, Exit, Evasive, Join, Leave, Shout, Whisper, Stall, Flow])
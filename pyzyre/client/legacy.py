@@ -0,0 +1,95 @@
+# handlers written before events (see events.py) took the message fields as arguments:
+#
+#   on_shout(client, group, peer, address, message)   on_whisper(client, peer, message)
+#   on_join(client, peer, group)                       on_leave(client, peer, group)
+#   on_enter(client, peer)                             on_exit(client, peer)       on_evasive(client, peer)
+#
+# LegacyHandler wraps one of those and calls it the old way. Client wraps a handler itself when its on_shout, on_join
+# or on_leave still take the old arguments, handlers that only implement on_enter / on_exit / on_evasive can't be
+# told apart and have to be wrapped by hand: Client(handler=LegacyHandler(MyHandler()))
+
+import inspect
+import logging
+
+logger = logging.getLogger(__name__)
+
+# positional arguments (after self) the old style methods took
+_ARGS = {
+    'on_shout': 5,
+    'on_join': 3,
+    'on_leave': 3,
+}
+
+# handler methods added since, with the new arguments
+_ADDED = ('on_stall', 'on_flow', 'on_file', 'on_file_sent')
+
+
+def _nargs(fn):
+    try:
+        params = inspect.signature(fn).parameters.values()
+    except AttributeError:  # python 2
+        spec = inspect.getargspec(fn)
+        return len(spec.args) - (1 if inspect.ismethod(fn) else 0)
+
+    return len([p for p in params if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)])
+
+
+def is_legacy(handler):
+    for name, n in _ARGS.items():
+        fn = getattr(handler, name, None)
+        if fn is None:
+            continue
+
+        try:
+            if _nargs(fn) == n:
+                return True
+        except (TypeError, ValueError):
+            continue
+
+    return False
+
+
+def _message(e):
+    p = e.payload_bytes
+    return p[0] if len(p) == 1 else p
+
+
+def _ignore(client, event):
+    pass
+
+
+class LegacyHandler(object):
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    # on_file, on_stall, accept_file etc are passed through as they are, handlers written before on_stall, on_flow,
+    # on_file and on_file_sent existed get a no-op
+    def __getattr__(self, name):
+        try:
+            return getattr(self.handler, name)
+        except AttributeError:
+            if name in _ADDED:
+                return _ignore
+            raise
+
+    def on_shout(self, client, e):
+        self.handler.on_shout(client, e.group_bytes, e.name_bytes, e.uuid_bytes, _message(e))
+
+    def on_whisper(self, client, e):
+        self.handler.on_whisper(client, e.name_bytes, _message(e))
+
+    def on_join(self, client, e):
+        self.handler.on_join(client, e.name_bytes, e.group_bytes)
+
+    def on_leave(self, client, e):
+        self.handler.on_leave(client, e.name_bytes, e.group_bytes)
+
+    def on_enter(self, client, e):
+        self.handler.on_enter(client, [e.uuid_bytes, e.name_bytes])
+
+    def on_exit(self, client, e):
+        self.handler.on_exit(client, e.name_bytes)
+
+    def on_evasive(self, client, e):
+        self.handler.on_evasive(client, [e.name_bytes])
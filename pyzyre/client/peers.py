@@ -0,0 +1,164 @@
+# peer directory maintained from ENTER / EXIT / JOIN / LEAVE events
+#
+# the actor keeps one (keyed on the raw bytes zyre hands it) to resolve whisper targets, the Client mirrors it
+# from the events it receives (keyed on text) so applications can look up peers and group membership without
+# a round trip to the actor or a call into libzyre. names are not unique in zyre, the name index maps a name
+# to every peer currently using it.
+
+import uuid as _uuid
+
+
+def canonical(uuid):
+    # zyre identifies peers by their uuid as 32 uppercase hex digits, keep the caller's str / bytes type
+    if isinstance(uuid, bytes):
+        return _uuid.UUID(uuid.decode('utf-8')).hex.upper().encode('utf-8')
+
+    return _uuid.UUID(uuid).hex.upper()
+
+
+class Peer(object):
+    __slots__ = ('uuid', 'name', 'address', 'headers', 'groups', 'aliases')
+
+    def __init__(self, uuid, name, address=None, headers=None):
+        self.uuid = uuid
+        self.name = name
+        self.address = address
+        self.headers = headers or {}
+        self.groups = set()
+        self.aliases = []
+
+    def __repr__(self):
+        return '<Peer {} {} {}>'.format(self.name, self.uuid, self.address)
+
+
+class PeerDirectory(object):
+
+    def __init__(self):
+        self.by_uuid = {}
+        self.by_name = {}
+        self.by_group = {}
+
+        # any address a peer has been resolved from (uuid in another form, name) -> canonical uuid
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.by_uuid)
+
+    def __contains__(self, uuid):
+        return uuid in self.by_uuid
+
+    def __iter__(self):
+        return iter(list(self.by_uuid.values()))
+
+    def enter(self, uuid, name, address=None, headers=None):
+        p = self.by_uuid.get(uuid)
+        if p:
+            self._unname(p)
+            p.name = name
+            p.address = address
+            p.headers = headers or {}
+        else:
+            p = self.by_uuid[uuid] = Peer(uuid, name, address, headers)
+
+        # a name now resolves to the newest peer using it
+        self._forget(self.ids.get(name), name)
+
+        self.by_name.setdefault(name, []).append(p)
+        return p
+
+    def exit(self, uuid):
+        p = self.by_uuid.pop(uuid, None)
+        if not p:
+            return
+
+        self._unname(p)
+
+        for g in p.groups:
+            self._ungroup(p, g)
+
+        for a in p.aliases:
+            self.ids.pop(a, None)
+
+        return p
+
+    def join(self, uuid, group):
+        p = self.by_uuid.get(uuid)
+        if not p:
+            return
+
+        p.groups.add(group)
+        self.by_group.setdefault(group, {})[uuid] = p
+        return p
+
+    def leave(self, uuid, group):
+        p = self.by_uuid.get(uuid)
+        if not p or group not in p.groups:
+            return
+
+        p.groups.discard(group)
+        self._ungroup(p, group)
+        return p
+
+    def get(self, uuid):
+        return self.by_uuid.get(uuid)
+
+    # resolve a uuid (any form) or name to the peer's canonical uuid, the answer is cached so repeat lookups
+    # for the same address are a single dict hit
+    def resolve(self, address):
+        try:
+            return self.ids[address]
+        except KeyError:
+            pass
+
+        p = self.by_uuid.get(address) or self.named(address)
+        if not p:
+            try:
+                p = self.by_uuid.get(canonical(address))
+            except ValueError:
+                return
+
+        if not p:
+            return
+
+        self.ids[address] = p.uuid
+        p.aliases.append(address)
+        return p.uuid
+
+    # returns the most recent peer to ENTER with this name
+    def named(self, name):
+        p = self.by_name.get(name)
+        if p:
+            return p[-1]
+
+    def in_group(self, group):
+        return list(self.by_group.get(group, {}).values())
+
+    def groups(self):
+        return list(self.by_group.keys())
+
+    def _forget(self, uuid, address):
+        p = self.by_uuid.get(uuid)
+        if not p:
+            return
+
+        self.ids.pop(address, None)
+        if address in p.aliases:
+            p.aliases.remove(address)
+
+    def _unname(self, p):
+        named = self.by_name.get(p.name)
+        if not named:
+            return
+
+        named.remove(p)
+        if not named:
+            del self.by_name[p.name]
+
+    def _ungroup(self, p, group):
+        members = self.by_group.get(group)
+        if not members:
+            return
+
+        members.pop(p.uuid, None)
+        if not members:
+            del self.by_group[group]
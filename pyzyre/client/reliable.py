@@ -0,0 +1,181 @@
+# reliable SHOUTs, see Client(reliable=True)
+#
+# each SHOUT is stamped with a sequence number per group, [$$SEQ, seq, payload..]. receivers track the next sequence
+# they expect from each (peer, group), a jump means messages went missing. they're asked for by WHISPER and the
+# sender resends whatever is still in its retransmit buffer (the last `size` SHOUTs it sent to each group):
+#
+#   [$$NACK, group, first, last]        receiver -> sender
+#   [$$RESEND, group, seq, payload..]   sender -> receiver, handed to on_shout like the original
+#   [$$LOST, group, first, last]        sender -> receiver, they've already fallen out of the buffer
+#
+# messages are handed to the handler as they arrive, so retransmits arrive out of order. a sequence that's already
+# been seen is dropped. a loss is only noticed when the next message from that peer to that group arrives, and
+# every peer in the group has to have it turned on.
+
+import logging
+import struct
+from collections import deque
+
+from .events import Shout
+
+logger = logging.getLogger(__name__)
+
+SEQ = b'$$SEQ'
+NACK = b'$$NACK'
+RESEND = b'$$RESEND'
+LOST = b'$$LOST'
+
+_seq = struct.Struct('>Q')
+
+
+class Stream(object):
+    __slots__ = ('next', 'missing')
+
+    def __init__(self, next):
+        self.next = next
+        self.missing = set()
+
+
+class Reliable(object):
+
+    def __init__(self, client, size):
+        self.client = client
+        self.size = size
+
+        self.sent = {}  # group -> deque of (seq, frames)
+        self.seq = {}  # group -> next seq to send
+        self.streams = {}  # (peer uuid, group) -> Stream
+
+        self.duplicates = 0
+        self.requested = 0
+        self.resent = 0
+        self.lost = 0
+
+        self.commands = {
+            NACK: self.on_nack,
+            RESEND: self.on_resend,
+            LOST: self.on_lost,
+        }
+
+    def _send(self, peer, *frames):
+        self.client._send([b'WHISPER', peer.encode('utf-8')] + list(frames))
+
+    def is_command(self, frame):
+        return len(frame) in (6, 8) and frame.bytes in self.commands
+
+    # number an outgoing SHOUT and keep it for retransmits, the frames are kept as they are so they mustn't be
+    # reused by the caller
+    def stamp(self, group, frames):
+        seq = self.seq.get(group, 0)
+        self.seq[group] = seq + 1
+
+        try:
+            sent = self.sent[group]
+        except KeyError:
+            sent = self.sent[group] = deque(maxlen=self.size)
+
+        sent.append((seq, frames))
+        return [SEQ, _seq.pack(seq)] + frames
+
+    # a received SHOUT, [SHOUT, uuid, name, group, $$SEQ, seq, payload..]. returns the Shout to hand on, None for
+    # a duplicate
+    def received(self, m):
+        if len(m) < 6 or len(m[4]) != len(SEQ) or m[4].bytes != SEQ:
+            return Shout(m)
+
+        e = Shout(m[:4] + m[6:])
+        if self._accept(e.uuid, e.group_bytes, _seq.unpack(m[5].bytes)[0]):
+            return e
+
+    def _accept(self, peer, group, seq):
+        key = (peer, group)
+        s = self.streams.get(key)
+
+        # first we've heard from them, we don't go back for anything from before we joined
+        if s is None:
+            self.streams[key] = Stream(seq + 1)
+            return True
+
+        if seq == s.next:
+            s.next += 1
+            return True
+
+        if seq > s.next:
+            self._gap(peer, group, s, s.next, seq - 1)
+            s.next = seq + 1
+            return True
+
+        if seq in s.missing:
+            s.missing.discard(seq)
+            return True
+
+        self.duplicates += 1
+        return False
+
+    def _gap(self, peer, group, s, first, last):
+        # there's no point asking for more than the sender keeps
+        if last - first >= self.size:
+            skipped = last - first + 1 - self.size
+            first = last - self.size + 1
+            self.lost += skipped
+            logger.warn('{} lost {} messages to {}'.format(peer, skipped, group))
+
+        logger.debug('asking {} for {}:{} of {}'.format(peer, first, last, group))
+        s.missing.update(range(first, last + 1))
+        if len(s.missing) > self.size:
+            s.missing = set(sorted(s.missing)[-self.size:])
+
+        self.requested += last - first + 1
+        self._send(peer, NACK, group, _seq.pack(first), _seq.pack(last))
+
+    # a reliability whisper, [WHISPER, uuid, name, command, group, ..]. returns a retransmitted Shout or None
+    def handle(self, m):
+        return self.commands[m[3].bytes](m)
+
+    def on_nack(self, m):
+        if len(m) < 7:
+            return
+
+        peer = m[1].bytes.decode('utf-8')
+        group = m[4].bytes
+        first, last = _seq.unpack(m[5].bytes)[0], _seq.unpack(m[6].bytes)[0]
+
+        sent = self.sent.get(group) or ()
+        start = sent[0][0] if sent else self.seq.get(group, 0)
+
+        if first < start:
+            self._send(peer, LOST, group, _seq.pack(first), _seq.pack(min(last, start - 1)))
+            first = start
+
+        # sequences in the buffer are contiguous, seq - start is its index
+        for seq in range(first, last + 1):
+            i = seq - start
+            if i >= len(sent):
+                break
+
+            self._send(peer, RESEND, group, _seq.pack(seq), *sent[i][1])
+            self.resent += 1
+
+    def on_resend(self, m):
+        e = Shout(m[:3] + [m[4]] + m[6:])
+        if self._accept(e.uuid, e.group_bytes, _seq.unpack(m[5].bytes)[0]):
+            return e
+
+    def on_lost(self, m):
+        if len(m) < 7:
+            return
+
+        s = self.streams.get((m[1].bytes.decode('utf-8'), m[4].bytes))
+        first, last = _seq.unpack(m[5].bytes)[0], _seq.unpack(m[6].bytes)[0]
+        logger.warn('{} no longer has {}:{} of {}'.format(m[2].bytes, first, last, m[4].bytes))
+
+        if s is None:
+            return
+
+        n = len(s.missing)
+        s.missing.difference_update(range(first, last + 1))
+        self.lost += n - len(s.missing)
+
+    def exit(self, peer):
+        for key in [k for k in self.streams if k[0] == peer]:
+            del self.streams[key]
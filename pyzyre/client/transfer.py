@@ -0,0 +1,297 @@
+# file transfer between peers over WHISPER, see Client.send_file
+#
+# the sender OFFERs a file, the receiver answers with CREDIT for up to `window` chunks and tops it up as chunks
+# land, so no more than a window of chunks is ever queued between the two nodes. the sender reads chunks with
+# czmq's Zfile, the receiver writes them straight into an mmap of the output file. it all runs on the
+# application thread from Client.handle_message(s), transfer messages never reach the handler's on_whisper.
+#
+#   [$$XFER, OFFER, id, name, size, chunk size]
+#   [$$XFER, CREDIT, id, chunks]
+#   [$$XFER, CHUNK, id, offset, data]
+#   [$$XFER, DONE, id]
+#   [$$XFER, ABORT, id, reason]
+#
+# the receiver's handler has to accept_file(client, transfer) an offer, anything else is rejected. a file is never
+# written over, an offer for a name that's already in files_path (or being received) is rejected too.
+#
+# zfile_read takes an int offset, files are limited to 2GB.
+
+import logging
+import mmap
+import os
+import uuid
+
+from czmq import Zfile, string_at
+
+logger = logging.getLogger(__name__)
+
+XFER = b'$$XFER'
+
+MAX_SIZE = 2 ** 31 - 1
+
+
+# rename src to dst without replacing dst. os.rename won't replace a file on windows, which has no os.link on
+# python 2
+def _save(src, dst):
+    if not hasattr(os, 'link'):
+        os.rename(src, dst)
+        return
+
+    os.link(src, dst)
+    os.remove(src)
+
+
+class Transfer(object):
+    __slots__ = ('id', 'peer', 'name', 'path', 'size', 'chunk_size', 'offset', 'credit', 'error', '_file', '_mm')
+
+    def __init__(self, id, peer, name, path, size, chunk_size):
+        self.id = id
+        self.peer = peer
+        self.name = name
+        self.path = path
+        self.size = size
+        self.chunk_size = chunk_size
+        self.offset = 0  # bytes sent / received so far
+        self.credit = 0  # chunks the sender may still send
+        self.error = None
+        self._file = None
+        self._mm = None
+
+    def __repr__(self):
+        return '<Transfer {} {} {}/{}>'.format(self.name, self.peer, self.offset, self.size)
+
+
+class Transfers(object):
+
+    def __init__(self, client, path, window, chunk_size):
+        self.client = client
+        self.path = path
+        self.window = window
+        self.chunk_size = chunk_size
+
+        self.outgoing = {}
+        self.incoming = {}
+
+        self.commands = {
+            b'OFFER': self.on_offer,
+            b'CREDIT': self.on_credit,
+            b'CHUNK': self.on_chunk,
+            b'DONE': self.on_done,
+            b'ABORT': self.on_abort,
+        }
+
+    def _send(self, t, *frames):
+        self.client._send([b'WHISPER', t.peer.encode('utf-8'), XFER] + list(frames))
+
+    def send(self, peer, path, name=None):
+        f = Zfile(None, path.encode('utf-8'))
+        if f.input() == -1:
+            raise IOError('unable to open %s' % path)
+
+        name = name or os.path.basename(path)
+        t = Transfer(uuid.uuid4().hex.encode('utf-8'), peer, name, path, f.cursize(), self.chunk_size)
+        t._file = f
+
+        self.outgoing[t.id] = t
+        self._send(t, b'OFFER', t.id, name.encode('utf-8'), str(t.size).encode('utf-8'),
+                   str(t.chunk_size).encode('utf-8'))
+        return t
+
+    def handle(self, event):
+        f = event.frames
+        h = self.commands.get(f[4].bytes)
+        if not h:
+            logger.warn('unknown transfer message from {}: {}'.format(event.name, f[4].bytes))
+            return
+
+        h(event.uuid, f[5].bytes, f[6:])
+
+    def on_offer(self, peer, id, f):
+        # a repeated offer, the first one is already being received
+        if id in self.incoming:
+            return
+
+        try:
+            name = os.path.basename(f[0].bytes.decode('utf-8')) or id.decode('utf-8')
+            size, chunk_size = int(f[1].bytes), int(f[2].bytes)
+        except (ValueError, IndexError, UnicodeDecodeError):
+            logger.warn('bad file offer from {}'.format(peer))
+            self.client._send([b'WHISPER', peer.encode('utf-8'), XFER, b'ABORT', id, b'bad offer'])
+            return
+
+        t = Transfer(id, peer, name, os.path.join(self.path, name), size, chunk_size)
+
+        if not 0 <= size <= MAX_SIZE or chunk_size <= 0:
+            self._send(t, b'ABORT', id, b'bad offer')
+            return
+
+        accept = getattr(self.client.handler, 'accept_file', None)
+        if not accept or not accept(self.client, t):
+            self._send(t, b'ABORT', id, b'rejected')
+            return
+
+        if os.path.exists(t.path) or any(i.path == t.path for i in self.incoming.values()):
+            logger.warn('not receiving {} from {}, it already exists'.format(t.path, peer))
+            self._send(t, b'ABORT', id, b'exists')
+            return
+
+        # a .part nobody is writing to was left behind by an earlier run, it's started again from scratch
+        try:
+            if os.path.lexists(t.path + '.part'):
+                os.remove(t.path + '.part')
+
+            t._file = os.fdopen(os.open(t.path + '.part', os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o644), 'w+b')
+            t._file.truncate(t.size)
+            if t.size:
+                t._mm = mmap.mmap(t._file.fileno(), t.size)
+
+        except (IOError, OSError) as e:
+            logger.error('unable to receive {}: {}'.format(t.path, e))
+            self._close(t)
+            self._send(t, b'ABORT', id, str(e).encode('utf-8'))
+            return
+
+        logger.debug('receiving {} from {}: {} bytes'.format(name, peer, t.size))
+        self.incoming[id] = t
+
+        if not t.size:
+            self._finish(t)
+            return
+
+        self._grant(t)
+
+    def _grant(self, t):
+        # top the sender back up to a full window once half of it has been used
+        remaining = (t.size - t.offset + t.chunk_size - 1) // t.chunk_size
+        n = min(self.window, remaining) - t.credit
+        if n <= 0 or t.credit > self.window // 2:
+            return
+
+        t.credit += n
+        self._send(t, b'CREDIT', t.id, str(n).encode('utf-8'))
+
+    def on_credit(self, peer, id, f):
+        t = self.outgoing.get(id)
+        if not t or t.peer != peer:
+            return
+
+        try:
+            n = int(f[0].bytes)
+        except (ValueError, IndexError):
+            n = 0
+
+        if n <= 0:
+            return
+
+        t.credit += n
+
+        while t.credit and t.offset < t.size:
+            c = t._file.read(min(t.chunk_size, t.size - t.offset), t.offset)
+            if not c:
+                self._abort(self.outgoing, t, 'read failed')
+                self._send(t, b'ABORT', id, b'read failed')
+                return
+
+            data = string_at(c.data(), c.size())
+            self._send(t, b'CHUNK', id, str(t.offset).encode('utf-8'), data)
+            t.offset += len(data)
+            t.credit -= 1
+
+    def on_chunk(self, peer, id, f):
+        t = self.incoming.get(id)
+        if not t or t.peer != peer:
+            return
+
+        try:
+            offset = int(f[0].bytes)
+            data = f[1].buffer
+        except (ValueError, IndexError):
+            offset, data = None, b''
+
+        # whispers from a peer arrive in order, a chunk we've already written is a resend and is ignored
+        if offset is not None and 0 <= offset and offset + len(data) <= t.offset:
+            return
+
+        if offset != t.offset or not len(data) or offset + len(data) > t.size:
+            self._abort(self.incoming, t, 'bad chunk at {}'.format(f[0].bytes if f else None))
+            self._send(t, b'ABORT', id, b'bad chunk')
+            return
+
+        t._mm[offset:offset + len(data)] = data
+
+        t.offset += len(data)
+        t.credit -= 1
+
+        if t.offset >= t.size:
+            self._finish(t)
+            return
+
+        self._grant(t)
+
+    def _finish(self, t):
+        if t._mm:
+            t._mm.flush()
+        self._close(t)
+
+        # the file may have turned up while we were receiving it, it's left alone
+        try:
+            _save(t.path + '.part', t.path)
+        except OSError as e:
+            self._abort(self.incoming, t, 'unable to save {}: {}'.format(t.path, e))
+            self._send(t, b'ABORT', t.id, b'unable to save')
+            return
+
+        del self.incoming[t.id]
+
+        self._send(t, b'DONE', t.id)
+        logger.debug('received {} from {}'.format(t.name, t.peer))
+        self.client.handler.on_file(self.client, t)
+
+    def on_done(self, peer, id, f):
+        t = self.outgoing.pop(id, None)
+        if not t:
+            return
+
+        self._close(t)
+        logger.debug('sent {} to {}'.format(t.name, t.peer))
+        self.client.handler.on_file_sent(self.client, t)
+
+    def on_abort(self, peer, id, f):
+        reason = f[0].bytes.decode('utf-8') if f else 'aborted'
+
+        for transfers in (self.outgoing, self.incoming):
+            t = transfers.get(id)
+            if t and t.peer == peer:
+                self._abort(transfers, t, reason)
+
+    # the peer has gone away, nothing more is coming for (or going to) it
+    def exit(self, peer):
+        for transfers in (self.outgoing, self.incoming):
+            for t in [t for t in transfers.values() if t.peer == peer]:
+                self._abort(transfers, t, 'peer exited')
+
+    def _abort(self, transfers, t, reason):
+        logger.warn('transfer of {} with {} failed: {}'.format(t.name, t.peer, reason))
+        del transfers[t.id]
+
+        t.error = reason
+        self._close(t)
+
+        if transfers is self.incoming:
+            if os.path.exists(t.path + '.part'):
+                os.remove(t.path + '.part')
+
+            self.client.handler.on_file(self.client, t)
+        else:
+            self.client.handler.on_file_sent(self.client, t)
+
+    def _close(self, t):
+        if t._mm:
+            t._mm.close()
+            t._mm = None
+
+        # a Zfile on the sending side, a python file on the receiving side
+        if t._file:
+            t._file.close()
+
+        t._file = None
@@ -33,27 +33,86 @@ CERT_PATH = os.getenv('ZYRE_CERT_PATH', '~/.certs')
 LOGLEVEL = os.getenv('ZYRE_LOGLEVEL', 'ERROR')
 
 ZMQ_LINGER = os.getenv('ZMQ_LINGER', 0)
-ZYRE_GATEWAY = os.getenv('ZYRE_GATEWAY')
 
+# max number of events the actor drains from each direction per poll wakeup
+BATCH_SIZE = int(os.getenv('ZYRE_BATCH_SIZE', 100))
+
+# whispers each peer may have in flight to us before waiting for more credit, 0 disables flow control
+CREDIT_WINDOW = int(os.getenv('ZYRE_CREDIT', 0))
+
+# max number of events buffered by the asyncio client before it stops reading from the actor
+QUEUE_SIZE = int(os.getenv('ZYRE_QUEUE_SIZE', 1000))
+ZYRE_GATEWAY = os.getenv('ZYRE_GATEWAY')
 
+# socket options for the actor pipe, the gateway / zyre-pipe sockets and (hwm only) zyre's own sockets. unset
+# leaves the libzmq defaults (1000 message HWMs, no timeouts), see pyzyre.utils.SOCKET_OPTIONS
+SNDHWM = os.getenv('ZYRE_SNDHWM')
+RCVHWM = os.getenv('ZYRE_RCVHWM')
+SNDTIMEO = os.getenv('ZYRE_SNDTIMEO')
+RCVTIMEO = os.getenv('ZYRE_RCVTIMEO')
+TCP_KEEPALIVE = os.getenv('ZYRE_TCP_KEEPALIVE')
+TCP_KEEPALIVE_IDLE = os.getenv('ZYRE_TCP_KEEPALIVE_IDLE')
+SNDBUF = os.getenv('ZYRE_SNDBUF')
+RCVBUF = os.getenv('ZYRE_RCVBUF')
+
+# Client.send_file: where received files are written, bytes per chunk and chunks in flight per transfer
+FILES_PATH = os.getenv('ZYRE_FILES_PATH', os.getcwd())
+FILE_CHUNK_SIZE = int(os.getenv('ZYRE_FILE_CHUNK_SIZE', 262144))
+FILE_WINDOW = int(os.getenv('ZYRE_FILE_WINDOW', 16))
+
+# Client(reliable=True): sequence SHOUTs and resend the ones peers missed from the last RETRANSMIT_BUFFER per group
+RELIABLE = os.getenv('ZYRE_RELIABLE', '0') == '1'
+RETRANSMIT_BUFFER = int(os.getenv('ZYRE_RETRANSMIT_BUFFER', 1000))
+
+# message id frame a gateway puts ahead of the payload, \x00MID + 16 random bytes
+ID_MARK = b'\x00MID'
+ID_SIZE = len(ID_MARK) + 16
+
+# Client(dedup=seconds): drop SHOUTs seen in the last DEDUP_WINDOW seconds, see pyzyre.client.dedup. 0 disables it
+DEDUP_WINDOW = int(os.getenv('ZYRE_DEDUP_WINDOW', 0))
+DEDUP_BITS = int(os.getenv('ZYRE_DEDUP_BITS', 1 << 20))
+
+
+# handlers get the client and a pyzyre.client.events object, they may also implement on_batch(client, events)
+# to receive bursts from Client.handle_messages
 class DefaultHandler(object):
-    def on_shout(self, client, group, peer, address, message):
+    def on_shout(self, client, event):
+        pass
+
+    def on_whisper(self, client, event):
+        pass
+
+    def on_enter(self, client, event):
+        pass
+
+    def on_join(self, client, event):
         pass
 
-    def on_whisper(self, client, peer, message):
+    def on_leave(self, client, event):
         pass
 
-    def on_enter(self, client, peer):
+    def on_evasive(self, client, event):
         pass
 
-    def on_join(self, client, peer, group):
+    def on_exit(self, client, event):
         pass
 
-    def on_leave(self, client, peer, group):
+    # a peer's whisper credit ran out, Client.whisper to it raises zmq.Again until on_flow
+    def on_stall(self, client, event):
         pass
 
-    def on_evasive(self, client, peer):
+    def on_flow(self, client, event):
         pass
 
-    def on_exit(self, client, peer):
-        pass
\ No newline at end of file
+    # a peer is offering a file (transfer.peer, transfer.name, transfer.size), it's only received if this returns
+    # True. files are written to files_path and are never overwritten
+    def accept_file(self, client, transfer):
+        return False
+
+    # a file from Client.send_file has been received, transfer.error is set if it failed
+    def on_file(self, client, transfer):
+        pass
+
+    # the peer has received a file we sent, transfer.error is set if it failed
+    def on_file_sent(self, client, transfer):
+        pass
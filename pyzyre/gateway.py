@@ -1,30 +1,458 @@
 import logging
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
 import textwrap
+import time
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from collections import deque
 
 import zmq
 from .client import Client, DefaultHandler
 from zmq.eventloop import ioloop
-from .utils import setup_logging, get_argument_parser, setup_curve
+from .utils import setup_logging, get_argument_parser, setup_curve, socket_options, setup_socket, resolve_endpoint
+from .utils.hashring import HashRing
+from .constants import GOSSIP_PORT, SERVICE_PORT, ID_MARK, ID_SIZE
+from . import profiling
+
+# seconds a SUB command keeps a group joined, SUB needs to be re-sent within this to keep it. 0 (the default) keeps
+# it joined for as long as the gateway runs
+SUB_TTL = int(os.getenv('ZYRE_GATEWAY_SUB_TTL', 0))
+
+# message ids remembered for de-duplication, 0 disables it
+DEDUP_SIZE = int(os.getenv('ZYRE_GATEWAY_DEDUP_SIZE', 100000))
+
+# put an id frame on messages shouted to the mesh, every zyre peer in the group sees it as the first payload frame
+MESH_IDS = os.getenv('ZYRE_GATEWAY_MESH_IDS', '0') == '1'
 
 logger = logging.getLogger(__name__)
 
 
+# the groups the gateway has live subscribers for. a group is live while it's pinned (the gateway's own --group),
+# has subscribers on the XPUB socket or a SUB command for it hasn't expired. subscribe / refresh return True when a
+# group goes live (join it), unsubscribe / expire report the groups that are no longer live (leave them)
+class SubscriptionIndex(object):
+
+    def __init__(self, ttl=SUB_TTL, pinned=()):
+        self.ttl = ttl
+        self.pinned = set(pinned)
+        self.subscribers = {}  # group -> XPUB subscriptions
+        self.expires = {}  # group -> when its last SUB command runs out
+
+    def __contains__(self, group):
+        return group in self.pinned or group in self.subscribers or group in self.expires
+
+    def __iter__(self):
+        return iter(self.pinned | set(self.subscribers) | set(self.expires))
+
+    def subscribe(self, group):
+        live = group in self
+        self.subscribers[group] = self.subscribers.get(group, 0) + 1
+        return not live
+
+    def unsubscribe(self, group):
+        n = self.subscribers.get(group, 0) - 1
+        if n > 0:
+            self.subscribers[group] = n
+            return False
+
+        self.subscribers.pop(group, None)
+        return group not in self
+
+    def refresh(self, group, now=None):
+        live = group in self
+        self.expires[group] = (now or time.time()) + self.ttl if self.ttl else float('inf')
+        return not live
+
+    def expire(self, now=None):
+        now = now or time.time()
+
+        expired = [g for g, t in self.expires.items() if t <= now]
+        for g in expired:
+            del self.expires[g]
+
+        return [g for g in expired if g not in self]
+
+
+# with --mesh-ids messages published through a gateway carry an id frame (see constants.ID_MARK) ahead of the
+# payload on the mesh. it's added when the message enters through PULL (unless it already has one, eg: bridged from
+# another gateway's PUB with --pub-ids) so every gateway can tell a message it has already published from a new one.
+# it changes what every other peer in the group receives, so it's off unless asked for
+def is_id(frame):
+    if isinstance(frame, zmq.Frame):
+        return len(frame) == ID_SIZE and frame.bytes[:4] == ID_MARK
+
+    return len(frame) == ID_SIZE and frame[:4] == ID_MARK
+
+
+def new_id():
+    return ID_MARK + os.urandom(16)
+
+
+# the last size ids this gateway has published, oldest forgotten first
+class RecentIds(object):
+
+    def __init__(self, size=DEDUP_SIZE):
+        self.size = size
+        self._ids = set()
+        self._order = deque()
+
+    def __len__(self):
+        return len(self._ids)
+
+    # True if the id has been seen before, otherwise it's remembered
+    def seen(self, id):
+        if id in self._ids:
+            return True
+
+        self._ids.add(id)
+        self._order.append(id)
+
+        if len(self._order) > self.size:
+            self._ids.discard(self._order.popleft())
+
+        return False
+
+
+# a [PUB, group, payload..] command entering through PULL gets an id frame after the group when mesh_ids is set,
+# None if this gateway has already published that id
+def ingress(req, seen, mesh_ids=False):
+    if len(req) > 2 and is_id(req[2]):
+        id = req[2]
+    elif mesh_ids:
+        id = new_id()
+        req.insert(2, id)
+    else:
+        return req
+
+    if seen is not None and seen.seen(id):
+        logger.debug('dropping duplicate message for %s' % req[1])
+        return
+
+    return req
+
+
 class GatewayHandler(DefaultHandler):
-    def __init__(self, pub):
+    def __init__(self, pub, index=None, seen=None, pub_ids=False):
         self.pub = pub
+        self.index = index
+        self.seen = seen
+        self.pub_ids = pub_ids
+
+    # the payload to publish, None if we've already published this message
+    def _payload(self, e):
+        payload = e.payload
+        if not payload:
+            return payload
+
+        f = e.frames[e.offset]
+        if not is_id(f):
+            return payload
+
+        if self.seen is not None and self.seen.seen(f.bytes):
+            return
+
+        if self.pub_ids:
+            return payload
+
+        return payload[1:]
+
+    def on_shout(self, client, event):
+        if self.index is not None and event.group_bytes not in self.index:
+            return
+
+        payload = self._payload(event)
+        if payload is None:
+            return
+
+        self.pub.send_multipart([event.group_bytes] + payload, copy=False)
 
-    def on_shout(self, client, group, peer, address, message):
-        self.pub.send_multipart([group, message])
+    # everything the IOLoop callback drained from the actor goes out in one pass, traffic for groups nobody is
+    # subscribed to any more (we may still be in the group until the next expiry) is dropped here
+    def on_batch(self, client, events):
+        send = self.pub.send_multipart
+        index = self.index
+
+        for e in events:
+            if e.type != b'SHOUT':
+                continue
+
+            g = e.group_bytes
+            if index is not None and g not in index:
+                continue
+
+            payload = self._payload(e)
+            if payload is None:
+                continue
+
+            send([g] + payload, copy=False)
+
+
+# what goes out on PUB for a [PUB, group, (id), payload..] command
+def published(req, pub_ids=False):
+    if pub_ids or len(req) < 3 or not is_id(req[2]):
+        return req[1:]
+
+    return req[1:2] + req[3:]
+
+
+# commands anyone can send to PULL. the $$XSUB / $$XUNSUB subscription changes only ever come from our own XPUB
+# socket (see xpub_command)
+PULL_COMMANDS = (b'PUB', b'SUB')
+
+
+def is_pull_request(req):
+    return len(req) > 1 and req[0] in PULL_COMMANDS and len(req[1]) > 0
+
+
+# a PULL command (or XPUB subscription) for the node that owns the group
+def dispatch(client, index, req, seen=None):
+    if len(req) < 2 or not req[1]:
+        return
+
+    cmd = req[0]
+    if cmd == b'PUB':
+        # a --workers child remembers the ids it shouts, the front process checked them on the way in
+        if seen is not None and len(req) > 2 and is_id(req[2]):
+            seen.seen(req[2])
+
+        client.shout(req[1], req[2:])
+
+    elif cmd == b'SUB':
+        if index.refresh(req[1]):
+            client.join(req[1])
+
+    elif cmd == b'$$XSUB':
+        if index.subscribe(req[1]):
+            client.join(req[1])
+
+    elif cmd == b'$$XUNSUB':
+        if index.unsubscribe(req[1]):
+            client.leave(req[1])
+
+
+# XPUB hands us [\x01 topic] when the first subscriber for a topic shows up and [\x00 topic] when the last one
+# goes away, the topic is the group
+def xpub_command(m):
+    if m[0:1] == b'\x01':
+        return [b'$$XSUB', m[1:]]
+
+    return [b'$$XUNSUB', m[1:]]
+
+
+# handle up to n messages waiting on s in one IOLoop callback. the socket's FD is edge triggered, it won't wake us
+# again for what's left after a full batch so we come back for it on the next loop iteration
+def drain(s, n, fn, loop=None):
+    for _ in range(n):
+        try:
+            m = s.recv_multipart(zmq.NOBLOCK)
+        except zmq.Again:
+            return
+
+        fn(m)
+
+    (loop or ioloop.IOLoop.current()).add_callback(drain, s, n, fn, loop)
+
+
+def expire(client, index):
+    for g in index.expire():
+        logger.debug('SUB for %s expired' % g)
+        client.leave(g)
+
+
+def run(loop, client):
+    terminated = False
+    while not terminated:
+        try:
+            logger.info('starting loop...')
+            loop.start()
+        except KeyboardInterrupt:
+            logger.info('SIGINT Received')
+
+            terminated = True
+        except Exception as e:
+            terminated = True
+            logger.error(e)
+
+    logger.info('shutting down..')
+
+    if client:
+        client.stop_zyre()
+
+
+def _bind(context, kind, endpoint, options):
+    s = setup_socket(context.socket(kind), options)
+    if not endpoint.startswith(('tcp://', 'udp://', 'ipc://')):
+        endpoint = 'tcp://%s' % endpoint
+
+    logger.info('listening for %s on %s' % ('PULL' if kind == zmq.PULL else 'PUB', endpoint))
+    s.bind(endpoint)
+    return s
+
+
+def _offset_port(endpoint, i):
+    return re.sub(r':(\d+)$', lambda m: ':%d' % (int(m.group(1)) + i), endpoint)
+
+
+# each worker is its own zyre node, they can't share the gossip bind or service endpoint. worker 0 keeps them,
+# the rest connect to worker 0's gossip and take the next service ports up
+def _worker_args(args, i, groups):
+    kwargs = dict(vars(args))
+    kwargs['group'] = ','.join(groups)
+
+    if args.name:
+        kwargs['name'] = '%s-%d' % (args.name, i)
+
+    if args.gossip_bind and i:
+        kwargs['gossip_bind'] = None
+        kwargs['gossip_connect'] = resolve_endpoint(args.gossip_bind, GOSSIP_PORT).replace('*', '127.0.0.1')
+
+    if (args.gossip_bind or args.gossip_connect) and i:
+        kwargs['endpoint'] = _offset_port(resolve_endpoint(args.endpoint, SERVICE_PORT), i)
+
+    return kwargs
+
+
+# a --workers child: commands for the groups it owns come in on work, the shouts it hears go back to the front
+# process on back for publishing
+def worker(i, args, work, back):
+    ring = HashRing(range(args.workers))
+    groups = [g for g in args.group.split(',') if ring.get(g) == i]
+
+    args.cert = setup_curve(args)
+
+    ioloop.install()
+    loop = ioloop.IOLoop.instance()
+
+    context = zmq.Context()
+    pub = context.socket(zmq.PUSH)
+    pub.connect(back)
+
+    cmds = context.socket(zmq.PULL)
+    cmds.connect(work)
+
+    index = SubscriptionIndex(args.sub_ttl, [g.encode('utf-8') for g in groups])
+    seen = RecentIds(args.dedup_size) if args.dedup_size else None
+    # ids are always passed back so the front process can remember them too
+    handler = GatewayHandler(pub, index, seen, pub_ids=True)
+    client = Client(handler=handler, loop=loop, **_worker_args(args, i, groups))
+
+    client.start_zyre()
+    loop.add_handler(client.actor, client.handle_messages, zmq.POLLIN)
+    loop.add_handler(cmds, lambda *_: drain(cmds, client.batch_size, lambda m: dispatch(client, index, m, seen)),
+                     zmq.POLLIN)
+    if args.sub_ttl:
+        ioloop.PeriodicCallback(lambda: expire(client, index), max(1, args.sub_ttl // 10) * 1000).start()
+
+    run(loop, client)
+
+
+# the --workers front process: commands go to the worker that owns their group (consistent hash of the group name),
+# what the workers hear comes back through merge to be published
+class Router(object):
+
+    def __init__(self, pub, workers, seen=None, mesh_ids=False, pub_ids=False):
+        self.pub = pub
+        self.workers = workers
+        self.seen = seen
+        self.mesh_ids = mesh_ids
+        self.pub_ids = pub_ids
+        self.ring = HashRing(range(len(workers)))
+
+    # a command from PULL
+    def pull(self, req):
+        if is_pull_request(req):
+            self.route(req)
+
+    # a PULL command or one of ours from XPUB
+    def route(self, req):
+        if len(req) < 2 or not req[1]:
+            return
+
+        if req[0] == b'PUB':
+            req = ingress(req, self.seen, self.mesh_ids)
+            if req is None:
+                return
+
+            self.pub.send_multipart(published(req, self.pub_ids))
+
+        self.workers[self.ring.get(req[1])].send_multipart(req)
+
+    # [group, (id), payload..] a worker heard, dropped if it's one we've already published
+    def merge(self, m):
+        if len(m) > 1 and is_id(m[1]):
+            if self.seen is not None and self.seen.seen(m[1]):
+                return
+
+            if not self.pub_ids:
+                del m[1]
+
+        self.pub.send_multipart(m, copy=False)
+
+
+# --workers: this process owns the PUB / PULL endpoints and routes each command to the worker that owns its group
+# (consistent hash of the group name), workers push what they hear back here to be published
+def front(args):
+    tmp = tempfile.mkdtemp(prefix='zyre-gateway-')
+    back = 'ipc://%s/back.ipc' % tmp
+    work = ['ipc://%s/work-%d.ipc' % (tmp, i) for i in range(args.workers)]
+
+    # fork before this process has a zmq context
+    procs = [multiprocessing.Process(target=worker, args=(i, args, work[i], back)) for i in range(args.workers)]
+    for p in procs:
+        p.daemon = True
+        p.start()
+
+    ioloop.install()
+    loop = ioloop.IOLoop.instance()
+
+    options = socket_options(args)
+
+    context = zmq.Context()
+    pub = _bind(context, zmq.XPUB if args.xpub else zmq.PUB, args.pub, options)
+    pull = _bind(context, zmq.PULL, args.pull, options)
+
+    merged = context.socket(zmq.PULL)
+    merged.bind(back)
+
+    workers = []
+    for w in work:
+        s = context.socket(zmq.PUSH)
+        s.bind(w)
+        workers.append(s)
+
+    router = Router(pub, workers, RecentIds(args.dedup_size) if args.dedup_size else None, args.mesh_ids,
+                    args.pub_ids)
+
+    loop.add_handler(pull, lambda *_: drain(pull, args.batch_size, router.pull), zmq.POLLIN)
+    loop.add_handler(merged, lambda *_: drain(merged, args.batch_size, router.merge), zmq.POLLIN)
+
+    if args.xpub:
+        loop.add_handler(pub, lambda *_: drain(pub, args.batch_size, lambda m: router.route(xpub_command(m[0]))),
+                         zmq.POLLIN)
+
+    try:
+        run(loop, None)
+    finally:
+        for p in procs:
+            p.terminate()
+            p.join()
+
+        shutil.rmtree(tmp, ignore_errors=True)
 
 
 # see examples/pub.py and sub.py
 def main():
+    profiling.mark('imports')
+
     p = get_argument_parser()
     p = ArgumentParser(
         description=textwrap.dedent('''\
                 example usage:
                     $ zyre-gateway -d
+                    $ zyre-gateway --workers 4 --xpub --gossip-bind tcp://192.168.1.2:49154
                 '''),
         formatter_class=RawDescriptionHelpFormatter,
         prog='zyre-gateway',
@@ -35,67 +463,75 @@ def main():
                    default="tcp://*:5001")
     p.add_argument('-u', '--pull', help='endpoint to bind for PULL socket [default %(default)s]',
                    default="tcp://*:5002")
+    p.add_argument('--xpub', help='publish on an XPUB socket and only join groups with live subscribers',
+                   action="store_true")
+    p.add_argument('--sub-ttl', help='seconds a SUB command keeps a group joined, SUB has to be re-sent within it. '
+                                     '0 never expires [default %(default)s]', type=int,
+                   default=SUB_TTL)
+    p.add_argument('--workers', help='spread groups over this many zyre nodes, one process each [default '
+                                     '%(default)s]', type=int, default=1)
+    p.add_argument('--dedup-size', help='message ids remembered to drop duplicates, 0 disables [default '
+                                        '%(default)s]', type=int, default=DEDUP_SIZE)
+    p.add_argument('--mesh-ids', help='put a message id frame ahead of the payload of what we SHOUT, gateways use it '
+                                      'to drop duplicates. every peer in the group sees it', action="store_true",
+                   default=MESH_IDS)
+    p.add_argument('--pub-ids', help='keep the message id frame on PUB, for bridging into another gateway',
+                   action="store_true")
 
     args = p.parse_args()
 
     setup_logging(args)
 
+    if args.workers > 1:
+        front(args)
+        return
+
     args.cert = setup_curve(args)
 
     ioloop.install()
     loop = ioloop.IOLoop.instance()
 
-    context = zmq.Context()
-    pub = context.socket(zmq.PUB)
-    if not args.pub.startswith(('tcp://', 'udp://', 'ipc://')):
-        args.pub = 'tcp://%s' % args.pub
-
-    logger.info('listing for PUB on %s' % args.pub)
-    pub.bind(args.pub)
+    options = socket_options(args)
 
-    pull = context.socket(zmq.PULL)
-    if not args.pull.startswith(('tcp://', 'udp://', 'ipc://')):
-        args.pull = 'tcp://%s' % args.pull
+    context = zmq.Context()
+    pub = _bind(context, zmq.XPUB if args.xpub else zmq.PUB, args.pub, options)
+    pull = _bind(context, zmq.PULL, args.pull, options)
 
-    logger.info('listing for PULL on %s' % args.pull)
-    pull.bind(args.pull)
+    index = SubscriptionIndex(args.sub_ttl, [g.encode('utf-8') for g in args.group.split(',')])
+    seen = RecentIds(args.dedup_size) if args.dedup_size else None
 
     client = Client(
-        handler=GatewayHandler(pub),
+        handler=GatewayHandler(pub, index, seen, args.pub_ids),
         loop=loop,
         **args.__dict__
     )
 
-    def handle_pull(*args):
-        req = pull.recv_multipart()
-        cmd = req[0]
-        args = req[1:]
-        if cmd == 'PUB':
-            client.shout(*args)
-            pub.send_multipart(args)
-        elif cmd == 'SUB':
-            client.join(*args)
+    def handle_pull(req):
+        if not is_pull_request(req):
+            return
 
-    client.start_zyre()
-    loop.add_handler(client.actor, client.handle_message, zmq.POLLIN)
-    loop.add_handler(pull, handle_pull, zmq.POLLIN)
+        if req[0] == b'PUB':
+            req = ingress(req, seen, args.mesh_ids)
+            if req is None:
+                return
 
-    terminated = False
-    while not terminated:
-        try:
-            logger.info('starting loop...')
-            loop.start()
-        except KeyboardInterrupt:
-            logger.info('SIGINT Received')
+            pub.send_multipart(published(req, args.pub_ids))
 
-            terminated = True
-        except Exception as e:
-            terminated = True
-            logger.error(e)
+        dispatch(client, index, req)
 
-    logger.info('shutting down..')
+    client.start_zyre()
+    loop.add_handler(client.actor, client.handle_messages, zmq.POLLIN)
+    loop.add_handler(pull, lambda *_: drain(pull, client.batch_size, handle_pull), zmq.POLLIN)
+
+    if args.xpub:
+        loop.add_handler(pub, lambda *_: drain(pub, client.batch_size, lambda m: dispatch(client, index,
+                                                                                         xpub_command(m[0]))),
+                         zmq.POLLIN)
+
+    if args.sub_ttl:
+        ioloop.PeriodicCallback(lambda: expire(client, index), max(1, args.sub_ttl // 10) * 1000).start()
 
-    client.stop_zyre()
+    run(loop, client)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,101 @@
+# opt-in startup profiling for the console scripts (--profile-startup or ZYRE_PROFILE_STARTUP=1)
+#
+# timings are always collected (a couple of time() calls per phase), the report is only written to stderr when
+# profiling was enabled. it goes out once the node sees its first peer ENTER, or at exit if that never happens.
+#
+# this module is imported first thing by pyzyre/__init__.py, keep it free of heavy imports.
+
+import atexit
+import os
+import sys
+import time
+
+PROFILE_STARTUP = os.getenv('ZYRE_PROFILE_STARTUP', '0') not in ('', '0', 'false', 'False')
+
+START = time.time()
+
+_phases = {}  # name -> [seconds since START when the phase last ended, total duration, calls]
+_order = []
+_enabled = False
+_reported = False
+
+
+def _record(name, duration=None):
+    if name not in _phases:
+        _phases[name] = [0, None, 0]
+        _order.append(name)
+
+    p = _phases[name]
+    p[0] = time.time() - START
+    p[2] += 1
+
+    if duration is not None:
+        p[1] = (p[1] or 0) + duration
+
+
+class timed(object):
+    # time a phase, as a context manager or a function decorator. repeated phases are summed
+
+    def __init__(self, name):
+        self.name = name
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, *exc):
+        _record(self.name, time.time() - self._start)
+
+    def __call__(self, fn):
+        def wrapper(*args, **kwargs):
+            with timed(self.name):
+                return fn(*args, **kwargs)
+
+        wrapper.__name__ = fn.__name__
+        wrapper.__doc__ = fn.__doc__
+        return wrapper
+
+
+# record a milestone, only the first occurrence counts
+def mark(name):
+    if name not in _phases:
+        _record(name)
+
+
+def enable():
+    global _enabled
+
+    if _enabled:
+        return
+
+    _enabled = True
+    atexit.register(report)
+
+
+def enabled():
+    return _enabled
+
+
+def report(stream=None):
+    global _reported
+
+    if not _enabled or _reported:
+        return
+
+    _reported = True
+    stream = stream or sys.stderr
+
+    stream.write('startup profile ({}), seconds since pyzyre was imported:\n'.format(os.path.basename(sys.argv[0])))
+    stream.write('  {:<20} {:>10} {:>10} {:>6}\n'.format('phase', 'took', 'done at', 'calls'))
+
+    for name in _order:
+        at, duration, calls = _phases[name]
+        duration = '{:10.4f}'.format(duration) if duration is not None else '{:>10}'.format('-')
+        stream.write('  {:<20} {} {:10.4f} {:>6}\n'.format(name, duration, at, calls))
+
+    stream.flush()
+
+
+if PROFILE_STARTUP:
+    enable()
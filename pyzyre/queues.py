@@ -0,0 +1,288 @@
+# queue groups, run by the broker (see broker.py)
+#
+# a SHOUT goes to every member of a group, a queue group hands each message to exactly one of its workers instead:
+#
+#   worker   JOINs $$QUEUE:<name>
+#   producer SHOUTs to <name> as usual, the broker JOINs <name> once it has seen a worker for it
+#   broker -> worker  [$$QUEUE, name, id, payload..]
+#   worker -> broker  [$$ACK, name, id]
+#
+# each worker has at most prefetch messages outstanding. "least" gives the next message to the worker with the
+# fewest outstanding (ties go round-robin), "round-robin" ignores how busy they are. messages a worker hasn't acked
+# when it LEAVEs, EXITs or goes EVASIVE, or within ack_timeout seconds, go back to the front of the queue and are
+# delivered to someone else. delivery is at-least-once, a worker may see a message more than once.
+#
+# an EVASIVE worker usually comes back (and zyre won't tell us it JOINed again), so it stays in the queue. it's only
+# passed over until we hear from it again or ack_timeout runs out.
+
+import logging
+import os
+import time
+from collections import deque, OrderedDict
+
+PREFIX = b'$$QUEUE:'
+QUEUE = b'$$QUEUE'
+ACK = b'$$ACK'
+
+PREFETCH = int(os.getenv('ZYRE_QUEUE_PREFETCH', 1))
+ACK_TIMEOUT = int(os.getenv('ZYRE_QUEUE_ACK_TIMEOUT', 30))
+MAX_PENDING = int(os.getenv('ZYRE_QUEUE_MAX_PENDING', 100000))
+SCHEDULERS = ('least', 'round-robin')
+SCHEDULER = os.getenv('ZYRE_QUEUE_SCHEDULER', 'least')
+
+logger = logging.getLogger(__name__)
+
+
+def _bytes(s):
+    if not isinstance(s, bytes):
+        s = s.encode('utf-8')
+
+    return s
+
+
+# the group a worker JOINs to take work from name
+def queue_group(name):
+    return PREFIX + _bytes(name)
+
+
+# (name, id, payload) of a whispered delivery, None if it isn't one
+def delivery(frames):
+    if len(frames) < 3 or frames[0] != QUEUE:
+        return
+
+    return frames[1], frames[2], frames[3:]
+
+
+# what a worker whispers back to the broker once it's done with a delivery
+def ack_request(name, id):
+    return [ACK, _bytes(name), id]
+
+
+class Queue(object):
+
+    def __init__(self, name, prefetch=PREFETCH, ack_timeout=ACK_TIMEOUT, max_pending=MAX_PENDING,
+                 scheduler=SCHEDULER):
+        if scheduler not in SCHEDULERS:
+            raise ValueError('unknown scheduler: %s' % scheduler)
+
+        self.name = name
+        self.prefetch = prefetch
+        self.ack_timeout = ack_timeout
+        self.max_pending = max_pending
+        self.scheduler = scheduler
+
+        self.workers = OrderedDict()  # worker -> ids outstanding
+        self.inflight = {}  # id -> (worker, frames, deadline)
+        self.pending = deque()  # (id, frames)
+        self.paused = {}  # evasive worker -> when it's given work again regardless
+
+        self.dropped = 0
+        self.redelivered = 0
+
+        self._id = 0
+        self._rr = 0
+
+    def __len__(self):
+        return len(self.pending) + len(self.inflight)
+
+    def join(self, worker, now=None):
+        if worker not in self.workers:
+            self.workers[worker] = set()
+
+        return self._dispatch(now)
+
+    # the worker's outstanding messages are redelivered in the order they were first queued
+    def leave(self, worker, now=None):
+        self.paused.pop(worker, None)
+        ids = self.workers.pop(worker, None)
+        if ids:
+            self._requeue(ids)
+
+        return self._dispatch(now)
+
+    # what it has outstanding goes to someone else, it gets nothing new until resume (or ack_timeout)
+    def evade(self, worker, now=None):
+        ids = self.workers.get(worker)
+        if ids is None:
+            return []
+
+        self.paused[worker] = (now or time.time()) + self.ack_timeout
+        if ids:
+            self.workers[worker] = set()
+            self._requeue(ids)
+
+        return self._dispatch(now)
+
+    # we've heard from a worker that went EVASIVE
+    def resume(self, worker, now=None):
+        if self.paused.pop(worker, None) is None:
+            return []
+
+        return self._dispatch(now)
+
+    def push(self, frames, now=None):
+        self._id += 1
+        self.pending.append((str(self._id).encode('utf-8'), frames))
+
+        if len(self.pending) > self.max_pending:
+            self.pending.popleft()
+            self.dropped += 1
+            if self.dropped == 1 or not self.dropped % 1000:
+                logger.warn('queue %s is full, %d messages dropped so far' % (self.name, self.dropped))
+
+        return self._dispatch(now)
+
+    def ack(self, worker, id, now=None):
+        out = self.resume(worker, now)
+
+        try:
+            w, _, _ = self.inflight[id]
+        except KeyError:
+            return out
+
+        # acked by someone it was taken away from, it's still out with whoever has it now
+        if w != worker:
+            return out
+
+        del self.inflight[id]
+        self.workers[w].discard(id)
+        return out + self._dispatch(now)
+
+    # requeue anything whose ack is overdue
+    def expire(self, now=None):
+        now = now or time.time()
+
+        for w in [w for w, until in self.paused.items() if until <= now]:
+            del self.paused[w]
+
+        expired = [id for id, (_, _, deadline) in self.inflight.items() if deadline <= now]
+        for id in expired:
+            self.workers[self.inflight[id][0]].discard(id)
+
+        if expired:
+            logger.debug('queue %s: %d acks overdue' % (self.name, len(expired)))
+            self._requeue(expired)
+
+        return self._dispatch(now)
+
+    def _requeue(self, ids):
+        for id in sorted(ids, key=int, reverse=True):
+            _, frames, _ = self.inflight.pop(id)
+            self.pending.appendleft((id, frames))
+            self.redelivered += 1
+
+    def _worker(self):
+        workers = list(self.workers)
+        n = len(workers)
+
+        best = None
+        for i in range(n):
+            w = workers[(self._rr + i) % n]
+            outstanding = len(self.workers[w])
+            if outstanding >= self.prefetch or w in self.paused:
+                continue
+
+            if self.scheduler == 'round-robin' or not outstanding:
+                best = (self._rr + i) % n
+                break
+
+            if best is None or outstanding < len(self.workers[workers[best]]):
+                best = (self._rr + i) % n
+
+        if best is None:
+            return
+
+        self._rr = best + 1
+        return workers[best]
+
+    # [(worker, [$$QUEUE, name, id, payload..])] for the broker to whisper
+    def _dispatch(self, now=None):
+        deadline = (now or time.time()) + self.ack_timeout
+        out = []
+
+        while self.pending:
+            w = self._worker()
+            if w is None:
+                break
+
+            id, frames = self.pending.popleft()
+            self.inflight[id] = (w, frames, deadline)
+            self.workers[w].add(id)
+            out.append((w, [QUEUE, self.name, id] + frames))
+
+        return out
+
+
+# every queue the broker knows about, by name. a queue is created the first time a worker joins it, producers
+# SHOUTing to a queue nobody has joined yet are just a group
+class Queues(object):
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.queues = {}
+
+    def __contains__(self, name):
+        return name in self.queues
+
+    def get(self, name):
+        return self.queues.get(name)
+
+    # (name, deliveries), name is None when group isn't a queue group
+    def join(self, worker, group, now=None):
+        if not group.startswith(PREFIX):
+            return None, []
+
+        name = group[len(PREFIX):]
+        q = self.queues.get(name)
+        if q is None:
+            q = self.queues[name] = Queue(name, **self.kwargs)
+
+        return name, q.join(worker, now)
+
+    def leave(self, worker, group, now=None):
+        q = self.queues.get(group[len(PREFIX):]) if group.startswith(PREFIX) else None
+        if q is None:
+            return []
+
+        return q.leave(worker, now)
+
+    # the worker is gone (EXIT), out of every queue
+    def exit(self, worker, now=None):
+        out = []
+        for q in self.queues.values():
+            if worker in q.workers:
+                out.extend(q.leave(worker, now))
+
+        return out
+
+    def evade(self, worker, now=None):
+        out = []
+        for q in self.queues.values():
+            out.extend(q.evade(worker, now))
+
+        return out
+
+    def resume(self, worker, now=None):
+        out = []
+        for q in self.queues.values():
+            if q.paused:
+                out.extend(q.resume(worker, now))
+
+        return out
+
+    def push(self, name, frames, now=None):
+        return self.queues[name].push(frames, now)
+
+    def ack(self, worker, name, id, now=None):
+        q = self.queues.get(name)
+        if q is None:
+            return []
+
+        return q.ack(worker, id, now)
+
+    def expire(self, now=None):
+        out = []
+        for q in self.queues.values():
+            out.extend(q.expire(now))
+
+        return out
@@ -0,0 +1,5 @@
+# persistent per group message log used by zyre-broker for store and forward / replay
+
+from .log import Log, Store, SEGMENT_BYTES
+from .segment import Segment
+from .retention import Policy, Compactor, parse_policy
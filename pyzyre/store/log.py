@@ -0,0 +1,248 @@
+# an append-only, segment rotated log per group, see segment.py for the file format
+#
+# offsets are per group and never reused. appends go to the newest segment until it's over segment_bytes, then a
+# new one is started at the next offset. writes are only fsync'd by sync(), the broker calls it on a timer so the
+# cost is paid once per interval instead of once per message. retention drops whole segments from the front of
+# the log, compaction rewrites closed segments (see retention.py).
+
+import binascii
+import bisect
+import logging
+import os
+import threading
+import time
+
+from .segment import Segment
+
+SEGMENT_BYTES = int(os.getenv('ZYRE_STORE_SEGMENT_BYTES', 64 * 1024 * 1024))
+
+logger = logging.getLogger(__name__)
+
+
+class Log(object):
+
+    def __init__(self, path, segment_bytes=SEGMENT_BYTES):
+        self.path = path
+        self.segment_bytes = segment_bytes
+
+        # appends and reads come from the broker's IOLoop, retention and compaction from the compactor thread
+        self.lock = threading.RLock()
+
+        if not os.path.exists(path):
+            os.makedirs(path)
+
+        # left behind by a compaction that didn't finish, the original segment is still in place
+        for f in os.listdir(path):
+            if f.endswith('.compact'):
+                os.remove(os.path.join(path, f))
+
+        bases = sorted(int(f[:-4]) for f in os.listdir(path) if f.endswith('.log'))
+        self.segments = [Segment(self._segment_path(b), b) for b in bases]
+
+        if not self.segments:
+            self.segments.append(Segment(self._segment_path(0), 0))
+
+    def _segment_path(self, base):
+        return os.path.join(self.path, '%020d.log' % base)
+
+    def __len__(self):
+        return sum(len(s) for s in self.segments)
+
+    @property
+    def start(self):
+        return self.segments[0].base
+
+    @property
+    def next(self):
+        return self.segments[-1].next
+
+    @property
+    def size(self):
+        return sum(s.size for s in self.segments)
+
+    def _roll(self):
+        s = self.segments[-1]
+        s.seal()
+
+        s = Segment(self._segment_path(s.next), s.next)
+        self.segments.append(s)
+        logger.debug('%s: new segment at %d' % (self.path, s.base))
+        return s
+
+    def append(self, frames, ts=None):
+        with self.lock:
+            s = self.segments[-1]
+            if s.size >= self.segment_bytes:
+                s = self._roll()
+
+            offset = s.next
+            s.append(offset, ts or time.time(), frames)
+            return offset
+
+    def _segment(self, offset):
+        i = bisect.bisect_right([s.base for s in self.segments], offset) - 1
+        return max(i, 0)
+
+    # a list of (offset, timestamp, frames) from offset (the start of the log by default), at most limit of them.
+    # offsets compacted away are skipped
+    def read(self, offset=None, limit=None):
+        records = []
+
+        with self.lock:
+            offset = self.start if offset is None else offset
+
+            for s in self.segments[self._segment(offset):]:
+                for i in range(s.index(offset), len(s)):
+                    if limit is not None and len(records) >= limit:
+                        return records
+
+                    records.append(s.read(i))
+
+        return records
+
+    # the offset of the first of the last n records
+    def tail(self, n):
+        with self.lock:
+            for s in reversed(self.segments):
+                if n <= len(s):
+                    return s.offsets[len(s) - n] if n else self.next
+
+                n -= len(s)
+
+            return self.start
+
+    # the last n records
+    def last(self, n):
+        return self.read(self.tail(n))
+
+    # drop whole segments older than max_age seconds and the oldest segments while the log is over max_bytes,
+    # returns the number of records dropped
+    def retain(self, max_age=None, max_bytes=None, now=None):
+        dropped = 0
+
+        with self.lock:
+            if max_age:
+                expired = (now or time.time()) - max_age
+
+                # the segment being written to is rolled first if everything in it has expired
+                last = self.segments[-1]
+                if len(last) and last.timestamps[-1] < expired:
+                    self._roll()
+
+                while len(self.segments) > 1 and (not len(self.segments[0]) or
+                                                  self.segments[0].timestamps[-1] < expired):
+                    dropped += self._drop()
+
+            if max_bytes:
+                while len(self.segments) > 1 and self.size > max_bytes:
+                    dropped += self._drop()
+
+        return dropped
+
+    def _drop(self):
+        s = self.segments.pop(0)
+        logger.debug('%s: dropping segment %d, %d records' % (self.path, s.base, len(s)))
+        s.remove()
+        return len(s)
+
+    # keep only the latest record for each key (frames[key]) in every segment but the one being written to,
+    # records without a key frame are kept. returns the number of records dropped
+    def compact(self, key):
+        latest = {}
+
+        def scan(s):
+            for i in range(len(s)):
+                offset, _, frames = s.read(i)
+                if len(frames) > key:
+                    latest[frames[key]] = max(latest.get(frames[key], -1), offset)
+
+        # closed segments are sealed (opened from disk or rolled, see Segment.seal) so neither their contents nor
+        # their map change, they're read without holding the lock. the one being written to isn't. they're scanned
+        # out of order, so the highest offset for a key wins
+        with self.lock:
+            segments = list(self.segments)
+            scan(segments[-1])
+
+        for s in segments[:-1]:
+            scan(s)
+
+        dropped = 0
+        for s in segments[:-1]:
+            keep = []
+            for i in range(len(s)):
+                offset, _, frames = s.read(i)
+                if len(frames) <= key or latest[frames[key]] == offset:
+                    keep.append(i)
+
+            if len(keep) == len(s):
+                continue
+
+            path = s.copy(keep)
+
+            with self.lock:
+                if s not in self.segments:
+                    os.remove(path)
+                    continue
+
+                s.close()
+                os.rename(path, s.path)
+                self.segments[self.segments.index(s)] = Segment(s.path, s.base)
+
+            dropped += len(s) - len(keep)
+            logger.debug('%s: compacted segment %d, %d of %d records kept' % (self.path, s.base, len(keep),
+                                                                                len(s)))
+
+        return dropped
+
+    def sync(self):
+        with self.lock:
+            self.segments[-1].sync()
+
+    def close(self):
+        with self.lock:
+            for s in self.segments:
+                s.close()
+
+
+# one Log per group under path, opened when the group is first written or read
+class Store(object):
+
+    def __init__(self, path, segment_bytes=SEGMENT_BYTES):
+        self.path = os.path.expanduser(path)
+        self.segment_bytes = segment_bytes
+        self.logs = {}
+
+        if not os.path.exists(self.path):
+            os.makedirs(self.path)
+
+        # groups are stored hex encoded, group names can be anything
+        for d in os.listdir(self.path):
+            try:
+                self.log(binascii.unhexlify(d))
+            except (TypeError, ValueError, binascii.Error):
+                logger.warn('skipping %s, not a group log' % os.path.join(self.path, d))
+
+    def log(self, group):
+        try:
+            return self.logs[group]
+        except KeyError:
+            pass
+
+        log = self.logs[group] = Log(os.path.join(self.path, binascii.hexlify(group).decode('utf-8')),
+                                     self.segment_bytes)
+        return log
+
+    def append(self, group, frames, ts=None):
+        return self.log(group).append(frames, ts)
+
+    def groups(self):
+        return list(self.logs.keys())
+
+    def sync(self):
+        for log in self.logs.values():
+            log.sync()
+
+    def close(self):
+        for log in self.logs.values():
+            log.sync()
+            log.close()
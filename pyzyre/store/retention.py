@@ -0,0 +1,97 @@
+# retention for the broker's logs, enforced by a background thread so the IOLoop never waits on it
+#
+# each group has a policy: max_age (seconds), max_bytes and key, the index of a frame to compact on (only the
+# latest message for each key is kept). groups without a policy of their own get the default one. policies are
+# given on the command line as GROUP:max_age=86400,max_bytes=104857600,key=0
+
+import logging
+import os
+import threading
+import time
+
+MAX_AGE = int(os.getenv('ZYRE_STORE_MAX_AGE', 0))
+MAX_BYTES = int(os.getenv('ZYRE_STORE_MAX_BYTES', 0))
+COMPACT_KEY = os.getenv('ZYRE_STORE_COMPACT_KEY')
+INTERVAL = int(os.getenv('ZYRE_STORE_RETENTION_INTERVAL', 60))
+
+logger = logging.getLogger(__name__)
+
+
+class Policy(object):
+    __slots__ = ('max_age', 'max_bytes', 'key')
+
+    def __init__(self, max_age=None, max_bytes=None, key=None):
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.key = key
+
+    def __repr__(self):
+        return '<Policy max_age={} max_bytes={} key={}>'.format(self.max_age, self.max_bytes, self.key)
+
+
+DEFAULT = Policy(MAX_AGE or None, MAX_BYTES or None, int(COMPACT_KEY) if COMPACT_KEY else None)
+
+
+# GROUP:max_age=..,max_bytes=..,key=.. -> (group, Policy), anything not given comes from default
+def parse_policy(s, default=DEFAULT):
+    group, _, options = s.partition(':')
+    if not group:
+        raise ValueError('missing group: %s' % s)
+
+    p = Policy(default.max_age, default.max_bytes, default.key)
+    for o in options.split(','):
+        if not o:
+            continue
+
+        k, _, v = o.partition('=')
+        if k not in Policy.__slots__:
+            raise ValueError('unknown retention option: %s' % k)
+
+        setattr(p, k, int(v) if v else None)
+
+    return group.encode('utf-8'), p
+
+
+class Compactor(threading.Thread):
+
+    def __init__(self, store, policies=None, default=DEFAULT, interval=INTERVAL):
+        super(Compactor, self).__init__(name='zyre-compactor')
+        self.daemon = True
+
+        self.store = store
+        self.policies = policies or {}
+        self.default = default
+        self.interval = interval
+
+        self._stop_event = threading.Event()
+
+    def policy(self, group):
+        return self.policies.get(group, self.default)
+
+    def enforce(self, now=None):
+        now = now or time.time()
+
+        for group, log in list(self.store.logs.items()):
+            p = self.policy(group)
+
+            try:
+                if p.key is not None:
+                    n = log.compact(p.key)
+                    if n:
+                        logger.info('compacted %d messages from %s' % (n, group))
+
+                if p.max_age or p.max_bytes:
+                    n = log.retain(p.max_age, p.max_bytes, now)
+                    if n:
+                        logger.info('expired %d messages from %s' % (n, group))
+
+            except Exception:
+                logger.exception('retention failed for %s' % group)
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.enforce()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
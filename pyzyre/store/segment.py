@@ -0,0 +1,190 @@
+# one file of a group's log, <base offset>.log
+#
+# records are appended as [length, offset, timestamp] followed by the message: [frame count] then [frame length,
+# frame bytes] for each frame. the offset and file position of every record is kept in memory so a read is a
+# single seek into an mmap of the file. offsets only ever increase but may have gaps once a segment has been
+# compacted. a torn record at the end of the file (crash mid write) is cut off when the segment is opened.
+
+import bisect
+import mmap
+import os
+import struct
+from array import array
+
+HEADER = struct.Struct('>IQd')  # body length, offset, timestamp
+COUNT = struct.Struct('>I')
+
+# offsets and positions are 64 bit. array has no 'Q' before python 3.3, 'L' is 8 bytes on 64 bit unix but 4 on
+# windows, a list is used where neither will do
+try:
+    _UINT64 = array('Q').typecode
+except ValueError:
+    _UINT64 = 'L' if array('L').itemsize >= 8 else None
+
+
+def _uint64s():
+    return array(_UINT64) if _UINT64 else []
+
+
+def encode(frames):
+    parts = [COUNT.pack(len(frames))]
+    for f in frames:
+        parts.append(COUNT.pack(len(f)))
+        parts.append(f)
+
+    return parts
+
+
+def decode(buf, pos):
+    n = COUNT.unpack_from(buf, pos)[0]
+    pos += COUNT.size
+
+    frames = []
+    for _ in range(n):
+        size = COUNT.unpack_from(buf, pos)[0]
+        pos += COUNT.size
+        frames.append(buf[pos:pos + size])
+        pos += size
+
+    return frames
+
+
+class Segment(object):
+
+    def __init__(self, path, base):
+        self.path = path
+        self.base = base
+        self.offsets = _uint64s()
+        self.positions = _uint64s()
+        self.timestamps = array('d')
+        self.size = 0
+
+        self._file = open(path, 'a+b')
+        self._mm = None
+        self._dirty = False  # written but not flushed, _map flushes it
+        self._unsynced = False  # written since the last fsync
+
+        self._recover()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    @property
+    def next(self):
+        if self.offsets:
+            return self.offsets[-1] + 1
+
+        return self.base
+
+    # index of the first record at or after offset
+    def index(self, offset):
+        return bisect.bisect_left(self.offsets, offset)
+
+    def _map(self):
+        if self._dirty:
+            self._file.flush()
+            self._dirty = False
+
+        if self._mm is not None and len(self._mm) >= self.size:
+            return self._mm
+
+        if self._mm is not None:
+            self._mm.close()
+
+        self._mm = mmap.mmap(self._file.fileno(), self.size, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def _recover(self):
+        end = os.fstat(self._file.fileno()).st_size
+        if not end:
+            return
+
+        self.size = end
+        buf = self._map()
+
+        pos = 0
+        while pos + HEADER.size <= end:
+            length, offset, ts = HEADER.unpack_from(buf, pos)
+            if pos + HEADER.size + length > end or offset < self.next:
+                break
+
+            self.offsets.append(offset)
+            self.positions.append(pos)
+            self.timestamps.append(ts)
+            pos += HEADER.size + length
+
+        if pos < end:
+            self._mm.close()
+            self._mm = None
+            self._file.truncate(pos)
+            self.size = pos
+
+            if pos:
+                self._map()
+
+    def append(self, offset, ts, frames):
+        parts = encode(frames)
+        length = sum(len(p) for p in parts)
+
+        self._file.write(HEADER.pack(length, offset, ts))
+        for p in parts:
+            self._file.write(p)
+
+        self.offsets.append(offset)
+        self.positions.append(self.size)
+        self.timestamps.append(ts)
+        self.size += HEADER.size + length
+        self._dirty = True
+        self._unsynced = True
+
+    # (offset, timestamp, frames) of the i'th record, frames are bytes copied out of the mmap
+    def read(self, i):
+        pos = self.positions[i]
+        buf = self._map()
+
+        return self.offsets[i], self.timestamps[i], decode(buf, pos + HEADER.size)
+
+    # copy the records at indexes into <path>.compact and return its path, the records are copied as they are
+    def copy(self, indexes):
+        path = self.path + '.compact'
+        buf = self._map()
+
+        with open(path, 'wb') as f:
+            for i in indexes:
+                pos = self.positions[i]
+                f.write(buf[pos:pos + HEADER.size + HEADER.unpack_from(buf, pos)[0]])
+
+            f.flush()
+            os.fsync(f.fileno())
+
+        return path
+
+    # the segment won't be written to again. it's mapped in full now so its map never changes, reads from other
+    # threads (the compactor) can share it without a lock
+    def seal(self):
+        self.sync()
+        if self.size:
+            self._map()
+
+    # a no-op unless something's been appended since the last one, the broker calls it for every group on a timer
+    def sync(self):
+        if not self._unsynced:
+            return
+
+        if self._dirty:
+            self._file.flush()
+            self._dirty = False
+
+        os.fsync(self._file.fileno())
+        self._unsynced = False
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+        self._file.close()
+
+    def remove(self):
+        self.close()
+        os.remove(self.path)
@@ -3,10 +3,15 @@ from argparse import ArgumentParser
 import logging
 from csirtg_network.interfaces import *
 
+import zmq
 from czmq import Zcert
 
+from pyzyre import profiling
+
 from pyzyre.constants import VERSION, ENDPOINT, PUBLIC_KEY, GOSSIP_PUBLIC_KEY, SECRET_KEY, CURVE_ALLOW_ANY, ZYRE_GROUP, \
-    NODE_NAME, CERT_PATH, LOG_FORMAT, LOGLEVEL, GOSSIP_BIND, GOSSIP_CONNECT
+    NODE_NAME, CERT_PATH, LOG_FORMAT, LOGLEVEL, GOSSIP_BIND, GOSSIP_CONNECT, BATCH_SIZE, CREDIT_WINDOW, SNDHWM, \
+    RCVHWM, SNDTIMEO, RCVTIMEO, TCP_KEEPALIVE, TCP_KEEPALIVE_IDLE, SNDBUF, RCVBUF, RELIABLE, RETRANSMIT_BUFFER, \
+    DEDUP_WINDOW, DEDUP_BITS
 
 if not os.path.exists(CERT_PATH):
     CERT_PATH = None
@@ -14,12 +19,53 @@ if not os.path.exists(CERT_PATH):
 
 logger = logging.getLogger(__name__)
 
+# Client kwarg / parsed arg -> libzmq option, default (from the ZYRE_* env) and --help
+SOCKET_OPTIONS = [
+    ('sndhwm', zmq.SNDHWM, SNDHWM, 'max messages queued outbound per peer, 0 is unlimited'),
+    ('rcvhwm', zmq.RCVHWM, RCVHWM, 'max messages queued inbound per peer, 0 is unlimited'),
+    ('sndtimeo', zmq.SNDTIMEO, SNDTIMEO, 'ms a send may block before raising EAGAIN, -1 blocks'),
+    ('rcvtimeo', zmq.RCVTIMEO, RCVTIMEO, 'ms a recv may block before raising EAGAIN, -1 blocks'),
+    ('tcp_keepalive', zmq.TCP_KEEPALIVE, TCP_KEEPALIVE, 'SO_KEEPALIVE, 1 on, 0 off'),
+    ('tcp_keepalive_idle', zmq.TCP_KEEPALIVE_IDLE, TCP_KEEPALIVE_IDLE, 'seconds idle before keepalive probes'),
+    ('sndbuf', zmq.SNDBUF, SNDBUF, 'kernel send buffer size in bytes'),
+    ('rcvbuf', zmq.RCVBUF, RCVBUF, 'kernel receive buffer size in bytes'),
+]
+
+
+# the socket options set in a Client's kwargs or the parsed args, falling back to the environment
+def socket_options(source):
+    if not isinstance(source, dict):
+        source = vars(source)
+
+    options = {}
+    for k, _, default, _ in SOCKET_OPTIONS:
+        v = source.get(k)
+        if v is None:
+            v = default
+
+        if v is not None:
+            options[k] = int(v)
+
+    return options
+
+
+# apply options (or only the named ones) to a socket, before it's bound or connected for the hwm and tcp options
+# to take effect
+def setup_socket(s, options, names=None):
+    for k, opt, _, _ in SOCKET_OPTIONS:
+        if k in options and (names is None or k in names):
+            s.setsockopt(opt, options[k])
+
+    return s
+
 
 def get_argument_parser(advanced=True):
     BasicArgs = ArgumentParser(add_help=False)
     BasicArgs.add_argument('-d', '--debug', action="store_true")
     BasicArgs.add_argument('-v', '--verbose', action="store_true")
     BasicArgs.add_argument('-V', '--version', action="version", version=VERSION)
+    BasicArgs.add_argument('--profile-startup', help="report where startup time goes to stderr", action="store_true",
+                           default=profiling.PROFILE_STARTUP)
 
     if not advanced:
         return ArgumentParser(parents=[BasicArgs], add_help=False)
@@ -47,11 +93,30 @@ def get_argument_parser(advanced=True):
                            default=GOSSIP_PUBLIC_KEY)
     BasicArgs.add_argument('--zauth-curve-allow', help="specify zauth curve allow [default %(default)s]",
                            default=CURVE_ALLOW_ANY)
+    BasicArgs.add_argument('--batch-size', help="max events handled per wakeup [default %(default)s]", type=int,
+                           default=BATCH_SIZE)
+    BasicArgs.add_argument('--credit', help="whispers a peer may have in flight to us, 0 disables flow control "
+                                            "[default %(default)s]", type=int, default=CREDIT_WINDOW)
+    BasicArgs.add_argument('--reliable', help="sequence SHOUTs and ask peers to resend the ones we miss, every peer "
+                                              "in the group needs it", action="store_true", default=RELIABLE)
+    BasicArgs.add_argument('--retransmit-buffer', help="SHOUTs kept per group for resending [default %(default)s]",
+                           type=int, default=RETRANSMIT_BUFFER)
+    BasicArgs.add_argument('--dedup', help="drop SHOUTs already seen within this many seconds, 0 disables it "
+                                           "[default %(default)s]", type=int, default=DEDUP_WINDOW)
+    BasicArgs.add_argument('--dedup-bits', help="size of each of the dedup bloom filters [default %(default)s]",
+                           type=int, default=DEDUP_BITS)
+
+    for k, _, default, h in SOCKET_OPTIONS:
+        BasicArgs.add_argument('--%s' % k.replace('_', '-'), help='%s [default %%(default)s]' % h, type=int,
+                               default=default)
 
     return ArgumentParser(parents=[BasicArgs], add_help=False)
 
 
 def setup_logging(args):
+    if getattr(args, 'profile_startup', False):
+        profiling.enable()
+
     loglevel = logging.getLevelName(LOGLEVEL)
 
     if args.verbose:
@@ -66,6 +131,7 @@ def setup_logging(args):
     logging.getLogger('').addHandler(console)
 
 
+@profiling.timed('setup_curve')
 def setup_curve(args):
     if not args.curve and not args.publickey and not args.cert and not args.gossip_publickey and not args.gossip_cert:
         return None
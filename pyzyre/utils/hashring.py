@@ -0,0 +1,39 @@
+# consistent hash ring, maps keys (group names) onto a fixed set of nodes so adding or removing a node only moves
+# the keys that node owned. every process building a ring from the same nodes gets the same answers.
+
+import bisect
+import hashlib
+
+REPLICAS = 100
+CACHE_SIZE = 65536
+
+
+def _hash(key):
+    if not isinstance(key, bytes):
+        key = key.encode('utf-8')
+
+    return int(hashlib.md5(key).hexdigest()[:8], 16)
+
+
+class HashRing(object):
+
+    def __init__(self, nodes, replicas=REPLICAS):
+        ring = sorted((_hash('%s-%d' % (n, r)), n) for n in nodes for r in range(replicas))
+
+        self.points = [p for p, _ in ring]
+        self.nodes = [n for _, n in ring]
+        self._cache = {}
+
+    def get(self, key):
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        i = bisect.bisect(self.points, _hash(key)) % len(self.points)
+
+        if len(self._cache) >= CACHE_SIZE:
+            self._cache.clear()
+
+        n = self._cache[key] = self.nodes[i]
+        return n
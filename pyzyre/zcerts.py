@@ -5,10 +5,14 @@ import zmq.auth
 from argparse import ArgumentParser
 from pprint import pprint
 
+from pyzyre import profiling
+
 CERTS_PATH = os.getenv('ZYRE_CERTS_PATH', os.path.expanduser('~/.curve'))
 
 
 def main():
+    profiling.mark('imports')
+
     if zmq.zmq_version_info() < (4,0):
         raise RuntimeError("Security is not supported in libzmq version < 4.0. libzmq version {0}".format(
             zmq.zmq_version()))
@@ -18,12 +22,18 @@ def main():
     p.add_argument('-v', '--verbose', action="store_true")
     p.add_argument('--path', help='specify base path [default %(default)s]', default=CERTS_PATH)
     p.add_argument('--name', help='specify key name [default %(default)s]', default='zyre')
+    p.add_argument('--profile-startup', help="report where startup time goes to stderr", action="store_true",
+                   default=profiling.PROFILE_STARTUP)
 
     args = p.parse_args()
 
-    certs = zmq.auth.create_certificates(args.path, 'test', metadata={'name': args.name})
-    for c in certs:
-        os.chmod(c, 0600)
+    if args.profile_startup:
+        profiling.enable()
+
+    with profiling.timed('create_certificates'):
+        certs = zmq.auth.create_certificates(args.path, 'test', metadata={'name': args.name})
+        for c in certs:
+            os.chmod(c, 0o600)
 
     print("Generated certs in: %s" % CERTS_PATH)
 
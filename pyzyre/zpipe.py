@@ -1,4 +1,6 @@
+import codecs
 import logging
+import os
 from argparse import ArgumentParser, RawDescriptionHelpFormatter
 import textwrap
 import select
@@ -6,15 +8,101 @@ import sys
 
 import zmq
 from pyzyre.constants import PYVERSION, ZMQ_LINGER, ZYRE_GATEWAY
-from pyzyre.utils import setup_logging, get_argument_parser
+from pyzyre.utils import setup_logging, get_argument_parser, socket_options, setup_socket
+from pyzyre import profiling
+
+READ_SIZE = 65536
+# unset leaves the socket's SNDHWM to ZYRE_SNDHWM (see pyzyre.utils.SOCKET_OPTIONS) or libzmq's default of 1000
+PIPE_HWM = os.getenv('ZYRE_PIPE_HWM')
+
+logger = logging.getLogger(__name__)
+
+
+def _ready(fd):
+    return select.select([fd, ], [], [], 0.0)[0]
+
+
+def delimiter(d):
+    # allow escapes on the command line, eg: --delimiter '\0' or --delimiter '\n\n'
+    if not isinstance(d, bytes):
+        d = d.encode('utf-8')
+
+    d = codecs.escape_decode(d)[0]
+    if not d:
+        raise ValueError('delimiter cannot be empty')
+
+    return d
+
+
+# yield lists of up to batch records read from fd, split on delim. the stream is read in READ_SIZE chunks so
+# only the current chunk and a partial record are held in memory. a short batch is yielded whenever the
+# writer hasn't got anything else for us yet, slow producers (tail -f) don't sit in the buffer
+def batches(fd, delim=b'\n', batch=1):
+    pending = []  # the chunks of a record we haven't seen the end of yet
+    tail = b''  # enough of the end of them to spot a delimiter split across chunks
+    records = []
+
+    while True:
+        chunk = os.read(fd, READ_SIZE)
+        if not chunk:
+            break
+
+        # a long record is only joined up once its delimiter shows up, not copied again for every chunk
+        found = delim in tail + chunk
+        pending.append(chunk)
+        tail = (tail + chunk)[1 - len(delim):] if len(delim) > 1 else b''
+
+        parts = []
+        if found:
+            parts = b''.join(pending).split(delim)
+            pending = [parts.pop()]
+            tail = pending[0][1 - len(delim):] if len(delim) > 1 else b''
+
+        for r in parts:
+            if not r:
+                continue
+
+            records.append(r)
+            if len(records) == batch:
+                yield records
+                records = []
+
+        if records and not _ready(fd):
+            yield records
+            records = []
+
+    buf = b''.join(pending)
+    if buf:
+        records.append(buf)
+
+    if records:
+        yield records
+
+
+def stream(s, fd, delim, batch, header=None):
+    header = header or []
+    n = 0
+
+    # with SNDHWM set, send blocks once that many messages are queued for the gateway so the number of
+    # records held in memory is bounded by hwm * batch no matter how fast stdin is
+    for records in batches(fd, delim, batch):
+        s.send_multipart(header + records, copy=False)
+        n += len(records)
+
+    return n
 
 
 def main():
+    profiling.mark('imports')
+
     p = get_argument_parser(advanced=False)
     p = ArgumentParser(
         description=textwrap.dedent('''\
                     example usage:
                         $ cat test.eml | zyre-pipe --gateway tcp://192.168.1.2:49100 [-v|-d]
+                        $ tail -f /var/log/syslog | zyre-pipe --gateway tcp://192.168.1.2:5002 --stream --group logs
+                        $ find . -print0 | zyre-pipe --gateway tcp://192.168.1.2:5002 --stream --delimiter '\\0' \\
+                            --batch 100 --group files
                     '''),
         formatter_class=RawDescriptionHelpFormatter,
         prog='zyre-pipe',
@@ -22,31 +110,74 @@ def main():
     )
 
     p.add_argument('--gateway', help="sepcify the gateway address [default %(default)s]", default=ZYRE_GATEWAY)
-    p.add_argument('--linger', help="specify zmq_linger [default %(default)s]", default=ZMQ_LINGER)
+    p.add_argument('--linger', help="specify zmq_linger [default %s, -1 in --stream mode]" % ZMQ_LINGER)
+    p.add_argument('--stream', help="send each record on STDIN as it's read instead of all of STDIN as one message",
+                   action="store_true")
+    p.add_argument('--delimiter', help="record delimiter in --stream mode, escapes are allowed [default \\n]",
+                   default='\\n')
+    p.add_argument('--batch', help="number of records per message in --stream mode [default %(default)s]", type=int,
+                   default=1)
+    p.add_argument('--hwm', help="max messages in flight to the gateway [default ZYRE_SNDHWM or 1000]", type=int,
+                   default=PIPE_HWM)
+    p.add_argument('--group', help="send as [PUB, group, records..] so the gateway shouts them to the group")
 
     args = p.parse_args()
 
-    logger = logging.getLogger('')
     setup_logging(args)
 
-    if not select.select([sys.stdin, ], [], [], 0.0)[0]:
+    if not args.gateway:
+        p.error('--gateway or ZYRE_GATEWAY is required')
+
+    if args.batch < 1:
+        p.error('--batch must be at least 1')
+
+    try:
+        delim = delimiter(args.delimiter)
+    except ValueError as e:
+        p.error(str(e))
+
+    linger = args.linger
+    if linger is None:
+        linger = -1 if args.stream else ZMQ_LINGER
+
+    fd = sys.stdin.fileno()
+    if not args.stream and not _ready(fd):
         logger.info('Nothing in STDIN to send..')
         raise SystemExit
 
+    header = []
+    if args.group:
+        header = [b'PUB', args.group.encode('utf-8')]
+
     ctx = zmq.Context()
-    s = ctx.socket(zmq.PUSH)
-    s.setsockopt(zmq.LINGER, args.linger)
-    s.connect(args.address)
+    s = setup_socket(ctx.socket(zmq.PUSH), socket_options(args))
+    s.setsockopt(zmq.LINGER, int(linger))
+    if args.hwm is not None:
+        s.setsockopt(zmq.SNDHWM, args.hwm)
+    s.connect(args.gateway)
+
+    try:
+        if args.stream:
+            logger.info('streaming..')
+            n = stream(s, fd, delim, args.batch, header)
+            logger.info('sent %d records' % n)
+
+        else:
+            content = sys.stdin.read().strip('\n')
+
+            if PYVERSION == 2:
+                content = unicode(content, encoding='utf-8', errors='ignore')
 
-    content = sys.stdin.read().strip('\n')
+            logger.info('sending..')
+            s.send_multipart(header + [content.encode('utf-8')])
+            logger.info('sent...')
 
-    if PYVERSION == 2:
-        content = unicode(content, encoding='utf-8', errors='ignore')
+    except KeyboardInterrupt:
+        logger.info('SIGINT Received')
 
-    logger.info('sending..')
-    s.send_multipart([content.encode('utf-8')])
-    logger.info('sent...')
-    s.close()
+    finally:
+        s.close()
+        ctx.term()
 
     logger.info('done')
 
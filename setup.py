@@ -226,7 +226,7 @@ cmdclass = {
 }
 
 
-packages = ['czmq', 'zyre', 'pyzyre', 'pyzyre.client', 'pyzyre.utils']
+packages = ['czmq', 'zyre', 'pyzyre', 'pyzyre.client', 'pyzyre.store', 'pyzyre.utils']
 
 package_data = {
     'zyre': ['*' + lib_ext]
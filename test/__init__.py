@@ -0,0 +1,12 @@
+class Frame(object):
+    # stand-in for zmq.Frame
+    def __init__(self, data):
+        self.bytes = data
+        self.buffer = memoryview(data)
+
+    def __len__(self):
+        return len(self.bytes)
+
+
+def frames(*parts):
+    return [Frame(p) for p in parts]
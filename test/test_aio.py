@@ -0,0 +1,22 @@
+import asyncio
+
+from pyzyre.client.aio import AsyncClient
+
+
+def test_aio_stop_wakes_events():
+    async def run():
+        c = AsyncClient(gossip_bind='ipc:///tmp/gossip-aio.ipc', endpoint='ipc:///tmp/aio.ipc', name='aio')
+        c.start_zyre()
+
+        async def consume():
+            async for _ in c.events():
+                pass
+
+        t = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.1)
+
+        # the consumer is blocked waiting for an event, stopping has to end it
+        await c.stop_zyre()
+        await asyncio.wait_for(t, 1)
+
+    asyncio.get_event_loop().run_until_complete(run())
@@ -0,0 +1,143 @@
+import zmq
+
+from pyzyre import broker
+from pyzyre.broker import BrokerHandler, REPLAY, REPLAYED, replay_request
+from pyzyre.client.events import Shout, Whisper, Join, Flow, Exit
+from pyzyre.queues import Queues, QUEUE, queue_group, ack_request
+from pyzyre.store import Store
+
+from . import frames
+
+
+class Client(object):
+    def __init__(self):
+        self.sent = []
+        self.joined = []
+        self.stalled = False
+
+    def whisper(self, m, peer):
+        if self.stalled:
+            raise zmq.Again()
+
+        self.sent.append((peer, m))
+
+    def join(self, group):
+        self.joined.append(group)
+
+
+class Loop(object):
+    def __init__(self):
+        self.callbacks = []
+
+    def add_callback(self, fn, *args):
+        self.callbacks.append((fn, args))
+
+    def run(self):
+        while self.callbacks:
+            fn, args = self.callbacks.pop(0)
+            fn(*args)
+
+
+def _whisper(m, peer=b'PEER'):
+    return Whisper(frames(b'WHISPER', peer, b'name', *m))
+
+
+def _replayed(client):
+    return [int(m[2]) for _, m in client.sent if m[0] == REPLAYED]
+
+
+def _end(client):
+    assert client.sent[-1][1][:3] == [REPLAY, b'TEST', b'END']
+    return int(client.sent[-1][1][3])
+
+
+def _broker(tmpdir, n):
+    store = Store(str(tmpdir))
+    for i in range(n):
+        store.append(b'TEST', [b'%d' % i])
+
+    return BrokerHandler(store, loop=Loop()), Client()
+
+
+def test_broker_replay(tmpdir):
+    h, c = _broker(tmpdir, 10)
+
+    h.on_whisper(c, _whisper(replay_request(b'TEST', last=3)))
+    assert _replayed(c) == [7, 8, 9]
+    assert _end(c) == 10
+
+    c.sent = []
+    h.on_whisper(c, _whisper(replay_request(b'TEST', offset=8)))
+    assert _replayed(c) == [8, 9]
+    assert c.sent[0][1][3:] == [b'8']
+    assert _end(c) == 10
+
+    # nothing stored for the group
+    c.sent = []
+    h.on_whisper(c, _whisper(replay_request(b'NOPE', last=3)))
+    assert c.sent == [(u'PEER', [REPLAY, b'NOPE', b'END', b'0'])]
+
+    h.store.close()
+
+
+def test_broker_replay_batches(tmpdir, monkeypatch):
+    monkeypatch.setattr(broker, 'REPLAY_BATCH', 4)
+    monkeypatch.setattr(broker, 'REPLAY_MAX', 6)
+
+    h, c = _broker(tmpdir, 10)
+
+    # a batch per callback, END where the peer has to ask again from
+    h.on_whisper(c, _whisper(replay_request(b'TEST', offset=0)))
+    assert _replayed(c) == [0, 1, 2, 3]
+
+    h.loop.run()
+    assert _replayed(c) == [0, 1, 2, 3, 4, 5]
+    assert _end(c) == 6
+
+    h.store.close()
+
+
+def test_broker_replay_stalled(tmpdir, monkeypatch):
+    monkeypatch.setattr(broker, 'REPLAY_BATCH', 4)
+
+    h, c = _broker(tmpdir, 6)
+
+    h.on_whisper(c, _whisper(replay_request(b'TEST', offset=0)))
+    c.stalled = True
+    h.loop.run()
+    assert _replayed(c) == [0, 1, 2, 3]
+
+    # carries on where it stopped once the peer has credit again, END still comes last
+    c.stalled = False
+    h.on_flow(c, Flow(frames(b'FLOW', b'PEER', b'name')))
+    h.loop.run()
+    assert _replayed(c) == [0, 1, 2, 3, 4, 5]
+    assert _end(c) == 6
+
+    # a peer that goes away while stalled is forgotten
+    h.on_whisper(c, _whisper(replay_request(b'TEST', offset=0), peer=b'GONE'))
+    c.stalled = True
+    h.loop.run()
+    h.on_exit(c, Exit(frames(b'EXIT', b'GONE', b'name')))
+    assert not h.stalled
+
+    h.store.close()
+
+
+def test_broker_queues():
+    h, c = BrokerHandler(queues=Queues(prefetch=1, ack_timeout=10)), Client()
+
+    h.on_join(c, Join(frames(b'JOIN', b'W1', b'worker', queue_group(b'work'))))
+    assert c.joined == [b'work']
+
+    h.on_shout(c, Shout(frames(b'SHOUT', b'P', b'producer', b'work', b'x')))
+    h.on_shout(c, Shout(frames(b'SHOUT', b'P', b'producer', b'work', b'y')))
+    assert c.sent == [(u'W1', [QUEUE, b'work', b'1', b'x'])]
+
+    # the ack frees the worker up for the next one
+    h.on_whisper(c, _whisper(ack_request(b'work', b'1'), peer=b'W1'))
+    assert c.sent[-1] == (u'W1', [QUEUE, b'work', b'2', b'y'])
+
+    # the worker has gone, nobody else to give it to
+    h.on_exit(c, Exit(frames(b'EXIT', b'W1', b'worker')))
+    assert len(h.queues.get(b'work')) == 1
@@ -1,4 +1,5 @@
 import netifaces as ni
+import os
 import sys
 from time import sleep
 
@@ -7,7 +8,7 @@ import pytest
 import zmq
 import zmq.auth
 from czmq import Zcert
-from pyzyre.client import Client
+from pyzyre.client import Client, DefaultHandler, Shout
 from pyzyre.client._task import task
 from zmq.auth.thread import ThreadAuthenticator
 from zmq.eventloop import ioloop
@@ -164,4 +165,172 @@ def test_client_gossip_curve(iface):
     c2.stop_zyre()
 
     # cleanup
-    sleep(1)
\ No newline at end of file
+    sleep(1)
+
+def test_client_gossip_multipart(iface):
+    class Handler(DefaultHandler):
+        messages = []
+
+        def on_shout(self, client, event):
+            self.messages.append(event.payload_bytes)
+
+    h = Handler()
+
+    c1 = Client(gossip_bind='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c1.ipc', handler=h)
+    c1.start_zyre()
+
+    c2 = Client(gossip_connect='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c2.ipc')
+    c2.start_zyre()
+
+    # let the peers discover each other and their groups
+    sleep(1)
+
+    c2.shout('ZYRE', [b'HEADER', b'\x00BODY\x00'])
+
+    for _ in range(50):
+        if c1.actor.poll(100):
+            c1.handle_message(c1.actor, zmq.POLLIN)
+
+        if h.messages:
+            break
+
+    c1.stop_zyre()
+    c2.stop_zyre()
+
+    assert h.messages[0] == [b'HEADER', b'\x00BODY\x00']
+
+    # cleanup
+    sleep(1)
+
+
+def test_client_gossip_batch(iface):
+    class Handler(DefaultHandler):
+        batches = []
+
+        def on_batch(self, client, messages):
+            self.batches.append([e for e in messages if isinstance(e, Shout)])
+
+    h = Handler()
+
+    c1 = Client(gossip_bind='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c1.ipc', handler=h)
+    c1.start_zyre()
+
+    c2 = Client(gossip_connect='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c2.ipc')
+    c2.start_zyre()
+
+    sleep(1)
+
+    for i in range(100):
+        c2.shout('ZYRE', 'TEST%d' % i)
+
+    sleep(1)
+
+    c1.handle_messages(c1.actor, zmq.POLLIN)
+
+    c1.stop_zyre()
+    c2.stop_zyre()
+
+    assert sum(len(b) for b in h.batches) == 100
+
+    # cleanup
+    sleep(1)
+
+
+def test_client_send_file(iface, tmpdir):
+    class Handler(DefaultHandler):
+        files = []
+
+        def accept_file(self, client, transfer):
+            return True
+
+        def on_file(self, client, transfer):
+            self.files.append(transfer)
+
+        on_file_sent = on_file
+
+    src = tmpdir.mkdir('src').join('bundle.bin')
+    data = os.urandom(1024 * 1024 + 7)
+    src.write_binary(data)
+
+    dst = tmpdir.mkdir('dst')
+
+    h1 = Handler()
+    h2 = Handler()
+
+    c1 = Client(gossip_bind='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c1.ipc', handler=h1, name='c1',
+                files_path=str(dst), file_chunk_size=65536, file_window=4)
+    c1.start_zyre()
+
+    c2 = Client(gossip_connect='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c2.ipc', handler=h2)
+    c2.start_zyre()
+
+    sleep(1)
+
+    c2.handle_messages(c2.actor, zmq.POLLIN)
+    c2.send_file('c1', str(src))
+
+    for _ in range(100):
+        for c in (c1, c2):
+            if c.actor.poll(50):
+                c.handle_messages(c.actor, zmq.POLLIN)
+
+        if h1.files and h2.files:
+            break
+
+    c1.stop_zyre()
+    c2.stop_zyre()
+
+    assert h1.files[0].error is None
+    assert dst.join('bundle.bin').read_binary() == data
+
+    # cleanup
+    sleep(1)
+
+
+def test_client_whisper_credit(iface):
+    class Handler(DefaultHandler):
+        messages = []
+        stalls = []
+
+        def on_whisper(self, client, event):
+            self.messages.append(event.payload_bytes)
+
+        def on_stall(self, client, event):
+            self.stalls.append(event.name)
+
+    h = Handler()
+
+    c1 = Client(gossip_bind='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c1.ipc', handler=h, name='c1', credit=4)
+    c1.start_zyre()
+
+    c2 = Client(gossip_connect='ipc:///tmp/gossip.ipc', endpoint='ipc:///tmp/c2.ipc', handler=h)
+    c2.start_zyre()
+
+    sleep(1)
+
+    c2.handle_messages(c2.actor, zmq.POLLIN)
+
+    sent = 0
+    for _ in range(200):
+        try:
+            while sent < 50:
+                c2.whisper('TEST%d' % sent, 'c1')
+                sent += 1
+        except zmq.Again:
+            pass
+
+        for c in (c1, c2):
+            if c.actor.poll(10):
+                c.handle_messages(c.actor, zmq.POLLIN)
+
+        if len(h.messages) == 50:
+            break
+
+    c1.stop_zyre()
+    c2.stop_zyre()
+
+    assert h.stalls
+    assert [m[0] for m in h.messages] == [('TEST%d' % i).encode('utf-8') for i in range(50)]
+
+    # cleanup
+    sleep(1)
@@ -0,0 +1,42 @@
+import os
+
+from pyzyre.client.dedup import DedupFilter, message_key
+from pyzyre.constants import ID_MARK
+
+from . import frames
+
+
+def test_dedup_window():
+    f = DedupFilter(60, bits=1 << 16)
+
+    assert not f.seen(b'a', now=0)
+    assert f.seen(b'a', now=1)
+    assert not f.seen(b'b', now=1)
+    assert f.seen(b'a', now=59)
+
+    # a whole window later everything's forgotten
+    assert not f.seen(b'a', now=200)
+    assert f.suppressed == 2
+    assert f.checked == 5
+
+    assert not f.seen(None)
+
+
+def test_dedup_false_positives():
+    f = DedupFilter(60, bits=1 << 16)
+
+    keys = [os.urandom(16) for _ in range(2000)]
+    assert sum(f.seen(k, now=0) for k in keys) < 5
+    assert all(f.seen(k, now=1) for k in keys)
+
+
+def test_dedup_message_key():
+    id = ID_MARK + os.urandom(16)
+
+    assert message_key(frames(b'SHOUT', b'U', b'n', b'G', id, b'x')) == id
+    assert message_key(frames(b'SHOUT', b'U', b'n', b'G', b'x')) is None
+
+    seq = b'\x00' * 7 + b'\x01'
+    shout = message_key(frames(b'SHOUT', b'U', b'n', b'G', b'$$SEQ', seq, b'x'))
+    resend = message_key(frames(b'WHISPER', b'U', b'n', b'$$RESEND', b'G', seq, b'x'))
+    assert shout == resend == b'UG' + seq
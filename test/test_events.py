@@ -0,0 +1,33 @@
+from pyzyre.client.events import EVENTS, Shout, Whisper, Join
+
+from . import frames
+
+
+def test_events_shout():
+    e = EVENTS[b'SHOUT'](frames(b'SHOUT', b'ABCD', b'node1', b'ZYRE', b'HEADER', b'\x00BODY'))
+    assert isinstance(e, Shout)
+    assert e.uuid == 'ABCD'
+    assert e.name == 'node1'
+    assert e.group == 'ZYRE'
+    assert e.group_bytes == b'ZYRE'
+    assert e.size == 11
+    assert e.payload_bytes == [b'HEADER', b'\x00BODY']
+    assert [bytes(f) for f in e.payload] == [b'HEADER', b'\x00BODY']
+
+
+def test_events_whisper():
+    e = Whisper(frames(b'WHISPER', b'ABCD', b'node1', b'TEST'))
+    assert e.name == 'node1'
+    assert e.payload_bytes == [b'TEST']
+
+
+def test_events_slots():
+    e = Join(frames(b'JOIN', b'ABCD', b'node1', b'ZYRE'))
+    assert e.group == 'ZYRE'
+
+    try:
+        e.foo = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('events should not have a __dict__')
@@ -0,0 +1,194 @@
+from argparse import Namespace
+
+import zmq
+
+from pyzyre import gateway
+from pyzyre.gateway import SubscriptionIndex, RecentIds, Router, ingress, published, is_id, new_id, drain, \
+    xpub_command, is_pull_request
+from pyzyre.utils.hashring import HashRing
+
+
+def test_gateway_index_subscribers():
+    i = SubscriptionIndex(ttl=10, pinned=[b'ZYRE'])
+
+    assert b'ZYRE' in i
+    assert not i.subscribe(b'ZYRE')
+
+    assert i.subscribe(b'TEST')
+    assert not i.subscribe(b'TEST')
+    assert not i.unsubscribe(b'TEST')
+    assert i.unsubscribe(b'TEST')
+    assert b'TEST' not in i
+
+    assert not i.unsubscribe(b'ZYRE')
+    assert b'ZYRE' in i
+
+
+def test_gateway_index_expiry():
+    i = SubscriptionIndex(ttl=10)
+
+    assert i.refresh(b'TEST', now=100)
+    assert not i.refresh(b'TEST', now=105)
+    assert i.expire(now=110) == []
+    assert i.expire(now=115) == [b'TEST']
+    assert b'TEST' not in i
+
+    # a live XPUB subscriber keeps the group joined after its SUB expires
+    i.refresh(b'TEST', now=200)
+    i.subscribe(b'TEST')
+    assert i.expire(now=300) == []
+    assert b'TEST' in i
+    assert i.unsubscribe(b'TEST')
+
+
+def test_gateway_recent_ids():
+    seen = RecentIds(size=2)
+
+    assert not seen.seen(b'a')
+    assert seen.seen(b'a')
+    assert not seen.seen(b'b')
+    assert not seen.seen(b'c')
+
+    # the oldest id is forgotten
+    assert len(seen) == 2
+    assert not seen.seen(b'a')
+
+
+def test_gateway_ingress():
+    seen = RecentIds()
+
+    # ids are only put on the mesh when asked for
+    assert ingress([b'PUB', b'TEST', b'hello'], seen) == [b'PUB', b'TEST', b'hello']
+    assert published([b'PUB', b'TEST', b'hello']) == [b'TEST', b'hello']
+
+    req = ingress([b'PUB', b'TEST', b'hello'], seen, mesh_ids=True)
+    assert is_id(req[2])
+    assert published(req) == [b'TEST', b'hello']
+    assert published(req, pub_ids=True) == [b'TEST', req[2], b'hello']
+
+    # the same message bridged back in from another gateway's PUB is dropped
+    assert ingress([b'PUB', b'TEST', req[2], b'hello'], seen) is None
+
+
+def test_gateway_index_no_expiry():
+    i = SubscriptionIndex(ttl=0)
+
+    # by default a SUB is good for as long as the gateway runs
+    assert i.refresh(b'TEST', now=100)
+    assert i.expire(now=10 ** 9) == []
+    assert b'TEST' in i
+
+
+def test_gateway_drain_rearms():
+    class Socket(object):
+        def __init__(self, n):
+            self.messages = [[b'%d' % i] for i in range(n)]
+
+        def recv_multipart(self, flags=0):
+            if not self.messages:
+                raise zmq.Again()
+
+            return self.messages.pop(0)
+
+    class Loop(object):
+        callbacks = []
+
+        def add_callback(self, fn, *args):
+            self.callbacks.append((fn, args))
+
+    s, loop, got = Socket(5), Loop(), []
+
+    # a burst bigger than the batch is finished off by the callbacks, no new traffic needed
+    drain(s, 2, got.append, loop)
+    while loop.callbacks:
+        fn, args = loop.callbacks.pop(0)
+        fn(*args)
+
+    assert got == [[b'%d' % i] for i in range(5)]
+
+
+class Socket(object):
+    def __init__(self):
+        self.sent = []
+
+    def send_multipart(self, m, copy=True):
+        self.sent.append(m)
+
+
+def test_gateway_router():
+    pub, workers = Socket(), [Socket() for _ in range(3)]
+    r = Router(pub, workers, RecentIds())
+
+    # the same ring the workers pick their groups with
+    ring = HashRing(range(3))
+    groups = [b'GROUP%d' % i for i in range(20)]
+
+    for g in groups:
+        r.route([b'SUB', g])
+        r.route(xpub_command(b'\x01' + g))
+
+    for i, w in enumerate(workers):
+        owned = [g for g in groups if ring.get(g) == i]
+        assert w.sent == [m for g in owned for m in ([b'SUB', g], [b'$$XSUB', g])]
+
+    # published straight away, the owner shouts it
+    r.route([b'PUB', b'GROUP1', b'hello'])
+    assert pub.sent == [[b'GROUP1', b'hello']]
+    assert workers[ring.get(b'GROUP1')].sent[-1] == [b'PUB', b'GROUP1', b'hello']
+
+    # no group, nowhere to send it
+    r.route([b'PUB', b'', b'hello'])
+    assert len(pub.sent) == 1
+
+
+def test_gateway_pull_requests():
+    assert is_pull_request([b'PUB', b'TEST', b'hello'])
+    assert is_pull_request([b'SUB', b'TEST'])
+    assert not is_pull_request([b'PUB', b''])
+    assert not is_pull_request([b'PUB'])
+
+    # subscriber counts are only changed from our own XPUB socket
+    workers = [Socket()]
+    r = Router(Socket(), workers)
+    for m in ([b'$$XSUB', b'TEST'], [b'$$XUNSUB', b'TEST']):
+        assert not is_pull_request(m)
+        r.pull(m)
+
+    assert workers[0].sent == []
+
+
+def test_gateway_router_merge():
+    pub = Socket()
+    r = Router(pub, [Socket(), Socket()], RecentIds())
+
+    # workers always pass the id back, it's stripped unless --pub-ids
+    id = new_id()
+    r.merge([b'TEST', id, b'hello'])
+    r.merge([b'TEST', b'no id'])
+    assert pub.sent == [[b'TEST', b'hello'], [b'TEST', b'no id']]
+
+    # heard again from another worker, or already published from PULL
+    r.merge([b'TEST', id, b'hello'])
+    req = ingress([b'PUB', b'TEST', b'again'], r.seen, mesh_ids=True)
+    r.merge([b'TEST', req[2], b'again'])
+    assert len(pub.sent) == 2
+
+    pub.sent = []
+    Router(pub, [Socket()], pub_ids=True).merge([b'TEST', id, b'hello'])
+    assert pub.sent == [[b'TEST', id, b'hello']]
+
+
+def test_gateway_worker_args(monkeypatch):
+    monkeypatch.setattr(gateway, 'resolve_endpoint', lambda e, port: e if e.count(':') > 1 else '%s:%s' % (e, port))
+
+    args = Namespace(name='gw', group='A,B,C', workers=3, gossip_bind='tcp://*:49154', gossip_connect=None,
+                     endpoint='tcp://192.168.1.2')
+
+    kwargs = [gateway._worker_args(args, i, ['A']) for i in range(3)]
+
+    # worker 0 binds gossip, the rest connect to it. they each get their own name and service endpoint
+    assert kwargs[0]['gossip_bind'] == 'tcp://*:49154'
+    assert [k['gossip_connect'] for k in kwargs[1:]] == ['tcp://127.0.0.1:49154'] * 2
+    assert [k['name'] for k in kwargs] == ['gw-0', 'gw-1', 'gw-2']
+    assert len(set(k['endpoint'] for k in kwargs)) == 3
+    assert kwargs[0]['group'] == 'A'
@@ -0,0 +1,25 @@
+from pyzyre.utils.hashring import HashRing
+
+
+def test_hashring_stable():
+    r1 = HashRing(range(4))
+    r2 = HashRing(range(4))
+
+    groups = ['GROUP%d' % i for i in range(1000)]
+    assert [r1.get(g) for g in groups] == [r2.get(g) for g in groups]
+    assert r1.get('ZYRE') == r1.get(b'ZYRE')
+
+    # every worker gets a share
+    assert set(r1.get(g) for g in groups) == set(range(4))
+
+
+def test_hashring_moves():
+    r4 = HashRing(range(4))
+    r5 = HashRing(range(5))
+
+    groups = ['GROUP%d' % i for i in range(1000)]
+    moved = [g for g in groups if r4.get(g) != r5.get(g)]
+
+    # only the keys the new node takes over move
+    assert all(r5.get(g) == 4 for g in moved)
+    assert len(moved) < 400
@@ -0,0 +1,58 @@
+from pyzyre.client.events import Shout, Join, Enter
+from pyzyre.client.legacy import LegacyHandler, is_legacy
+from pyzyre.constants import DefaultHandler
+
+from . import frames
+
+
+class OldHandler(object):
+    def __init__(self):
+        self.calls = []
+
+    def on_shout(self, client, group, peer, address, message):
+        self.calls.append(('shout', group, peer, address, message))
+
+    def on_join(self, client, peer, group):
+        self.calls.append(('join', peer, group))
+
+    def on_enter(self, client, peer):
+        self.calls.append(('enter', peer))
+
+
+def test_legacy_detect():
+    assert is_legacy(OldHandler())
+    assert not is_legacy(DefaultHandler())
+
+
+def test_legacy_calls():
+    old = OldHandler()
+    h = LegacyHandler(old)
+
+    h.on_shout(None, Shout(frames(b'SHOUT', b'UUID', b'name', b'GROUP', b'hello')))
+    h.on_join(None, Join(frames(b'JOIN', b'UUID', b'name', b'GROUP')))
+    h.on_enter(None, Enter(frames(b'ENTER', b'UUID', b'name', b'tcp://1.2.3.4:5')))
+
+    assert old.calls == [
+        ('shout', b'GROUP', b'name', b'UUID', b'hello'),
+        ('join', b'name', b'GROUP'),
+        ('enter', [b'UUID', b'name']),
+    ]
+
+
+def test_legacy_client():
+    from pyzyre.client import Client
+    from pyzyre.client.events import Stall
+
+    old = OldHandler()
+    c = Client(handler=old, name='test', reliable=False, dedup=0)
+    assert isinstance(c.handler, LegacyHandler)
+
+    # events the old handler never had are ignored
+    event, h = c._events[b'STALL']
+    h(c, Stall(frames(b'STALL', b'UUID', b'name')))
+    c.handler.on_file(c, None)
+    c.handler.on_file_sent(c, None)
+
+    event, h = c._events[b'SHOUT']
+    h(c, event(frames(b'SHOUT', b'UUID', b'name', b'GROUP', b'hello')))
+    assert old.calls == [('shout', b'GROUP', b'name', b'UUID', b'hello')]
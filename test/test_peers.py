@@ -0,0 +1,48 @@
+from pyzyre.client.peers import PeerDirectory
+
+
+def test_peers_directory():
+    d = PeerDirectory()
+    d.enter('A', 'node', 'tcp://127.0.0.1:1', {'X-ROLE': 'broker'})
+    d.enter('B', 'node', 'tcp://127.0.0.1:2')
+
+    assert len(d) == 2
+    assert d.get('A').headers['X-ROLE'] == 'broker'
+
+    # names collide, the last one in wins
+    assert d.named('node').uuid == 'B'
+
+    d.join('A', 'ZYRE')
+    d.join('B', 'ZYRE')
+    d.join('B', 'TEST')
+
+    assert sorted(p.uuid for p in d.in_group('ZYRE')) == ['A', 'B']
+
+    d.leave('B', 'ZYRE')
+    assert [p.uuid for p in d.in_group('ZYRE')] == ['A']
+
+    assert d.exit('B').name == 'node'
+    assert d.named('node').uuid == 'A'
+    assert d.in_group('TEST') == []
+    assert 'B' not in d
+
+    assert d.exit('B') is None
+    assert d.join('B', 'ZYRE') is None
+
+
+def test_peers_resolve():
+    d = PeerDirectory()
+    d.enter(b'0F1E2D3C4B5A69788796A5B4C3D2E1F0', b'node')
+
+    assert d.resolve(b'node') == b'0F1E2D3C4B5A69788796A5B4C3D2E1F0'
+    assert d.resolve(b'0f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0') == b'0F1E2D3C4B5A69788796A5B4C3D2E1F0'
+    assert b'0f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0' in d.ids
+    assert d.resolve(b'nobody') is None
+
+    # a newer peer takes over the name
+    d.enter(b'00000000000000000000000000000001', b'node')
+    assert d.resolve(b'node') == b'00000000000000000000000000000001'
+
+    d.exit(b'0F1E2D3C4B5A69788796A5B4C3D2E1F0')
+    assert b'0f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0' not in d.ids
+    assert d.resolve(b'0f1e2d3c-4b5a-6978-8796-a5b4c3d2e1f0') is None
@@ -0,0 +1,101 @@
+from pyzyre.queues import Queue, Queues, QUEUE, queue_group, delivery, ack_request
+
+
+def _ids(out):
+    return [(w, f[2]) for w, f in out]
+
+
+def test_queue_least_outstanding():
+    q = Queue(b'work', prefetch=2, ack_timeout=10)
+
+    q.join('a', now=0)
+    q.join('b', now=0)
+
+    out = []
+    for i in range(5):
+        out += q.push([b'%d' % i], now=0)
+
+    # one each, then the second round, then everyone is full
+    assert _ids(out) == [('a', b'1'), ('b', b'2'), ('a', b'3'), ('b', b'4')]
+    assert out[0][1] == [QUEUE, b'work', b'1', b'0']
+    assert len(q.pending) == 1
+
+    # b frees up first and gets the next one
+    assert _ids(q.ack('b', b'2', now=1)) == [('b', b'5')]
+
+    # acks from the wrong worker or for unknown ids don't do anything
+    assert q.ack('a', b'4', now=1) == []
+    assert q.ack('a', b'99', now=1) == []
+
+
+def test_queue_redelivery():
+    q = Queue(b'work', prefetch=1, ack_timeout=10)
+
+    q.join('a', now=0)
+    q.push([b'x'], now=0)
+    q.push([b'y'], now=0)
+    assert _ids(q.join('b', now=1)) == [('b', b'2')]
+
+    # a goes away with x outstanding, it's first in line once b is done with y
+    assert q.leave('a', now=2) == []
+    assert q.redelivered == 1
+    assert _ids(q.ack('b', b'2', now=3)) == [('b', b'1')]
+
+    # b never acks x, it goes out again once it's overdue
+    assert q.expire(now=5) == []
+    assert _ids(q.expire(now=13)) == [('b', b'1')]
+
+    assert q.ack('b', b'1', now=14) == []
+    assert not len(q)
+
+
+def test_queues():
+    qs = Queues(prefetch=1)
+
+    assert qs.join('a', b'other') == (None, [])
+
+    name, out = qs.join('a', queue_group('work'))
+    assert name == b'work' and out == []
+    assert b'work' in qs
+
+    _, frames = qs.push(b'work', [b'hello'])[0]
+    assert delivery(frames) == (b'work', b'1', [b'hello'])
+    assert delivery([b'hello']) is None
+
+    assert qs.exit('a') == []
+    assert qs.get(b'work').pending[0] == (b'1', [b'hello'])
+
+    qs.join('b', queue_group('work'))
+    assert qs.ack('b', *ack_request('work', b'1')[1:]) == []
+    assert not len(qs.get(b'work'))
+
+
+def test_queue_evasive():
+    q = Queue(b'work', prefetch=1, ack_timeout=10)
+
+    q.join('a', now=1)
+    q.join('b', now=1)
+    q.push([b'x'], now=1)
+    q.push([b'y'], now=1)
+
+    # a hiccups, x goes to b once it's free and a is passed over until it's heard from
+    assert q.evade('a', now=2) == []
+    assert 'a' in q.workers
+    assert _ids(q.ack('b', b'2', now=3)) == [('b', b'1')]
+    assert q.push([b'z'], now=3) == []
+
+    # its late ack for x brings it back, and it's given work again
+    assert _ids(q.ack('a', b'1', now=4)) == [('a', b'3')]
+    assert _ids(q.ack('a', b'3', now=5)) == []
+    assert _ids(q.push([b'w'], now=5)) == [('a', b'4')]
+
+
+def test_queue_evasive_timeout():
+    q = Queue(b'work', prefetch=1, ack_timeout=10)
+
+    q.join('a', now=1)
+    q.evade('a', now=1)
+    assert q.push([b'x'], now=2) == []
+
+    # nothing heard from it, it gets work again once ack_timeout has passed
+    assert _ids(q.expire(now=12)) == [('a', b'1')]
@@ -0,0 +1,111 @@
+from pyzyre.client.reliable import Reliable, SEQ, NACK, RESEND, LOST
+
+from . import frames
+
+
+class Actor(object):
+    def __init__(self):
+        self.sent = []
+
+    def send_multipart(self, m, copy=True):
+        self.sent.append(m)
+
+
+class Client(object):
+    def __init__(self):
+        self.actor = Actor()
+
+    def _send(self, m):
+        self.actor.send_multipart(m)
+
+
+def _whisper(sent, uuid, name):
+    # what the other side's actor would hand its client for a whisper we sent
+    return frames(b'WHISPER', uuid, name, *sent[2:])
+
+
+def test_reliable_gap_repair():
+    sender, receiver = Reliable(Client(), 4), Reliable(Client(), 4)
+
+    shouts = [sender.stamp(b'TEST', [b'%d' % i]) for i in range(5)]
+    assert shouts[0][0] == SEQ
+
+    got = []
+    for i in (0, 1, 4):
+        e = receiver.received(frames(b'SHOUT', b'S', b's', b'TEST', *shouts[i]))
+        got.append(e.payload_bytes)
+
+    # 2 and 3 are missing
+    nack = receiver.client.actor.sent[-1]
+    assert nack[2] == NACK
+
+    sender.on_nack(_whisper(nack, b'R', b'r'))
+    resent = sender.client.actor.sent
+    assert [f[2] for f in resent] == [RESEND, RESEND]
+
+    for f in resent:
+        e = receiver.handle(_whisper(f, b'S', b's'))
+        got.append(e.payload_bytes)
+
+    assert got == [[b'0'], [b'1'], [b'4'], [b'2'], [b'3']]
+
+    # a second copy is dropped
+    assert receiver.handle(_whisper(resent[0], b'S', b's')) is None
+    assert receiver.duplicates == 1
+
+
+def test_reliable_lost():
+    sender, receiver = Reliable(Client(), 3), Reliable(Client(), 3)
+
+    shouts = [sender.stamp(b'TEST', [b'%d' % i]) for i in range(5)]
+
+    receiver.received(frames(b'SHOUT', b'S', b's', b'TEST', *shouts[0]))
+    receiver.received(frames(b'SHOUT', b'S', b's', b'TEST', *shouts[3]))
+
+    # 1 and 2 went missing, the sender only has 2, 3 and 4 left
+    sender.on_nack(_whisper(receiver.client.actor.sent[-1], b'R', b'r'))
+    assert [f[2] for f in sender.client.actor.sent] == [LOST, RESEND]
+
+    for f in sender.client.actor.sent:
+        receiver.handle(_whisper(f, b'S', b's'))
+
+    assert receiver.lost == 1
+    assert not receiver.streams[('S', b'TEST')].missing
+
+
+def test_reliable_empty_resend():
+    from pyzyre.client import Client as ZyreClient
+    from pyzyre.constants import DefaultHandler
+
+    class Handler(DefaultHandler):
+        def __init__(self):
+            self.shouts = []
+            self.whispers = []
+
+        def on_shout(self, client, e):
+            self.shouts.append(e.payload_bytes)
+
+        def on_whisper(self, client, e):
+            self.whispers.append(e.payload_bytes)
+
+    h = Handler()
+    c = ZyreClient(handler=h, name='test', reliable=True, dedup=0)
+    c.actor = Actor()
+
+    sender = Reliable(Client(), 4)
+    shouts = [sender.stamp(b'TEST', []) for _ in range(3)]
+
+    for i in (0, 2):
+        m = frames(b'SHOUT', b'S', b's', b'TEST', *shouts[i])
+        event, fn = c._events[b'SHOUT']
+        fn(c, event(m))
+
+    # a SHOUT with no payload comes back as a 6 frame RESEND
+    sender.on_nack(_whisper(c.actor.sent[-1], b'R', b'r'))
+    m = _whisper(sender.client.actor.sent[-1], b'S', b's')
+    assert len(m) == 6
+
+    e = c._whisper(m)
+    assert e.type == b'SHOUT'
+    assert e.payload_bytes == []
+    assert not h.whispers
@@ -0,0 +1,162 @@
+import os
+
+from pyzyre.store import Store, Log
+
+
+def test_store_append_read(tmpdir):
+    s = Store(str(tmpdir))
+
+    for i in range(10):
+        assert s.append(b'TEST', [b'HEADER', memoryview(b'BODY%d' % i)]) == i
+
+    log = s.log(b'TEST')
+    assert [o for o, _, _ in log.last(3)] == [7, 8, 9]
+    assert [f for _, _, f in log.read(5, 1)] == [[b'HEADER', b'BODY5']]
+
+    s.close()
+
+
+def test_store_segments(tmpdir):
+    log = Log(str(tmpdir), segment_bytes=100)
+
+    for i in range(20):
+        log.append([b'x' * 20])
+
+    assert len(log.segments) > 1
+    assert [o for o, _, _ in log.read()] == list(range(20))
+
+    log.close()
+
+
+def test_store_recovery(tmpdir):
+    s = Store(str(tmpdir))
+    for i in range(5):
+        s.append(b'TEST', [b'%d' % i])
+    s.close()
+
+    # a record torn in half by a crash is dropped when the log is reopened
+    d = tmpdir.join(os.listdir(str(tmpdir))[0])
+    seg = d.join(os.listdir(str(d))[0])
+    with open(str(seg), 'ab') as f:
+        f.write(b'\x00\x00\x00\x10\x00')
+
+    s = Store(str(tmpdir))
+    log = s.log(b'TEST')
+    assert log.next == 5
+    assert log.append([b'5']) == 5
+    assert [f[0] for _, _, f in log.read()] == [b'%d' % i for i in range(6)]
+
+    s.close()
+
+
+def test_store_retain(tmpdir):
+    log = Log(str(tmpdir), segment_bytes=100)
+
+    for i in range(20):
+        log.append([b'x' * 20], ts=1000 + i)
+
+    segments = len(log.segments)
+
+    # nothing is old enough
+    assert log.retain(max_age=100, now=1050) == 0
+
+    dropped = log.retain(max_age=100, now=1110)
+    assert dropped
+    assert len(log.segments) < segments
+
+    # whole segments go, the first one left still has something new enough in it
+    assert log.start > 0
+    assert log.read(limit=1)[0][0] == log.start
+    assert log.segments[0].timestamps[-1] >= 1010
+
+    log.retain(max_bytes=150)
+    assert log.size <= 150 or len(log.segments) == 1
+
+    # offsets carry on where they left off
+    assert log.append([b'y']) == 20
+
+    log.close()
+
+
+def test_store_compact(tmpdir):
+    log = Log(str(tmpdir), segment_bytes=100)
+
+    for i in range(30):
+        log.append([b'key%d' % (i % 3), b'%d' % i])
+
+    assert log.compact(0) == 27
+
+    # only the newest record for each key is left, even when it's in the segment being written to
+    assert [o for o, _, _ in log.read()] == [27, 28, 29]
+    assert len(log) == 3
+
+    latest = dict((f[0], f[1]) for _, _, f in log.read())
+    assert latest == {b'key0': b'27', b'key1': b'28', b'key2': b'29'}
+    assert [o for o, _, _ in log.last(2)] == [28, 29]
+
+    # compacted segments survive a reopen
+    log.close()
+    log = Log(str(tmpdir), segment_bytes=100)
+    assert dict((f[0], f[1]) for _, _, f in log.read()) == latest
+    assert log.next == 30
+
+    log.close()
+
+
+def test_store_policy():
+    from pyzyre.store import Policy, parse_policy
+
+    group, p = parse_policy('TEST:max_age=60,key=0', Policy(max_bytes=1024))
+    assert group == b'TEST'
+    assert (p.max_age, p.max_bytes, p.key) == (60, 1024, 0)
+
+
+def test_store_sealed(tmpdir):
+    log = Log(str(tmpdir), segment_bytes=100)
+
+    # mapped while it's still being written to, then rolled
+    log.append([b'x' * 20])
+    log.read()
+    for _ in range(5):
+        log.append([b'x' * 20])
+
+    s = log.segments[0]
+    assert len(log.segments) > 1
+    assert len(s._mm) == s.size
+
+    log.close()
+
+
+def test_store_sync(tmpdir, monkeypatch):
+    synced = []
+    fsync = os.fsync
+    monkeypatch.setattr(os, 'fsync', lambda fd: synced.append(fd) or fsync(fd))
+
+    s = Store(str(tmpdir))
+    s.append(b'A', [b'x'])
+    s.log(b'B')
+
+    s.sync()
+    assert len(synced) == 1
+
+    # nothing new
+    s.sync()
+    assert len(synced) == 1
+
+    s.close()
+
+
+def test_store_no_uint64_array(tmpdir, monkeypatch):
+    from pyzyre.store import segment
+
+    # python 2 on windows, no 8 byte array type
+    monkeypatch.setattr(segment, '_UINT64', None)
+
+    log = Log(str(tmpdir), segment_bytes=100)
+    for i in range(10):
+        log.append([b'x' * 20])
+
+    assert isinstance(log.segments[0].offsets, list)
+    assert [o for o, _, _ in log.read(4, 2)] == [4, 5]
+
+    log.close()
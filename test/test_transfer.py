@@ -0,0 +1,96 @@
+import os
+
+from pyzyre.client.transfer import Transfers, XFER
+from pyzyre.constants import DefaultHandler
+
+from . import frames
+
+
+class Handler(DefaultHandler):
+    def __init__(self, accept=True):
+        self.accept = accept
+        self.files = []
+
+    def accept_file(self, client, transfer):
+        return self.accept
+
+    def on_file(self, client, transfer):
+        self.files.append(transfer)
+
+
+class Client(object):
+    def __init__(self, handler):
+        self.handler = handler
+        self.sent = []
+
+    def _send(self, m):
+        self.sent.append(m)
+
+
+def _offer(t, id, name, size, chunk_size, peer='PEER'):
+    t.on_offer(peer, id, frames(name, size, chunk_size))
+    return t.client.sent[-1] if t.client.sent else None
+
+
+def test_transfer_receive(tmpdir):
+    t = Transfers(Client(Handler()), str(tmpdir), 4, 4)
+
+    assert _offer(t, b'1', b'a.bin', b'6', b'4')[3:5] == [b'CREDIT', b'1']
+
+    # a repeated offer is ignored
+    _offer(t, b'1', b'a.bin', b'6', b'4')
+    assert len(t.client.sent) == 1
+
+    t.on_chunk('PEER', b'1', frames(b'0', b'abcd'))
+    t.on_chunk('PEER', b'1', frames(b'4', b'ef'))
+
+    assert t.client.sent[-1][3:5] == [b'DONE', b'1']
+    assert tmpdir.join('a.bin').read_binary() == b'abcdef'
+    assert not tmpdir.join('a.bin.part').exists()
+
+
+def test_transfer_rejected(tmpdir):
+    # offers are turned down unless the handler accepts them
+    t = Transfers(Client(DefaultHandler()), str(tmpdir), 4, 4)
+    assert _offer(t, b'1', b'a.bin', b'6', b'4')[3:] == [b'ABORT', b'1', b'rejected']
+
+    t = Transfers(Client(Handler()), str(tmpdir), 4, 4)
+    for size, chunk_size in ((b'x', b'4'), (b'6', b'0'), (b'-1', b'4'), (b'6', b'-4')):
+        assert _offer(t, b'2', b'a.bin', size, chunk_size)[3:] == [b'ABORT', b'2', b'bad offer']
+
+    assert not t.incoming
+    assert not os.listdir(str(tmpdir))
+
+
+def test_transfer_no_overwrite(tmpdir):
+    tmpdir.join('a.bin').write_binary(b'mine')
+
+    t = Transfers(Client(Handler()), str(tmpdir), 4, 4)
+    assert _offer(t, b'1', b'a.bin', b'6', b'4')[3:] == [b'ABORT', b'1', b'exists']
+
+    # turns up while it's being received
+    _offer(t, b'2', b'b.bin', b'2', b'4')
+    tmpdir.join('b.bin').write_binary(b'mine')
+    t.on_chunk('PEER', b'2', frames(b'0', b'ab'))
+
+    assert t.client.sent[-1][3] == b'ABORT'
+    assert t.client.handler.files[0].error
+    assert tmpdir.join('b.bin').read_binary() == b'mine'
+    assert not tmpdir.join('b.bin.part').exists()
+
+
+def test_transfer_credit_peer(tmpdir):
+    t = Transfers(Client(Handler()), str(tmpdir), 4, 4)
+
+    class Outgoing(object):
+        peer = 'PEER'
+        credit = 0
+        offset = size = 0
+
+    t.outgoing[b'1'] = o = Outgoing()
+    t.on_credit('OTHER', b'1', frames(b'4'))
+    t.on_credit('PEER', b'1', frames(b'x'))
+    assert o.credit == 0
+
+    t.on_credit('PEER', b'1', frames(b'4'))
+    assert o.credit == 4
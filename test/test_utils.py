@@ -31,3 +31,20 @@ def test_resolve_interface(iface):
 def test_resolve_endpoint():
     e = resolve_endpoint('*', port=5432)
     assert e
+
+
+def test_socket_options():
+    import zmq
+    from pyzyre.utils import socket_options, setup_socket
+
+    o = socket_options({'sndhwm': '10', 'rcvhwm': 0, 'sndtimeo': None})
+    assert o['sndhwm'] == 10
+    assert o['rcvhwm'] == 0
+
+    ctx = zmq.Context()
+    s = setup_socket(ctx.socket(zmq.PUSH), o)
+    assert s.getsockopt(zmq.SNDHWM) == 10
+    assert s.getsockopt(zmq.RCVHWM) == 0
+
+    s.close()
+    ctx.term()
@@ -0,0 +1,45 @@
+import os
+
+from pyzyre import zpipe
+from pyzyre.zpipe import batches, delimiter
+
+
+def _pipe(data):
+    r, w = os.pipe()
+    os.write(w, data)
+    os.close(w)
+    return r
+
+
+def test_zpipe_batches_lines():
+    fd = _pipe(b'one\ntwo\n\nthree\nfour')
+    records = [r for b in batches(fd, b'\n', 1) for r in b]
+    os.close(fd)
+
+    assert records == [b'one', b'two', b'three', b'four']
+
+
+def test_zpipe_batches_size():
+    fd = _pipe(b'\0'.join(str(i).encode('utf-8') for i in range(10)))
+    b = list(batches(fd, delimiter('\\0'), 4))
+    os.close(fd)
+
+    assert [len(x) for x in b] == [4, 4, 2]
+    assert b[-1] == [b'8', b'9']
+
+
+def test_zpipe_delimiter():
+    assert delimiter('\\n') == b'\n'
+    assert delimiter('\\r\\n') == b'\r\n'
+    assert delimiter('|') == b'|'
+
+
+def test_zpipe_batches_split_delimiter(monkeypatch):
+    # records and delimiters spanning reads
+    monkeypatch.setattr(zpipe, 'READ_SIZE', 3)
+
+    fd = _pipe(b'a' * 10 + b'\r\n' + b'bb\r\ncc')
+    records = [r for b in batches(fd, b'\r\n', 10) for r in b]
+    os.close(fd)
+
+    assert records == [b'a' * 10, b'bb', b'cc']
@@ -8,12 +8,10 @@ import os, sys
 from ctypes import *
 from ctypes.util import find_library
 import czmq
+from czmq import _library
 
 # load libc to access free, etc.
-libcpath = find_library("c")
-if not libcpath:
-    raise ImportError("Unable to find libc")
-libc = cdll.LoadLibrary(libcpath)
+libc = _library.load_libc()
 libc.free.argtypes = [c_void_p]
 libc.free.restype = None
 
@@ -23,38 +21,22 @@ def return_fresh_string(char_p):
     return s
 
 # zyre
-lib = None
-# check to see if the shared object was embedded locally, attempt to load it
-# if not, try to load it using the default system paths...
-# we need to use os.chdir instead of trying to modify $LD_LIBRARY_PATH and reloading the interpreter
-t = os.getcwd()
-p = os.path.join(os.path.dirname(__file__), '..')  # find the path to our $project_ctypes.py
-os.chdir(p)  # change directories briefly
-
-try:
-    from zyre import libzyre                        # attempt to import the shared lib if it exists
-    lib = CDLL(libzyre.__file__)             # if it exists try to load the shared lib
-except ImportError:
-    pass
-finally:
-    os.chdir(t)  # switch back to orig dir
-
-if not lib:
-    try:
-        # If LD_LIBRARY_PATH or your OSs equivalent is set, this is the only way to
-        # load the library.  If we use find_library below, we get the wrong result.
-        if os.name == 'posix':
-            if sys.platform == 'darwin':
-                lib = cdll.LoadLibrary('libzyre.2.dylib')
-            else:
-                lib = cdll.LoadLibrary("libzyre.so.2")
-        elif os.name == 'nt':
-            lib = cdll.LoadLibrary('libzyre.dll')
-    except OSError:
-        libpath = find_library("zyre")
-        if not libpath:
-            raise ImportError("Unable to find libzyre")
-        lib = cdll.LoadLibrary(libpath)
+# use the shared object embedded next to this file if there is one, else the system library. the loader
+# never changes directory and caches the resolved path in $PYZYRE_LIBZYRE, see czmq/_library.py
+if os.name == 'posix':
+    if sys.platform == 'darwin':
+        _soname = 'libzyre.2.dylib'
+    else:
+        _soname = 'libzyre.so.2'
+else:
+    _soname = 'libzyre.dll'
+
+_czmq = os.path.dirname(os.path.abspath(czmq.__file__))
+lib = _library.load_library('zyre', _soname, 'PYZYRE_LIBZYRE', os.path.dirname(os.path.abspath(__file__)),
+                            depends=[_library.embedded(_czmq, 'zmq'), _library.embedded(_czmq, 'czmq')])
+
+# resolve function prototypes on first use, see _library.py
+lib = _library.LazyLibrary(lib)
 
 class zyre_t(Structure):
     pass # Empty - only for type checking
@@ -66,90 +48,48 @@ zyre_event_p = POINTER(zyre_event_t)
 
 
 # zyre
-lib.zyre_new.restype = zyre_p
-lib.zyre_new.argtypes = [c_char_p]
-lib.zyre_destroy.restype = None
-lib.zyre_destroy.argtypes = [POINTER(zyre_p)]
-lib.zyre_uuid.restype = c_char_p
-lib.zyre_uuid.argtypes = [zyre_p]
-lib.zyre_name.restype = c_char_p
-lib.zyre_name.argtypes = [zyre_p]
-lib.zyre_set_name.restype = None
-lib.zyre_set_name.argtypes = [zyre_p, c_char_p]
-lib.zyre_set_header.restype = None
-lib.zyre_set_header.argtypes = [zyre_p, c_char_p, c_char_p]
-lib.zyre_set_verbose.restype = None
-lib.zyre_set_verbose.argtypes = [zyre_p]
-lib.zyre_set_port.restype = None
-lib.zyre_set_port.argtypes = [zyre_p, c_int]
-lib.zyre_set_beacon_peer_port.restype = None
-lib.zyre_set_beacon_peer_port.argtypes = [zyre_p, c_int]
-lib.zyre_set_evasive_timeout.restype = None
-lib.zyre_set_evasive_timeout.argtypes = [zyre_p, c_int]
-lib.zyre_set_expired_timeout.restype = None
-lib.zyre_set_expired_timeout.argtypes = [zyre_p, c_int]
-lib.zyre_set_interval.restype = None
-lib.zyre_set_interval.argtypes = [zyre_p, c_size_t]
-lib.zyre_set_interface.restype = None
-lib.zyre_set_interface.argtypes = [zyre_p, c_char_p]
-lib.zyre_set_endpoint.restype = c_int
-lib.zyre_set_endpoint.argtypes = [zyre_p, c_char_p]
-lib.zyre_set_contest_in_group.restype = None
-lib.zyre_set_contest_in_group.argtypes = [zyre_p, c_char_p]
-lib.zyre_set_advertised_endpoint.restype = None
-lib.zyre_set_advertised_endpoint.argtypes = [zyre_p, c_char_p]
-lib.zyre_set_zcert.restype = None
-lib.zyre_set_zcert.argtypes = [zyre_p, czmq.zcert_p]
-lib.zyre_set_zap_domain.restype = None
-lib.zyre_set_zap_domain.argtypes = [zyre_p, c_char_p]
-lib.zyre_gossip_bind.restype = None
-lib.zyre_gossip_bind.argtypes = [zyre_p, c_char_p]
-lib.zyre_gossip_connect.restype = None
-lib.zyre_gossip_connect.argtypes = [zyre_p, c_char_p]
-lib.zyre_gossip_connect_curve.restype = None
-lib.zyre_gossip_connect_curve.argtypes = [zyre_p, c_char_p, c_char_p]
-lib.zyre_gossip_unpublish.restype = None
-lib.zyre_gossip_unpublish.argtypes = [zyre_p, c_char_p]
-lib.zyre_start.restype = c_int
-lib.zyre_start.argtypes = [zyre_p]
-lib.zyre_stop.restype = None
-lib.zyre_stop.argtypes = [zyre_p]
-lib.zyre_join.restype = c_int
-lib.zyre_join.argtypes = [zyre_p, c_char_p]
-lib.zyre_leave.restype = c_int
-lib.zyre_leave.argtypes = [zyre_p, c_char_p]
-lib.zyre_recv.restype = czmq.zmsg_p
-lib.zyre_recv.argtypes = [zyre_p]
-lib.zyre_whisper.restype = c_int
-lib.zyre_whisper.argtypes = [zyre_p, c_char_p, POINTER(czmq.zmsg_p)]
-lib.zyre_shout.restype = c_int
-lib.zyre_shout.argtypes = [zyre_p, c_char_p, POINTER(czmq.zmsg_p)]
-lib.zyre_whispers.restype = c_int
-lib.zyre_whispers.argtypes = [zyre_p, c_char_p, c_char_p]
-lib.zyre_shouts.restype = c_int
-lib.zyre_shouts.argtypes = [zyre_p, c_char_p, c_char_p]
-lib.zyre_peers.restype = czmq.zlist_p
-lib.zyre_peers.argtypes = [zyre_p]
-lib.zyre_peers_by_group.restype = czmq.zlist_p
-lib.zyre_peers_by_group.argtypes = [zyre_p, c_char_p]
-lib.zyre_own_groups.restype = czmq.zlist_p
-lib.zyre_own_groups.argtypes = [zyre_p]
-lib.zyre_peer_groups.restype = czmq.zlist_p
-lib.zyre_peer_groups.argtypes = [zyre_p]
-lib.zyre_peer_address.restype = POINTER(c_char)
-lib.zyre_peer_address.argtypes = [zyre_p, c_char_p]
-lib.zyre_peer_header_value.restype = POINTER(c_char)
-lib.zyre_peer_header_value.argtypes = [zyre_p, c_char_p, c_char_p]
-lib.zyre_require_peer.restype = c_int
-lib.zyre_require_peer.argtypes = [zyre_p, c_char_p, c_char_p, c_char_p]
-lib.zyre_socket.restype = czmq.zsock_p
-lib.zyre_socket.argtypes = [zyre_p]
-lib.zyre_print.restype = None
-lib.zyre_print.argtypes = [zyre_p]
-lib.zyre_version.restype = c_long
-lib.zyre_version.argtypes = []
-lib.zyre_test.restype = None
-lib.zyre_test.argtypes = [c_bool]
+lib.prototype('zyre_new', zyre_p, [c_char_p])
+lib.prototype('zyre_destroy', None, [POINTER(zyre_p)])
+lib.prototype('zyre_uuid', c_char_p, [zyre_p])
+lib.prototype('zyre_name', c_char_p, [zyre_p])
+lib.prototype('zyre_set_name', None, [zyre_p, c_char_p])
+lib.prototype('zyre_set_header', None, [zyre_p, c_char_p, c_char_p])
+lib.prototype('zyre_set_verbose', None, [zyre_p])
+lib.prototype('zyre_set_port', None, [zyre_p, c_int])
+lib.prototype('zyre_set_beacon_peer_port', None, [zyre_p, c_int])
+lib.prototype('zyre_set_evasive_timeout', None, [zyre_p, c_int])
+lib.prototype('zyre_set_expired_timeout', None, [zyre_p, c_int])
+lib.prototype('zyre_set_interval', None, [zyre_p, c_size_t])
+lib.prototype('zyre_set_interface', None, [zyre_p, c_char_p])
+lib.prototype('zyre_set_endpoint', c_int, [zyre_p, c_char_p])
+lib.prototype('zyre_set_contest_in_group', None, [zyre_p, c_char_p])
+lib.prototype('zyre_set_advertised_endpoint', None, [zyre_p, c_char_p])
+lib.prototype('zyre_set_zcert', None, [zyre_p, czmq.zcert_p])
+lib.prototype('zyre_set_zap_domain', None, [zyre_p, c_char_p])
+lib.prototype('zyre_gossip_bind', None, [zyre_p, c_char_p])
+lib.prototype('zyre_gossip_connect', None, [zyre_p, c_char_p])
+lib.prototype('zyre_gossip_connect_curve', None, [zyre_p, c_char_p, c_char_p])
+lib.prototype('zyre_gossip_unpublish', None, [zyre_p, c_char_p])
+lib.prototype('zyre_start', c_int, [zyre_p])
+lib.prototype('zyre_stop', None, [zyre_p])
+lib.prototype('zyre_join', c_int, [zyre_p, c_char_p])
+lib.prototype('zyre_leave', c_int, [zyre_p, c_char_p])
+lib.prototype('zyre_recv', czmq.zmsg_p, [zyre_p])
+lib.prototype('zyre_whisper', c_int, [zyre_p, c_char_p, POINTER(czmq.zmsg_p)])
+lib.prototype('zyre_shout', c_int, [zyre_p, c_char_p, POINTER(czmq.zmsg_p)])
+lib.prototype('zyre_whispers', c_int, [zyre_p, c_char_p, c_char_p])
+lib.prototype('zyre_shouts', c_int, [zyre_p, c_char_p, c_char_p])
+lib.prototype('zyre_peers', czmq.zlist_p, [zyre_p])
+lib.prototype('zyre_peers_by_group', czmq.zlist_p, [zyre_p, c_char_p])
+lib.prototype('zyre_own_groups', czmq.zlist_p, [zyre_p])
+lib.prototype('zyre_peer_groups', czmq.zlist_p, [zyre_p])
+lib.prototype('zyre_peer_address', POINTER(c_char), [zyre_p, c_char_p])
+lib.prototype('zyre_peer_header_value', POINTER(c_char), [zyre_p, c_char_p, c_char_p])
+lib.prototype('zyre_require_peer', c_int, [zyre_p, c_char_p, c_char_p, c_char_p])
+lib.prototype('zyre_socket', czmq.zsock_p, [zyre_p])
+lib.prototype('zyre_print', None, [zyre_p])
+lib.prototype('zyre_version', c_long, [])
+lib.prototype('zyre_test', None, [c_bool])
 
 class Zyre(object):
     """
@@ -494,32 +434,19 @@ major * 10000 + minor * 100 + patch, as a single integer.
 
 
 # zyre event
-lib.zyre_event_new.restype = zyre_event_p
-lib.zyre_event_new.argtypes = [zyre_p]
-lib.zyre_event_destroy.restype = None
-lib.zyre_event_destroy.argtypes = [POINTER(zyre_event_p)]
-lib.zyre_event_type.restype = c_char_p
-lib.zyre_event_type.argtypes = [zyre_event_p]
-lib.zyre_event_peer_uuid.restype = c_char_p
-lib.zyre_event_peer_uuid.argtypes = [zyre_event_p]
-lib.zyre_event_peer_name.restype = c_char_p
-lib.zyre_event_peer_name.argtypes = [zyre_event_p]
-lib.zyre_event_peer_addr.restype = c_char_p
-lib.zyre_event_peer_addr.argtypes = [zyre_event_p]
-lib.zyre_event_headers.restype = czmq.zhash_p
-lib.zyre_event_headers.argtypes = [zyre_event_p]
-lib.zyre_event_header.restype = c_char_p
-lib.zyre_event_header.argtypes = [zyre_event_p, c_char_p]
-lib.zyre_event_group.restype = c_char_p
-lib.zyre_event_group.argtypes = [zyre_event_p]
-lib.zyre_event_msg.restype = czmq.zmsg_p
-lib.zyre_event_msg.argtypes = [zyre_event_p]
-lib.zyre_event_get_msg.restype = czmq.zmsg_p
-lib.zyre_event_get_msg.argtypes = [zyre_event_p]
-lib.zyre_event_print.restype = None
-lib.zyre_event_print.argtypes = [zyre_event_p]
-lib.zyre_event_test.restype = None
-lib.zyre_event_test.argtypes = [c_bool]
+lib.prototype('zyre_event_new', zyre_event_p, [zyre_p])
+lib.prototype('zyre_event_destroy', None, [POINTER(zyre_event_p)])
+lib.prototype('zyre_event_type', c_char_p, [zyre_event_p])
+lib.prototype('zyre_event_peer_uuid', c_char_p, [zyre_event_p])
+lib.prototype('zyre_event_peer_name', c_char_p, [zyre_event_p])
+lib.prototype('zyre_event_peer_addr', c_char_p, [zyre_event_p])
+lib.prototype('zyre_event_headers', czmq.zhash_p, [zyre_event_p])
+lib.prototype('zyre_event_header', c_char_p, [zyre_event_p, c_char_p])
+lib.prototype('zyre_event_group', c_char_p, [zyre_event_p])
+lib.prototype('zyre_event_msg', czmq.zmsg_p, [zyre_event_p])
+lib.prototype('zyre_event_get_msg', czmq.zmsg_p, [zyre_event_p])
+lib.prototype('zyre_event_print', None, [zyre_event_p])
+lib.prototype('zyre_event_test', None, [c_bool])
 
 class ZyreEvent(object):
     """